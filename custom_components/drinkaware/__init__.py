@@ -3,13 +3,16 @@ Drinkaware integration for Home Assistant.
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 import re
 
-from homeassistant.core import HomeAssistant
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession, async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -22,18 +25,38 @@ from .const import (
     ENDPOINT_GOALS,
     ENDPOINT_SUMMARY,
     ENDPOINT_DRINKS_GENERIC,
+    CONF_TRACE_REQUESTS,
+    CONF_SLOW_REFRESH_SECONDS,
 )
+from .drink_constants import DRINK_TYPES
 from .services import async_setup_services, async_unload_services
+from .statistics import DrinkAwareStatistics
+from .history import DrinkAwareHistory, extract_drinks, rows_to_activity
+from .backfill import DrinkAwareBackfill
+from .custom_drinks import CustomDrinkSync
+from .analytics import DrinkAwareAnalytics
+from .catalog import DrinkCatalog, GenericDrinks, async_get_shared_standard_drinks
+from .compatibility import learn_compatibility
+from .scheduler import async_get_scheduler
+from .orchestrator import async_get_orchestrator
+from .breaker import CircuitOpenError, async_get_breaker
+from .coalesce import RequestCoalescer
+from .metrics import STATUS_CLIENT_ERROR, STATUS_TIMEOUT, RequestMetrics
+from .tracing import RequestTracer
+from .profiler import RefreshProfiler
+from .models import Assessment, Goal, Stats, data_to_api, parse_data, parse_days, parse_search_drinks
+from .websocket import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor", "button"]
+PLATFORMS = ["sensor", "binary_sensor", "button", "calendar"]
 
 
 async def async_setup(hass: HomeAssistant, config):
     """Set up the Drinkaware component."""
     # Just to initialize the domain in hass.data
     hass.data.setdefault(DOMAIN, {})
+    async_setup_websocket(hass)
     return True
 
 
@@ -44,50 +67,69 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     account_name = entry.data.get("account_name", "Default")
     email = entry.data.get("email", "unknown_user")
 
-    # Create session
-    session = async_get_clientsession(hass)
+    # Create session, with its own connection pool when tracing so other integrations' requests aren't traced
+    tracer = None
+    if entry.options.get(CONF_TRACE_REQUESTS):
+        tracer = RequestTracer()
+        # Home Assistant detaches this session when it stops, so it is not closed on unload
+        session = async_create_clientsession(hass, trace_configs=[tracer.trace_config()])
+    else:
+        session = async_get_clientsession(hass)
 
     # Create coordinator
     coordinator = DrinkAwareDataUpdateCoordinator(
-        hass, session, token_data, entry.entry_id, account_name, email
+        hass, session, token_data, entry.entry_id, account_name, email, tracer=tracer
     )
+    coordinator.profiler.slow_threshold = entry.options.get(CONF_SLOW_REFRESH_SECONDS) or None
 
     # Store coordinator in hass.data first so it's available for service schema providers
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Time each setup phase, as (phase, finished at) pairs
+    phases = [("start", time.monotonic())]
 
-    # Ensure we fetch drinks data for service dropdown menus
-    if coordinator.drinks_cache is None:
-        try:
-            coordinator.drinks_cache = await coordinator._fetch_available_drinks()
-
-            # Also fetch search results to get custom drinks
-            custom_drinks = await coordinator._fetch_search_drinks()
-            if custom_drinks and "results" in custom_drinks:
-                if "customDrinks" not in coordinator.drinks_cache:
-                    coordinator.drinks_cache["customDrinks"] = []
+    # Start from the local store if it is recent enough, otherwise fetch everything
+    snapshot = await coordinator.history.async_load()
+    entry.async_on_unload(coordinator.history.async_close)
+    await coordinator.async_load_analytics()
+    coordinator.async_learn_polling()
+    phases.append(("history", time.monotonic()))
+    if not await coordinator.async_restore_snapshot(snapshot):
+        await coordinator.async_config_entry_first_refresh()
+    phases.append(("first refresh", time.monotonic()))
 
-                # Add relevant search results to cache
-                for drink in custom_drinks["results"]:
-                    if "derivedDrinkId" in drink:
-                        coordinator.drinks_cache["customDrinks"].append(drink)
-
-            _LOGGER.info("Successfully fetched available drinks for service dropdowns")
-        except Exception as err:
-            _LOGGER.warning("Error pre-fetching drinks data: %s", err)
+    # Drinks for the service dropdowns are not needed by sensors, so fetch them in the background
+    if coordinator.catalog is None:
+        coordinator.async_schedule_catalog_update()
 
     # Set up platforms - Using async_forward_entry_setups
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    phases.append(("platforms", time.monotonic()))
 
     # Set up services
     await async_setup_services(hass)
+    phases.append(("services", time.monotonic()))
+
+    _LOGGER.debug(
+        "Set up Drinkaware account %s in %.2fs (%s)",
+        account_name,
+        phases[-1][1] - phases[0][1],
+        ", ".join(
+            f"{phase} {finished - started:.2f}s"
+            for (_, started), (phase, finished) in zip(phases, phases[1:])
+        ),
+    )
 
     # Set up entry refresh listener for token
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    # Backfill older history in the background, resuming after each update if interrupted
+    coordinator.backfill.async_start(entry)
+    entry.async_on_unload(
+        coordinator.async_add_listener(lambda: coordinator.backfill.async_start(entry))
+    )
+
     return True
 
 
@@ -98,6 +140,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+    # Spread the remaining accounts over the freed slot
+    async_get_scheduler(hass).async_remove_entry(entry.entry_id)
+    async_get_orchestrator(hass).async_remove_entry(entry.entry_id)
+
     # Check if this is the last entry being removed
     remaining_entries = [e for e in hass.data[DOMAIN] if e != "account_name_map"]
     if not remaining_entries:
@@ -106,6 +152,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove locally stored data when a config entry is deleted."""
+    await DrinkAwareHistory(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass, entry):
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -114,7 +165,7 @@ async def update_listener(hass, entry):
 class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Drinkaware data."""
 
-    def __init__(self, hass, session, token_data, entry_id, account_name, email):
+    def __init__(self, hass, session, token_data, entry_id, account_name, email, tracer=None):
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -132,126 +183,357 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
         self.email = email
         self._rate_limited = False
         self._activity_cache = {}  # Cache for detailed activity data
-        self.drinks_cache = None   # Cache for available drinks
+        self.catalog = None  # Indexed standard and custom drinks
         self._last_drinks_refresh = datetime.now()  # Track when we last refreshed drinks
+        self._background_tasks = {}  # Task name -> running background fetch
+        self._stale_activity_days = set()  # Earlier days whose drinks need fetching again
+        self.scheduler = async_get_scheduler(hass)
+        self.scheduler.async_add_entry(entry_id)
+        self.polling = self.scheduler.polling(entry_id)  # Adaptive interval for this account
+        self.orchestrator = async_get_orchestrator(hass)
+        self.breaker = async_get_breaker(hass, API_BASE_URL)
+        self.login_breaker = async_get_breaker(hass, OAUTH_TOKEN_URL)
+        self.coalescer = RequestCoalescer()  # Shares identical GETs that overlap
+        self.request_metrics = RequestMetrics()  # Per-endpoint counts, statuses and latencies
+        self.tracer = tracer  # Recent request timings, only when tracing is enabled
+        self.profiler = RefreshProfiler(account_name)  # Per-phase timings of recent refreshes
+        self.statistics = DrinkAwareStatistics(hass, entry_id, account_name)
+        self.history = DrinkAwareHistory(hass, entry_id)
+        self.backfill = DrinkAwareBackfill(self, self.history)
+        self.custom_drink_sync = CustomDrinkSync(self)
+        self.analytics = DrinkAwareAnalytics(self._resolve_drink_type)
+        self.suppressed_writes = 0  # Sensor state writes skipped because nothing changed
+        self.history.async_add_activity_listener(self.analytics.async_apply_day)
 
     async def _fetch_and_update_assessment(self, data):
         """Fetch and update self assessment data."""
         assessment = await self._fetch_self_assessment()
         if assessment and "assessments" in assessment and assessment["assessments"]:
-            data["assessment"] = assessment["assessments"][0]
+            data["assessment"] = Assessment.from_api(assessment["assessments"][0])
         return data
 
     async def _fetch_and_update_stats(self, data):
         """Fetch and update tracking stats."""
         stats = await self._fetch_stats()
         if stats:
-            data["stats"] = stats
+            data["stats"] = Stats.from_api(stats)
         return data
 
     async def _fetch_and_update_goals(self, data):
         """Fetch and update goals data."""
         goals = await self._fetch_goals()
         if goals and "goals" in goals:
-            data["goals"] = goals["goals"]
+            data["goals"] = tuple(Goal.from_api(goal) for goal in goals["goals"])
         return data
 
     async def _fetch_and_update_summary(self, data):
         """Fetch and update summary data including daily activity if needed."""
         summary = await self._fetch_summary()
         if summary and "activitySummaryDays" in summary:
-            data["summary"] = summary["activitySummaryDays"]
+            changed = await self.history.async_merge_days(summary["activitySummaryDays"])
+            data["summary"] = parse_days(summary["activitySummaryDays"])
 
             # Fetch detailed activity for today to support the Drinks Today sensor
             today = datetime.now().strftime("%Y-%m-%d")
 
             for day in data["summary"]:
-                if day.get("date") == today and day.get("drinks", 0) > 0:
-                    # If today has drinks, fetch detailed information
-                    today_activity = await self._fetch_activity_for_day(today)
-                    if today_activity:
-                        self._activity_cache[today] = today_activity
+                if day.date == today and day.drinks > 0:
+                    # If today has drinks, fetch detailed information without holding up the update
+                    self._async_start_background_task("activity", self._async_update_today_activity(today))
                     break
+
+            self._async_refresh_changed_activity(changed, today)
         return data
 
-    async def _update_drinks_cache_if_needed(self):
-        """Update drinks cache if needed."""
+    @callback
+    def _async_refresh_changed_activity(self, changed, today):
+        """Refetch the drinks for earlier days in the breakdown windows whose totals changed."""
+        longest = max(self.analytics.windows.values())
+        start = (datetime.now() - timedelta(days=longest - 1)).strftime("%Y-%m-%d")
+        self._stale_activity_days.update(day["date"] for day in changed if start <= day["date"] < today)
+        if self._stale_activity_days:
+            # A fetch that is already running picks up the new days before it finishes
+            self._async_start_background_task("past_activity", self._async_update_stale_activity())
+
+    @callback
+    def _async_start_background_task(self, name, target):
+        """Run a fetch in the background unless one with the same name is still running."""
+        task = self._background_tasks.get(name)
+        if task is not None and not task.done():
+            target.close()
+            return task
+
+        task_name = f"drinkaware {name} {self.account_name}"
+        if self.config_entry is not None:
+            # Cancelled automatically when the entry is unloaded
+            task = self.config_entry.async_create_background_task(self.hass, target, task_name)
+        else:
+            task = self.hass.async_create_background_task(target, task_name)
+        self._background_tasks[name] = task
+        return task
+
+    async def _async_update_today_activity(self, today):
+        """Fetch today's drinks and update the sensors that show them."""
+        with self.profiler.phase("activity"):
+            today_activity = await self._fetch_activity_for_day(today)
+            if today_activity:
+                self._activity_cache[today] = today_activity
+                await self.history.async_set_activity(today, extract_drinks(today_activity))
+                self.async_update_listeners()
+
+    async def _async_update_stale_activity(self):
+        """Fetch the drinks for earlier days until none are left, so the unit breakdowns follow edits."""
+        while self._stale_activity_days:
+            date_str = max(self._stale_activity_days)
+            try:
+                activity = await self._fetch_activity_for_day(date_str)
+            except Exception as err:
+                # The days are kept and fetched again after the next summary
+                _LOGGER.debug("Error fetching activity for %s on %s: %s", self.account_name, date_str, err)
+                return
+            if activity is None:
+                return
+            self._stale_activity_days.discard(date_str)
+            await self.history.async_set_activity(date_str, extract_drinks(activity))
+        self.async_update_listeners()
+
+    def _catalog_update_due(self):
+        """Return True if the drinks catalog is missing or older than six hours."""
         time_since_refresh = (datetime.now() - self._last_drinks_refresh).total_seconds() / 3600
-        if self.drinks_cache is None or time_since_refresh > 6:  # Refresh every 6 hours
-            # First get generic drinks
-            drinks = await self._fetch_available_drinks()
-            if drinks:
-                self.drinks_cache = drinks
-
-            # Now get custom drinks through search
-            custom_drinks = await self._fetch_search_drinks()
-            if custom_drinks and "results" in custom_drinks:
-                if "customDrinks" not in self.drinks_cache:
-                    self.drinks_cache["customDrinks"] = []
-
-                # Add relevant search results to cache
-                for drink in custom_drinks["results"]:
-                    if "derivedDrinkId" in drink:
-                        # Only add if not already in the cache
-                        drink_id = drink.get("drinkId")
-                        existing_ids = [d.get("drinkId") for d in self.drinks_cache.get("customDrinks", [])]
-                        if drink_id and drink_id not in existing_ids:
-                            self.drinks_cache["customDrinks"].append(drink)
+        return self.catalog is None or time_since_refresh > 6
+
+    @callback
+    def async_schedule_catalog_update(self):
+        """Refresh the drinks catalog in the background if it is due."""
+        if self._catalog_update_due():
+            self._async_start_background_task("catalog", self._async_update_catalog())
+
+    async def _async_update_catalog(self):
+        """Refresh the drinks catalog, logging rather than raising failures."""
+        started = time.monotonic()
+        try:
+            with self.profiler.phase("catalog"):
+                await self._update_catalog_if_needed()
+        except Exception as err:
+            _LOGGER.warning("Error fetching drinks data for %s: %s", self.account_name, err)
+            return
+        _LOGGER.debug(
+            "Fetched available drinks for %s in %.2fs", self.account_name, time.monotonic() - started
+        )
+        self.async_schedule_custom_drink_sync()
+
+    @callback
+    def async_schedule_custom_drink_sync(self):
+        """Sync all custom drinks in the background if it is due."""
+        if self.custom_drink_sync.due:
+            self._async_start_background_task("custom_drinks", self._async_sync_custom_drinks())
+
+    async def _async_sync_custom_drinks(self):
+        """Sync all custom drinks, logging rather than raising failures."""
+        try:
+            with self.profiler.phase("custom_drinks"):
+                await self.custom_drink_sync.async_sync()
+        except CircuitOpenError as err:
+            _LOGGER.debug("Stopped syncing custom drinks for %s: %s", self.account_name, err)
+        except Exception as err:
+            _LOGGER.warning("Error syncing custom drinks for %s: %s", self.account_name, err)
+
+    async def _update_catalog_if_needed(self):
+        """Rebuild the drinks catalog if needed."""
+        if self._catalog_update_due():
+            # Standard drinks are the same for every account, so they are fetched once for all of them
+            shared = async_get_shared_standard_drinks(self.hass)
+            generic_custom = []
+
+            async def fetch_standard():
+                # The response also lists this account's custom drinks, which are kept for this account only
+                generic = await self._fetch_available_drinks()
+                if generic is None:
+                    return None
+                generic_custom.extend(generic.custom_drinks)
+                return generic.standard
+
+            standard = await shared.async_get(fetch_standard)
+            if standard is None:
+                if self.catalog is None:
+                    # Without standard drinks there is nothing to build, so try again on the next update
+                    _LOGGER.warning("Could not fetch drinks for %s, will retry", self.account_name)
+                    return
+                standard = self.catalog.standard
+
+            # Now get this account's recent custom drinks through search, keeping those synced before
+            recent = await self._fetch_search_drinks()
+            known = self.catalog.custom_drinks if self.catalog is not None else ()
+            self.catalog = DrinkCatalog(
+                custom_drinks=known + tuple(generic_custom) + (recent or ()), standard=standard
+            )
+            learn_compatibility(self.catalog)
 
             # Store timestamp of this refresh
             self._last_drinks_refresh = datetime.now()
-            _LOGGER.debug("Refreshed drinks cache for %s", self.account_name)
+            _LOGGER.debug("Refreshed drinks catalog for %s (%s drinks)", self.account_name, len(self.catalog))
 
     async def _async_update_data(self):
+        """Fetch data from Drinkaware API, timing each phase."""
+        with self.profiler.refresh():
+            return await self._async_fetch_data()
+
+    async def _async_pause_if_rate_limited(self):
+        """Wait briefly between requests if the API rate limited us recently."""
+        if self._rate_limited:
+            with self.profiler.phase("sleep"):
+                await asyncio.sleep(0.5)
+
+    async def _async_fetch_data(self):
         """Fetch data from Drinkaware API."""
+        # The next refresh is scheduled from this delay once the update finishes
+        self._async_align_to_schedule()
+
+        # While the API is down keep the last data rather than waiting on timeouts
+        if self.breaker.is_open:
+            _LOGGER.debug(
+                "Drinkaware API unavailable for %.0f more seconds, keeping data for %s",
+                self.breaker.retry_in,
+                self.account_name,
+            )
+            return self.data or {}
+
         # Check if token needs refreshing
         if datetime.now() >= self.token_expiry and self.refresh_token:
-            await self._refresh_token()
+            with self.profiler.phase("token"):
+                await self._refresh_token()
 
         try:
             data = {}
 
             # Get self assessment data
-            data = await self._fetch_and_update_assessment(data)
+            with self.profiler.phase("assessment"):
+                data = await self._fetch_and_update_assessment(data)
 
             # Only delay if we previously encountered rate limiting
-            if self._rate_limited:
-                await asyncio.sleep(0.5)
+            await self._async_pause_if_rate_limited()
 
             # Get tracking stats
-            data = await self._fetch_and_update_stats(data)
+            with self.profiler.phase("stats"):
+                data = await self._fetch_and_update_stats(data)
 
             # Only delay if we previously encountered rate limiting
-            if self._rate_limited:
-                await asyncio.sleep(0.5)
+            await self._async_pause_if_rate_limited()
 
             # Get active goals
-            data = await self._fetch_and_update_goals(data)
+            with self.profiler.phase("goals"):
+                data = await self._fetch_and_update_goals(data)
 
             # Only delay if we previously encountered rate limiting
-            if self._rate_limited:
-                await asyncio.sleep(0.5)
+            await self._async_pause_if_rate_limited()
 
             # Get recent drink summary
-            data = await self._fetch_and_update_summary(data)
+            with self.profiler.phase("summary"):
+                data = await self._fetch_and_update_summary(data)
+
+            # Speed up or back off depending on whether the summary changed
+            if "summary" in data:
+                if self.polling.async_record_poll(data["summary"]):
+                    await self.history.async_save_activity_hours(self.polling.activity_hours)
+                self._async_align_to_schedule()
+
+            # Import changed days into long-term statistics
+            with self.profiler.phase("statistics"):
+                self._import_statistics(data)
 
             # Fetch available drinks if not already cached or refresh occasionally
-            await self._update_drinks_cache_if_needed()
+            self.async_schedule_catalog_update()
+            self.async_schedule_custom_drink_sync()
+
+            # Keep a local copy so a restart can skip the initial fetch
+            if data:
+                with self.profiler.phase("snapshot"):
+                    await self.history.async_save_snapshot(data_to_api(data))
 
             # Reset rate limit flag if successful
             self._rate_limited = False
             return data
 
+        except CircuitOpenError as err:
+            _LOGGER.debug("Stopped refreshing %s: %s", self.account_name, err)
+            return self.data or {}
         except Exception as err:
             _LOGGER.error("Error fetching data from Drinkaware: %s", err)
             # If we get an auth error, try to refresh token
             if "401" in str(err) and self.refresh_token:
-                await self._refresh_token()
+                with self.profiler.phase("token"):
+                    await self._refresh_token()
                 # Retry the update after token refresh, but with a delay to prevent rate limiting
-                await asyncio.sleep(1)
+                with self.profiler.phase("sleep"):
+                    await asyncio.sleep(1)
                 return await self._async_update_data()
             return {}
 
+    def _resolve_drink_type(self, drink_id):
+        """Return the drink type group for a standard or custom drink."""
+        if drink_id in DRINK_TYPES:
+            return DRINK_TYPES[drink_id]
+
+        # Custom drinks are grouped with the standard drink they derive from
+        if self.catalog is not None:
+            return DRINK_TYPES.get(self.catalog.derived_drink_id(drink_id))
+        return None
+
+    async def async_load_analytics(self):
+        """Seed the unit breakdowns from the activity in the local store."""
+        longest = max(self.analytics.windows.values())
+        start = (datetime.now() - timedelta(days=longest - 1)).strftime("%Y-%m-%d")
+        rows = await self.history.async_get_activity(start)
+        self.analytics.async_apply_rows(rows)
+
+    async def async_restore_snapshot(self, snapshot):
+        """Restore coordinator data from the local store, returning False if it is too old."""
+        if not snapshot or not snapshot.get("data"):
+            return False
+
+        try:
+            saved = datetime.fromisoformat(snapshot["saved"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if datetime.now() - saved > self.scheduler.interval:
+            return False
+
+        today = datetime.now()
+        data = parse_data(snapshot["data"])
+        data["summary"] = parse_days(self.history.async_get_days(
+            (today - timedelta(days=14)).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+        ))
+
+        today_str = today.strftime("%Y-%m-%d")
+        today_rows = await self.history.async_get_activity(today_str, today_str)
+        if today_rows:
+            self._activity_cache[today_str] = rows_to_activity(today_rows)
+
+        _LOGGER.debug("Restored %s data from the local store saved at %s", self.account_name, saved)
+        self._async_align_to_schedule()
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def async_learn_polling(self):
+        """Learn this account's busy hours and days from the local history."""
+        self.polling.async_learn(self.history.activity_hours, self.history.days)
+
+    @callback
+    def _async_align_to_schedule(self):
+        """Set the delay before the next refresh so it lands in this account's slot."""
+        self.update_interval = self.scheduler.async_delay_until_next_poll(self.entry_id)
+
+    def _import_statistics(self, data):
+        """Import the daily summary into long-term statistics."""
+        if "summary" not in data:
+            return
+
+        try:
+            self.statistics.async_import_days(data["summary"])
+        except Exception as err:
+            _LOGGER.warning("Error importing statistics for %s: %s", self.account_name, err)
+
     async def _refresh_token(self):
         """Refresh the OAuth token."""
         try:
@@ -270,10 +552,21 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
                 "User-Agent": "Home Assistant Drinkaware Integration/1.0"
             }
 
+            # Don't keep posting to the login service while it is down
+            if not self.login_breaker.async_allow_request():
+                _LOGGER.debug("Skipping token refresh, %s", CircuitOpenError(self.login_breaker))
+                return
+
             _LOGGER.debug("Refreshing token with URL: %s", OAUTH_TOKEN_URL)
 
             async with self.session.post(OAUTH_TOKEN_URL, data=data, headers=headers) as resp:
+                if resp.status >= 500:
+                    self.login_breaker.async_record_failure()
+                else:
+                    self.login_breaker.async_record_success()
+
                 if resp.status != 200:
+                    self.request_metrics.async_record_token_refresh(success=False)
                     text = await resp.text()
                     _LOGGER.error("Token refresh failed: %s", text)
                     # If refresh token is invalid, we might need to trigger reauth
@@ -281,8 +574,9 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
                         _LOGGER.warning("Invalid refresh token. User may need to re-authenticate.")
                     return
 
-                token_data = await resp.json()
+                token_data = await resp.json(loads=json_loads)
                 _LOGGER.debug("Token refresh response received")
+                self.request_metrics.async_record_token_refresh(success=True)
 
                 self.token_data = token_data
                 self.access_token = token_data["access_token"]
@@ -305,6 +599,10 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
 
                 _LOGGER.debug("Successfully refreshed OAuth token")
 
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            self.request_metrics.async_record_token_refresh(success=False)
+            self.login_breaker.async_record_failure()
+            _LOGGER.error("Error refreshing OAuth token: %s", err)
         except Exception as err:
             _LOGGER.error("Error refreshing OAuth token: %s", err)
 
@@ -339,7 +637,11 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
         today = datetime.now()
         two_weeks_ago = today - timedelta(days=14)
 
-        url = f"{API_BASE_URL}{ENDPOINT_SUMMARY}/{today.strftime('%Y-%m-%d')}/{two_weeks_ago.strftime('%Y-%m-%d')}"
+        return await self._fetch_summary_range(two_weeks_ago, today)
+
+    async def _fetch_summary_range(self, start, end):
+        """Fetch the activity summary between two dates (inclusive) from Drinkaware API."""
+        url = f"{API_BASE_URL}{ENDPOINT_SUMMARY}/{end.strftime('%Y-%m-%d')}/{start.strftime('%Y-%m-%d')}"
         params = {
             "aggregation": "weekly"
         }
@@ -352,67 +654,106 @@ class DrinkAwareDataUpdateCoordinator(DataUpdateCoordinator):
         return await self._make_api_request(url)
 
     async def _fetch_available_drinks(self):
-        """Fetch available drinks from Drinkaware API."""
+        """Fetch available drinks from Drinkaware API, parsed into GenericDrinks."""
         url = f"{API_BASE_URL}{ENDPOINT_DRINKS_GENERIC}"
-        return await self._make_api_request(url)
+        return await self._make_api_request(url, parse=GenericDrinks)
 
-    async def _fetch_search_drinks(self):
-        """Fetch custom drinks from search API."""
+    async def _fetch_search_drinks(self, page=1, per_page=15):
+        """Fetch a page of custom drinks from search API, parsed into Drink models."""
         url = f"{API_BASE_URL}/drinks/v1/search"
         params = {
-            "page": 1,
-            "resultsPerPage": 15,
+            "page": page,
+            "resultsPerPage": per_page,
             "query": ""  # Empty query returns recently used drinks
         }
-        return await self._make_api_request(url, params)
+        return await self._make_api_request(url, params, parse=parse_search_drinks)
+
+    async def _make_api_request(self, url, params=None, parse=None):
+        """Make authenticated request to Drinkaware API, sharing identical requests in flight.
 
-    async def _make_api_request(self, url, params=None):
-        """Make authenticated request to Drinkaware API."""
+        parse, if given, turns the decoded JSON into what is returned, so large
+        responses are reduced to the fields used before anything keeps them.
+        """
+        key = (url, tuple(sorted((params or {}).items())), self.access_token, parse)
+        return await self.coalescer.async_request(key, lambda: self._async_get(url, params, parse))
+
+    async def _async_get(self, url, params=None, parse=None):
+        """Make a single authenticated GET request to the Drinkaware API."""
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/json",
             "User-Agent": "Home Assistant Drinkaware Integration/1.0"
         }
 
-        try:
-            async with self.session.get(url, params=params, headers=headers) as resp:
-                if resp.status == 401:
-                    # Token expired
-                    _LOGGER.debug("API request returned 401, token may have expired")
-                    raise Exception("401 Unauthorized - Token expired")
-
-                if resp.status == 429:
-                    # Rate limit exceeded
-                    text = await resp.text()
-                    _LOGGER.warning("Rate limit exceeded: %s", text)
-
-                    # Mark that we've been rate limited for future requests
-                    self._rate_limited = True
-
-                    # Extract retry-after time (the API suggests how many seconds to wait)
-                    retry_after = 1  # Default to 1 second
-                    try:
-                        # Try to parse from the error message
-                        match = re.search(r'Try again in (\d+) seconds', text)
-                        if match:
-                            retry_after = int(match.group(1))
-                    except Exception:
-                        pass
-
-                    # Wait for the suggested time and then retry
-                    _LOGGER.info("Waiting %s seconds before retrying...", retry_after)
-                    await asyncio.sleep(retry_after)
-                    return await self._make_api_request(url, params)
+        if not self.breaker.async_allow_request():
+            raise CircuitOpenError(self.breaker)
 
-                if resp.status != 200:
-                    text = await resp.text()
-                    _LOGGER.error("API request failed: %s - %s", resp.status, text)
-                    return None
+        retry_after = None
+        try:
+            async with self.orchestrator.slot(self.entry_id):
+                started = time.monotonic()  # Time the request itself, not the wait for a slot
+                async with self.session.get(url, params=params, headers=headers) as resp:
+                    body = await resp.read()
+                    self.request_metrics.async_record_response(
+                        url, resp.status, time.monotonic() - started, len(body)
+                    )
 
-                return await resp.json()
+                    # Any response short of a server error shows the API is up
+                    if resp.status >= 500:
+                        self.breaker.async_record_failure()
+                    else:
+                        self.breaker.async_record_success()
+
+                    if resp.status == 401:
+                        # Token expired
+                        _LOGGER.debug("API request returned 401, token may have expired")
+                        raise Exception("401 Unauthorized - Token expired")
+
+                    if resp.status == 429:
+                        # Rate limit exceeded
+                        text = await resp.text()
+                        _LOGGER.warning("Rate limit exceeded: %s", text)
+
+                        # Mark that we've been rate limited for future requests
+                        self._rate_limited = True
+
+                        # Extract retry-after time (the API suggests how many seconds to wait)
+                        retry_after = 1  # Default to 1 second
+                        try:
+                            # Try to parse from the error message
+                            match = re.search(r'Try again in (\d+) seconds', text)
+                            if match:
+                                retry_after = int(match.group(1))
+                        except Exception:
+                            pass
+
+                        _LOGGER.info("Waiting %s seconds before retrying...", retry_after)
+                        self.request_metrics.async_record_retry(url, retry_after)
+                    elif resp.status != 200:
+                        text = await resp.text()
+                        _LOGGER.error("API request failed: %s - %s", resp.status, text)
+                        return None
+                    else:
+                        # The body is already read, so decode it with the fast loader rather than resp.json()
+                        payload = json_loads(body)
+                        return parse(payload) if parse else payload
         except asyncio.TimeoutError:
+            self.request_metrics.async_record_error(url, STATUS_TIMEOUT)
+            self.breaker.async_record_failure()
             _LOGGER.error("Request to %s timed out", url)
             return None
+        except CircuitOpenError:
+            raise
+        except aiohttp.ClientError as err:
+            self.request_metrics.async_record_error(url, STATUS_CLIENT_ERROR)
+            self.breaker.async_record_failure()
+            _LOGGER.error("Error in API request to %s: %s", url, err)
+            raise
         except Exception as err:
             _LOGGER.error("Error in API request to %s: %s", url, err)
             raise
+
+        # Rate limited: wait for the suggested time outside the slot, so other accounts can use it, then retry
+        with self.profiler.phase("sleep"):
+            await asyncio.sleep(retry_after)
+        return await self._async_get(url, params, parse)
@@ -0,0 +1,141 @@
+"""
+Unit breakdown analytics for the Drinkaware integration.
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from homeassistant.core import callback
+
+from .const import BREAKDOWN_WINDOWS
+from .drink_constants import MEASURE_VOLUMES_ML, DRINK_TYPE_OTHER
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_DRINK_TYPE = "drink_type"
+GROUP_MEASURE = "measure"
+
+
+def calculate_units(row):
+    """Return the units for a stored activity row."""
+    if row.get("units") is not None:
+        return float(row["units"])
+
+    volume_ml = MEASURE_VOLUMES_ML.get(row.get("measure_id"))
+    if volume_ml is None or not row.get("abv"):
+        return 0.0
+    return (row.get("quantity") or 0) * volume_ml * row["abv"] / 1000
+
+
+class DrinkAwareAnalytics:
+    """Running per-drink-type and per-measure unit totals over rolling windows.
+
+    Totals are adjusted by the difference whenever a day's drinks change, and
+    days are subtracted as they fall out of a window, so nothing is rescanned.
+    """
+
+    def __init__(self, resolve_drink_type, windows=None):
+        """Initialize the analytics."""
+        self._resolve_drink_type = resolve_drink_type
+        self.windows = windows or BREAKDOWN_WINDOWS
+        self._longest = max(self.windows.values())
+        self._days = {}  # date string -> {(drink type, measure id): units}
+        self._totals = {
+            window: {GROUP_DRINK_TYPE: defaultdict(float), GROUP_MEASURE: defaultdict(float)}
+            for window in self.windows
+        }
+        self._today = None
+
+    def _window_start(self, window, today=None):
+        """Return the first date string included in a window."""
+        today = today or self._today
+        return (today - timedelta(days=self.windows[window] - 1)).strftime("%Y-%m-%d")
+
+    def _apply(self, window, contributions, sign):
+        """Add or subtract a day's contributions from a window's totals."""
+        totals = self._totals[window]
+        for (drink_type, measure_id), units in contributions.items():
+            for group, key in ((GROUP_DRINK_TYPE, drink_type), (GROUP_MEASURE, measure_id)):
+                totals[group][key] += sign * units
+                if abs(totals[group][key]) < 1e-9:
+                    del totals[group][key]
+
+    def _contributions(self, rows):
+        """Group a day's activity rows into units per drink type and measure."""
+        contributions = defaultdict(float)
+        for row in rows:
+            drink_type = self._resolve_drink_type(row.get("drink_id")) or DRINK_TYPE_OTHER
+            units = calculate_units(row)
+            if units:
+                contributions[(drink_type, row.get("measure_id"))] += units
+        return dict(contributions)
+
+    def _advance(self, today=None):
+        """Move the windows forward to today, subtracting days that dropped out."""
+        today = today or datetime.now().date()
+        if today == self._today:
+            return
+
+        previous = self._today
+        self._today = today
+        if previous is None:
+            return
+
+        today_str = today.strftime("%Y-%m-%d")
+        for window in self.windows:
+            old_start = self._window_start(window, previous)
+            new_start = self._window_start(window, today)
+            for date_str, contributions in self._days.items():
+                if old_start <= date_str < new_start:
+                    self._apply(window, contributions, -1)
+                elif date_str > previous.strftime("%Y-%m-%d") and new_start <= date_str <= today_str:
+                    # Future-dated drinks that have now come into the window
+                    self._apply(window, contributions, 1)
+
+        oldest = (today - timedelta(days=self._longest - 1)).strftime("%Y-%m-%d")
+        for date_str in [date_str for date_str in self._days if date_str < oldest]:
+            del self._days[date_str]
+
+    @callback
+    def async_apply_day(self, date_str, rows, today=None):
+        """Update the totals with a day's activity rows and return True if anything changed."""
+        self._advance(today)
+
+        today_str = self._today.strftime("%Y-%m-%d")
+        oldest = (self._today - timedelta(days=self._longest - 1)).strftime("%Y-%m-%d")
+        if date_str < oldest:
+            return False
+
+        new = self._contributions(rows)
+        old = self._days.get(date_str, {})
+        if new == old:
+            return False
+
+        if date_str <= today_str:
+            for window in self.windows:
+                if date_str >= self._window_start(window):
+                    self._apply(window, old, -1)
+                    self._apply(window, new, 1)
+
+        if new:
+            self._days[date_str] = new
+        else:
+            self._days.pop(date_str, None)
+        return True
+
+    @callback
+    def async_apply_rows(self, rows, today=None):
+        """Update the totals from stored rows covering several days."""
+        by_date = defaultdict(list)
+        for row in rows:
+            by_date[row["date"]].append(row)
+        for date_str, day_rows in sorted(by_date.items()):
+            self.async_apply_day(date_str, day_rows, today)
+
+    def get_units(self, window, group, key=None, today=None):
+        """Return the units for a window, either for one key or all keys in a group."""
+        self._advance(today)
+        totals = self._totals[window][group]
+        if key is not None:
+            return round(max(totals.get(key, 0.0), 0.0), 1)
+        return {key: round(units, 1) for key, units in sorted(totals.items()) if units > 0}
@@ -0,0 +1,132 @@
+"""
+Historical backfill for the Drinkaware integration.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.core import callback
+
+from .const import (
+    BACKFILL_CHUNK_DAYS,
+    BACKFILL_CHUNK_DELAY,
+    BACKFILL_RATE_LIMITED_DELAY,
+)
+from .breaker import CircuitOpenError
+from .models import parse_days
+from .orchestrator import low_priority_requests
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_tracking_since(value):
+    """Parse the trackingSince value from the stats payload into a date."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except (AttributeError, ValueError):
+        _LOGGER.debug("Could not parse trackingSince value %s", value)
+        return None
+
+
+class DrinkAwareBackfill:
+    """Walk back through an account's history in chunks, oldest last."""
+
+    def __init__(self, coordinator, history):
+        """Initialize the backfill."""
+        self.coordinator = coordinator
+        self.history = history
+        self._task = None
+
+    @property
+    def running(self):
+        """Return True if a backfill is in progress."""
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def async_start(self, entry):
+        """Start the backfill in the background if there is anything left to fetch."""
+        if self.history.backfill_complete or self.running:
+            return
+
+        stats = (self.coordinator.data or {}).get("stats")
+        tracking_since = _parse_tracking_since(stats.tracking_since if stats else None)
+        if tracking_since is None:
+            return
+
+        self._task = entry.async_create_background_task(
+            self.coordinator.hass,
+            self._async_run(tracking_since),
+            f"drinkaware_backfill_{self.coordinator.entry_id}",
+        )
+
+    async def async_stop(self):
+        """Stop a running backfill."""
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def _next_chunk(self, tracking_since):
+        """Return the (start, end) dates of the next chunk to fetch, or None when done."""
+        if self.history.backfill_cursor:
+            end = datetime.strptime(self.history.backfill_cursor, "%Y-%m-%d").date() - timedelta(days=1)
+        else:
+            # The regular poll covers the last two weeks
+            end = datetime.now().date() - timedelta(days=15)
+
+        if end < tracking_since:
+            return None
+
+        start = max(end - timedelta(days=BACKFILL_CHUNK_DAYS - 1), tracking_since)
+        return start, end
+
+    async def _async_run(self, tracking_since):
+        """Fetch chunks until the history reaches trackingSince."""
+        coordinator = self.coordinator
+        _LOGGER.info("Starting history backfill for %s back to %s", coordinator.account_name, tracking_since)
+
+        while (chunk := self._next_chunk(tracking_since)) is not None:
+            start, end = chunk
+            # Polling and service calls for every account go ahead of the backfill when requests queue
+            try:
+                with low_priority_requests():
+                    summary = await coordinator._fetch_summary_range(start, end)
+            except CircuitOpenError as err:
+                _LOGGER.debug("History backfill for %s paused: %s", coordinator.account_name, err)
+                await asyncio.sleep(BACKFILL_RATE_LIMITED_DELAY)
+                continue
+            except Exception as err:
+                # The cursor is unchanged, so the same chunk is fetched again after the delay
+                _LOGGER.warning(
+                    "Error backfilling history for %s at %s, retrying in %s seconds: %s",
+                    coordinator.account_name, end, BACKFILL_RATE_LIMITED_DELAY, err,
+                )
+                await asyncio.sleep(BACKFILL_RATE_LIMITED_DELAY)
+                continue
+
+            if not summary or "activitySummaryDays" not in summary:
+                _LOGGER.warning(
+                    "History backfill for %s stopped at %s, will resume on a later update",
+                    coordinator.account_name, end,
+                )
+                return
+
+            changed = await self.history.async_merge_days(summary["activitySummaryDays"])
+            coordinator.statistics.async_import_days(parse_days(changed))
+
+            # Persist progress so a restart resumes from here
+            self.history.backfill_cursor = start.strftime("%Y-%m-%d")
+            await self.history.async_save()
+            _LOGGER.debug("Backfilled %s to %s for %s", start, end, coordinator.account_name)
+
+            # Stay out of the way of regular polling
+            await asyncio.sleep(BACKFILL_RATE_LIMITED_DELAY if coordinator._rate_limited else BACKFILL_CHUNK_DELAY)
+
+        self.history.backfill_complete = True
+        await self.history.async_save()
+        _LOGGER.info("History backfill complete for %s", coordinator.account_name)
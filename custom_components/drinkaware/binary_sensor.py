@@ -0,0 +1,69 @@
+"""
+Binary sensor platform for Drinkaware integration.
+"""
+import logging
+from typing import Any, Dict
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import DrinkAwareDataUpdateCoordinator
+from .breaker import STATE_CLOSED
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Drinkaware binary sensors based on a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([DrinkAwareApiProblemSensor(coordinator)])
+
+
+class DrinkAwareApiProblemSensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor that is on while the Drinkaware API circuit breaker is not closed."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: DrinkAwareDataUpdateCoordinator) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"Drinkaware {coordinator.account_name} API Problem"
+        self._attr_unique_id = f"drinkaware_{coordinator.entry_id}_api_problem"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.entry_id)},
+            "name": f"Drinkaware {coordinator.account_name}",
+            "manufacturer": "Drinkaware",
+            "model": "Account",
+            "sw_version": "1.0",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Update as soon as the breaker changes state, not just after a refresh."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.breaker.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def available(self) -> bool:
+        """Return True, the breaker state is known even when refreshes fail."""
+        return True
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if requests to the API are being paused or probed."""
+        return self.coordinator.breaker.state != STATE_CLOSED
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the breaker state."""
+        return self.coordinator.breaker.as_dict()
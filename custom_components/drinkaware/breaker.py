@@ -0,0 +1,160 @@
+"""
+Circuit breakers for the hosts the Drinkaware integration talks to.
+"""
+import logging
+import time
+from datetime import timedelta
+from urllib.parse import urlparse
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_BREAKERS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    BREAKER_MAX_RESET_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a request while a host's breaker is open."""
+
+    def __init__(self, breaker):
+        """Initialize the error."""
+        super().__init__(f"{breaker.host} is unavailable, retrying in {breaker.retry_in:.0f} seconds")
+        self.breaker = breaker
+
+
+class CircuitBreaker:
+    """Stop calling a host after it keeps failing.
+
+    The breaker opens after a run of consecutive failures or timeouts. While it
+    is open requests are refused without touching the network. Once the reset
+    timeout passes a single probe request is let through: success closes the
+    breaker, failure opens it again with a doubled timeout.
+    """
+
+    def __init__(
+        self,
+        host,
+        threshold=BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=BREAKER_RESET_SECONDS,
+        max_reset_timeout=BREAKER_MAX_RESET_SECONDS,
+    ):
+        """Initialize the breaker."""
+        self.host = host
+        self.state = STATE_CLOSED
+        self.failures = 0  # Consecutive failures
+        self.opened_at = None
+        self.retry_at = None
+        self._threshold = threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._reset_timeout = reset_timeout
+        self._opened = None  # Monotonic time the breaker opened
+        self._probe_started = None
+        self._listeners = []
+
+    @property
+    def retry_in(self):
+        """Return the seconds until a probe request is allowed."""
+        if self.state == STATE_CLOSED:
+            return 0.0
+        started = self._probe_started if self.state == STATE_HALF_OPEN else self._opened
+        return max(0.0, started + self._reset_timeout - time.monotonic())
+
+    @property
+    def is_open(self):
+        """Return True if a request made now would be refused."""
+        return self.state != STATE_CLOSED and self.retry_in > 0
+
+    @callback
+    def async_add_listener(self, listener):
+        """Call listener() whenever the breaker changes state."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_set_state(self, state):
+        """Change state and tell the listeners."""
+        if state == self.state:
+            return
+        self.state = state
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_allow_request(self):
+        """Return True if a request may be made now, taking the probe if one is due."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.retry_in > 0:
+            return False
+
+        # Let one probe through; if it never reports back, another is allowed after the timeout
+        self._probe_started = time.monotonic()
+        self._async_set_state(STATE_HALF_OPEN)
+        return True
+
+    @callback
+    def async_record_success(self):
+        """Record a response from the host."""
+        self.failures = 0
+        if self.state == STATE_CLOSED:
+            return
+        _LOGGER.info("%s is responding again", self.host)
+        self._reset_timeout = self._base_reset_timeout
+        self.opened_at = self.retry_at = None
+        self._async_set_state(STATE_CLOSED)
+
+    @callback
+    def async_record_failure(self):
+        """Record a failed request or timeout."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+        elif self.state == STATE_OPEN or self.failures < self._threshold:
+            return
+
+        _LOGGER.warning(
+            "%s failed %s times in a row, pausing requests for %.0f seconds",
+            self.host,
+            self.failures,
+            self._reset_timeout,
+        )
+        self._opened = time.monotonic()
+        self.opened_at = dt_util.utcnow()
+        self.retry_at = self.opened_at + timedelta(seconds=self._reset_timeout)
+        self._async_set_state(STATE_OPEN)
+
+    def as_dict(self):
+        """Return the breaker state for diagnostics and attributes."""
+        return {
+            "host": self.host,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "retry_at": self.retry_at.isoformat() if self.retry_at else None,
+        }
+
+
+@callback
+def async_get_breaker(hass: HomeAssistant, url):
+    """Return the circuit breaker shared by all accounts for a URL's host."""
+    host = urlparse(url).hostname
+    breakers = hass.data.setdefault(DATA_BREAKERS, {})
+    if host not in breakers:
+        breakers[host] = CircuitBreaker(host)
+    return breakers[host]
@@ -0,0 +1,105 @@
+"""
+Calendar platform for Drinkaware integration.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from . import DrinkAwareDataUpdateCoordinator
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Drinkaware calendar based on a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([DrinkAwareCalendar(coordinator)])
+
+
+class DrinkAwareCalendar(CoordinatorEntity, CalendarEntity):
+    """Drinking days, drink-free days and sleep quality as all-day events.
+
+    Events come from the account's local history, so the frontend's range
+    queries never call the Drinkaware API.
+    """
+
+    _attr_icon = "mdi:calendar-heart"
+
+    def __init__(self, coordinator: DrinkAwareDataUpdateCoordinator) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_name = f"Drinkaware {coordinator.account_name} Calendar"
+        self._attr_unique_id = f"drinkaware_{coordinator.entry_id}_calendar"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.entry_id)},
+            "name": f"Drinkaware {coordinator.account_name}",
+            "manufacturer": "Drinkaware",
+            "model": "Account",
+            "sw_version": "1.0",
+        }
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return today's first event, if there is one."""
+        today = dt_util.now().date().isoformat()
+        return next(iter(self._events_between(today, today)), None)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> List[CalendarEvent]:
+        """Return the events that overlap a time range."""
+        # All-day events end at midnight, so an event on the end date only overlaps if the range goes past it
+        start = dt_util.as_local(start_date).date()
+        end = (dt_util.as_local(end_date) - timedelta(microseconds=1)).date()
+        return self._events_between(start.isoformat(), end.isoformat())
+
+    def _events_between(self, start, end):
+        """Return the events between two date strings (inclusive), oldest first."""
+        history = self.coordinator.history
+        events = []
+        for date_str in history.dates.range(start, end):
+            day_date = date.fromisoformat(date_str)
+            day = history.days.get(date_str)
+            event = self._day_event(day_date, day) if day is not None else None
+            if event is not None:
+                events.append(event)
+            quality = history.sleep.get(date_str)
+            if quality is not None:
+                events.append(self._event(day_date, f"Sleep: {quality}"))
+        return events
+
+    def _day_event(self, day_date, day):
+        """Return the event for a summary day, or None if nothing was tracked that day."""
+        drinks = day.get("drinks") or 0
+        units = day.get("units") or 0
+        if drinks > 0 or units > 0:
+            return self._event(
+                day_date, f"Drinking day ({round(units, 1)} units)", f"{drinks} drinks, {round(units, 1)} units"
+            )
+        if day.get("drinkFreeDay"):
+            return self._event(day_date, "Drink-free day")
+        # No drinks and not marked drink-free: the day was not tracked, or its drinks were cleared
+        return None
+
+    @staticmethod
+    def _event(day_date, summary, description=None):
+        """Return an all-day event."""
+        return CalendarEvent(
+            start=day_date,
+            end=day_date + timedelta(days=1),
+            summary=summary,
+            description=description,
+        )
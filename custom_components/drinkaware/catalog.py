@@ -0,0 +1,253 @@
+"""
+Indexed drinks catalog for the Drinkaware integration.
+"""
+import asyncio
+import logging
+import sys
+import time
+from types import MappingProxyType
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_STANDARD_DRINKS
+from .models import Drink, as_drink
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys in the generic drinks response that may hold custom drinks
+CUSTOM_DRINK_KEYS = ("customDrinks", "drinks", "results")
+
+# How long the shared standard drinks are reused before fetching again
+STANDARD_DRINKS_MAX_AGE = 6 * 3600
+
+
+def _freeze(index):
+    """Return a read-only view of an index, with tuples for its values."""
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+def _index_drinks(drinks):
+    """Index drinks by measure id and by ABV."""
+    by_measure = {}
+    by_abv = {}
+    for drink in drinks:
+        for measure in drink.measures:
+            by_measure.setdefault(measure.measure_id, []).append(drink)
+        if drink.abv is not None:
+            by_abv.setdefault(float(drink.abv), []).append(drink)
+    return _freeze(by_measure), _freeze(by_abv)
+
+
+class StandardDrinks:
+    """Read-only indexes over the standard drinks in a generic drinks response.
+
+    Standard drinks are the same for every account, so one instance is shared
+    by all account catalogs. Only the parsed drinks are kept, not the response.
+    """
+
+    def __init__(self, generic=None):
+        """Build the indexes from the categories of a generic drinks response."""
+        by_id = {}
+        category_of = {}
+        by_category = {}
+        for category in (generic or {}).get("categories", []):
+            title = sys.intern(category.get("title") or "Unknown Category")
+            for drink in category.get("drinks", []):
+                drink_id = drink.get("drinkId")
+                if not drink_id or drink_id in by_id:
+                    continue
+                drink = Drink.from_api(drink)
+                by_id[drink.drink_id] = drink
+                category_of[drink.drink_id] = title
+                by_category.setdefault(title, []).append(drink)
+
+        self.by_id = MappingProxyType(by_id)
+        self.category_of = MappingProxyType(category_of)
+        self.by_category = _freeze(by_category)
+        self.by_measure, self.by_abv = _index_drinks(by_id.values())
+        self.drinks = tuple(by_id.values())
+
+
+class GenericDrinks:
+    """A generic drinks response split into its standard and custom drinks.
+
+    The standard drinks are shared by all accounts, but the custom drinks
+    belong only to the account whose token fetched the response.
+    """
+
+    def __init__(self, generic=None):
+        """Parse the standard and custom drinks from a generic drinks response."""
+        generic = generic or {}
+        self.standard = StandardDrinks(generic)
+        self.custom_drinks = tuple(as_drink(drink) for key in CUSTOM_DRINK_KEYS for drink in generic.get(key, []))
+
+
+class SharedStandardDrinks:
+    """Standard drinks fetched once for all accounts.
+
+    Concurrent requests while a fetch is in flight wait for that fetch rather
+    than starting their own.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the shared standard drinks."""
+        self.hass = hass
+        self.standard = None
+        self.fetches = 0
+        self._fetched_at = None
+        self._pending = None
+
+    async def async_get(self, fetch):
+        """Return the standard drinks, using fetch() with any account's token if they are stale.
+
+        fetch() returns StandardDrinks, or None if the request failed.
+        """
+        if self.standard is not None and time.monotonic() - self._fetched_at < STANDARD_DRINKS_MAX_AGE:
+            return self.standard
+
+        task = self._pending
+        if task is None or task.done():
+            # The task may start eagerly and finish before this returns, so it is cleared here, not in the task
+            task = self._pending = self.hass.async_create_background_task(
+                self._async_fetch(fetch), "drinkaware standard drinks"
+            )
+        try:
+            # Shielded so an account being unloaded does not cancel the fetch for the others
+            return await asyncio.shield(task)
+        finally:
+            if self._pending is task and task.done():
+                self._pending = None
+
+    async def _async_fetch(self, fetch):
+        """Fetch the generic drinks and replace the shared indexes."""
+        standard = await fetch()
+        self.fetches += 1
+        if standard is not None:
+            self.standard = standard
+            self._fetched_at = time.monotonic()
+            _LOGGER.debug("Fetched %s standard drinks for all accounts", len(self.standard.drinks))
+        return self.standard
+
+
+@callback
+def async_get_shared_standard_drinks(hass: HomeAssistant):
+    """Return the standard drinks shared by all accounts."""
+    if DATA_STANDARD_DRINKS not in hass.data:
+        hass.data[DATA_STANDARD_DRINKS] = SharedStandardDrinks(hass)
+    return hass.data[DATA_STANDARD_DRINKS]
+
+
+class DrinkCatalog:
+    """Read-only indexes over an account's standard and custom drinks.
+
+    A catalog is built once per drinks fetch and never changed afterwards, so
+    lookups never walk the raw API lists. Drinks are kept as Drink models.
+    Standard drinks come from a shared StandardDrinks; only custom drinks are
+    indexed per account. Use with_custom_drink() to get a new catalog that
+    includes a newly created drink.
+    """
+
+    def __init__(self, generic=None, custom_drinks=(), standard=None):
+        """Build the indexes from a generic drinks response or shared standard drinks, and custom drinks.
+
+        Custom drinks may be Drink models or drinks from a search response.
+        """
+        generic = generic or {}
+        self.standard = standard or StandardDrinks(generic)
+
+        # Later sources are newer, so they replace earlier copies of the same drink
+        custom = {}
+        sources = [generic.get(key, []) for key in CUSTOM_DRINK_KEYS] + [custom_drinks]
+        for source in sources:
+            for drink in source:
+                drink = as_drink(drink)
+                if drink.drink_id and drink.is_custom and drink.drink_id not in self.standard.by_id:
+                    custom[drink.drink_id] = drink
+
+        by_derived_id = {}
+        for drink in custom.values():
+            by_derived_id.setdefault(drink.derived_drink_id, []).append(drink)
+
+        self._custom = MappingProxyType(custom)
+        self._by_derived_id = _freeze(by_derived_id)
+        self._custom_by_measure, self._custom_by_abv = _index_drinks(custom.values())
+        self.custom_drinks = tuple(custom.values())
+
+    @property
+    def standard_drinks(self):
+        """Return the standard drinks in API order."""
+        return self.standard.drinks
+
+    @classmethod
+    def from_responses(cls, generic, search=None):
+        """Build a catalog from the generic drinks and search responses."""
+        return cls(generic, (search or {}).get("results", []))
+
+    def with_custom_drink(self, drink):
+        """Return a new catalog that includes, or updates, a custom drink."""
+        return self.with_custom_drinks((drink,))
+
+    def with_custom_drinks(self, drinks):
+        """Return a new catalog that includes, or updates, several custom drinks."""
+        return DrinkCatalog(
+            custom_drinks=self.custom_drinks + tuple(as_drink(drink) for drink in drinks), standard=self.standard
+        )
+
+    def __contains__(self, drink_id):
+        """Return True if the drink is in the catalog."""
+        return drink_id in self.standard.by_id or drink_id in self._custom
+
+    def __len__(self):
+        """Return the number of drinks in the catalog."""
+        return len(self.standard.by_id) + len(self._custom)
+
+    @property
+    def categories(self):
+        """Return the category titles in API order."""
+        return tuple(self.standard.by_category)
+
+    def get(self, drink_id):
+        """Return a standard or custom drink by id."""
+        drink = self.standard.by_id.get(drink_id)
+        if drink is None:
+            drink = self._custom.get(drink_id)
+        return drink
+
+    def title(self, drink_id, default=None):
+        """Return the title of a drink."""
+        drink = self.get(drink_id)
+        if drink is None or drink.title is None:
+            return default
+        return drink.title
+
+    def category(self, drink_id):
+        """Return the category title of a standard drink."""
+        return self.standard.category_of.get(drink_id)
+
+    def is_custom(self, drink_id):
+        """Return True if the drink is a custom drink."""
+        return drink_id in self._custom
+
+    def derived_drink_id(self, drink_id):
+        """Return the standard drink a custom drink is based on."""
+        drink = self._custom.get(drink_id)
+        if drink is None:
+            return None
+        return drink.derived_drink_id
+
+    def drinks_in_category(self, title):
+        """Return the standard drinks in a category."""
+        return self.standard.by_category.get(title, ())
+
+    def drinks_derived_from(self, drink_id):
+        """Return the custom drinks based on a standard drink."""
+        return self._by_derived_id.get(drink_id, ())
+
+    def drinks_with_measure(self, measure_id):
+        """Return the drinks that can be served in a measure."""
+        return self.standard.by_measure.get(measure_id, ()) + self._custom_by_measure.get(measure_id, ())
+
+    def drinks_with_abv(self, abv):
+        """Return the drinks with an exact ABV."""
+        abv = float(abv)
+        return self.standard.by_abv.get(abv, ()) + self._custom_by_abv.get(abv, ())
@@ -0,0 +1,83 @@
+"""
+Single-flight coalescing of identical Drinkaware API reads.
+"""
+import asyncio
+import contextvars
+import logging
+from contextlib import contextmanager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Set while a service call that writes is running, so its reads never share a response started before the write
+_fresh_reads = contextvars.ContextVar("drinkaware_fresh_reads", default=False)
+
+
+@contextmanager
+def fresh_reads():
+    """Make reads in this block lead their own request instead of joining one in flight."""
+    token = _fresh_reads.set(True)
+    try:
+        yield
+    finally:
+        _fresh_reads.reset(token)
+
+
+class _LeaderCancelled(Exception):
+    """The request other callers were waiting on was cancelled."""
+
+
+class RequestCoalescer:
+    """Share one in-flight request between identical concurrent reads.
+
+    The first caller for a key makes the request itself; callers arriving while
+    it is in flight wait for its parsed result instead of making their own.
+    Nothing is cached once the request finishes.
+    """
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self.requests = 0
+        self.hits = 0  # Requests answered by one already in flight
+        self._in_flight = {}  # key -> future for the leader's result
+
+    async def async_request(self, key, fetch):
+        """Return fetch()'s result, sharing it with identical requests already in flight."""
+        self.requests += 1
+        future = self._in_flight.get(key)
+        if future is not None and not _fresh_reads.get():
+            self.hits += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # Try again, leading a new request if nobody else has
+                self.requests -= 1
+                self.hits -= 1
+                return await self.async_request(key, fetch)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            if future.done() and not future.cancelled():
+                future.exception()  # Waiters get the error; don't log it again if there are none
+
+    def as_dict(self):
+        """Return the hit counts for diagnostics."""
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.requests, 3) if self.requests else None,
+            "in_flight": len(self._in_flight),
+        }
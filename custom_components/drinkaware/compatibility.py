@@ -0,0 +1,126 @@
+"""
+Precompiled drink and measure compatibility for the Drinkaware integration.
+"""
+import logging
+import sys
+
+from .drink_constants import (
+    DRINK_MEASURE_COMPATIBILITY,
+    DRINK_NAMES,
+    MEASURE_DESCRIPTIONS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CompatibilityMatrix:
+    """Compatible measures per drink, with option lists and error messages rendered up front.
+
+    Validating a drink and measure is a dict lookup and a frozenset membership
+    test. Matrices are never changed; with_catalog() returns a new one.
+    """
+
+    def __init__(self, compatibility, drink_names, measure_labels):
+        """Compile the matrix from ordered measure ids per drink."""
+        self._compatibility = {
+            sys.intern(drink_id): tuple(sys.intern(measure_id) for measure_id in measure_ids)
+            for drink_id, measure_ids in compatibility.items()
+        }
+        self._drink_names = dict(drink_names)
+        self._measure_labels = dict(measure_labels)
+
+        self._measures = {}
+        self._options = {}
+        self._error_prefix = {}
+        self._error_suffix = {}
+        self._errors = {}
+        for drink_id, measure_ids in self._compatibility.items():
+            if not measure_ids:
+                continue
+            compatible = frozenset(measure_ids)
+            self._measures[drink_id] = compatible
+
+            # Options follow the order of the known measures
+            self._options[drink_id] = [
+                {"value": measure_id, "label": label}
+                for measure_id, label in self._measure_labels.items()
+                if measure_id in compatible
+            ]
+
+            drink_name = self._drink_names.get(drink_id, "Unknown drink")
+            self._error_prefix[drink_id] = (
+                f"Incompatible drink and measure combination: {drink_name} cannot be served in "
+            )
+            self._error_suffix[drink_id] = ". Compatible measures for {} are: {}".format(
+                drink_name,
+                ", ".join(self._measure_labels.get(measure_id, measure_id) for measure_id in measure_ids),
+            )
+            for measure_id, label in self._measure_labels.items():
+                if measure_id not in compatible:
+                    self._errors[(drink_id, measure_id)] = (
+                        f"{self._error_prefix[drink_id]}{label}{self._error_suffix[drink_id]}"
+                    )
+
+    @classmethod
+    def from_constants(cls):
+        """Compile the matrix from the built-in drink constants."""
+        return cls(DRINK_MEASURE_COMPATIBILITY, DRINK_NAMES, MEASURE_DESCRIPTIONS)
+
+    def with_catalog(self, catalog):
+        """Return a matrix that also allows the measures listed in a drinks catalog.
+
+        Returns the same matrix if the catalog adds nothing.
+        """
+        compatibility = {drink_id: list(measure_ids) for drink_id, measure_ids in self._compatibility.items()}
+        drink_names = dict(self._drink_names)
+        measure_labels = dict(self._measure_labels)
+        changed = False
+
+        for drink in catalog.standard_drinks:
+            known = compatibility.setdefault(drink.drink_id, [])
+            drink_names.setdefault(drink.drink_id, drink.title or "Unknown drink")
+            for measure in drink.measures:
+                if measure.measure_id in known:
+                    continue
+                known.append(measure.measure_id)
+                measure_labels.setdefault(measure.measure_id, measure.title or measure.measure_id)
+                changed = True
+
+        if not changed:
+            return self
+
+        _LOGGER.debug("Learned new drink and measure combinations from the drinks catalog")
+        return CompatibilityMatrix(compatibility, drink_names, measure_labels)
+
+    def measure_options(self, drink_id):
+        """Return the compatible measure options for a drink, or None if unknown."""
+        return self._options.get(drink_id)
+
+    def is_compatible(self, drink_id, measure_id):
+        """Return True if the measure is compatible, or the drink is unknown."""
+        compatible = self._measures.get(drink_id)
+        return compatible is None or measure_id in compatible
+
+    def error(self, drink_id, measure_id):
+        """Return the validation error for a drink and measure, or None if compatible."""
+        if self.is_compatible(drink_id, measure_id):
+            return None
+
+        error = self._errors.get((drink_id, measure_id))
+        if error is None:
+            error = f"{self._error_prefix[drink_id]}Unknown measure{self._error_suffix[drink_id]}"
+        return error
+
+
+_matrix = CompatibilityMatrix.from_constants()
+
+
+def get_compatibility():
+    """Return the current compatibility matrix."""
+    return _matrix
+
+
+def learn_compatibility(catalog):
+    """Add the drink and measure combinations listed in a drinks catalog."""
+    global _matrix
+    _matrix = _matrix.with_catalog(catalog)
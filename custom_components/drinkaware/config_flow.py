@@ -11,12 +11,16 @@ import re
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
     API_BASE_URL,
     ENDPOINT_STATS,
+    CONF_TRACE_REQUESTS,
+    CONF_SLOW_REFRESH_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +46,12 @@ class DrinkAwareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for an account."""
+        return DrinkAwareOptionsFlow()
+
     def __init__(self):
         """Initialize the config flow."""
         self._session = None
@@ -229,7 +239,7 @@ class DrinkAwareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Token exchange failed with status %s: %s", response.status, error_text)
                 raise Exception(f"Failed to get token: {response.status} - {error_text}")
 
-            token_info = await response.json()
+            token_info = await response.json(loads=json_loads)
             _LOGGER.debug("Successfully obtained token")
             return token_info
 
@@ -298,3 +308,26 @@ class DrinkAwareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except Exception as e:
             _LOGGER.warning("Error parsing JWT token: %s", e)
             return {}
+
+
+class DrinkAwareOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for a Drinkaware account."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_TRACE_REQUESTS,
+                    default=self.config_entry.options.get(CONF_TRACE_REQUESTS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_SLOW_REFRESH_SECONDS,
+                    default=self.config_entry.options.get(CONF_SLOW_REFRESH_SECONDS, 0),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }),
+        )
@@ -4,6 +4,21 @@ Constants for the Drinkaware integration.
 
 DOMAIN = "drinkaware"
 
+# Default account the services were last registered with, kept outside hass.data[DOMAIN]
+DATA_SERVICES_ENTRY = f"{DOMAIN}_services_entry"
+
+# Standard drinks shared by all accounts
+DATA_STANDARD_DRINKS = f"{DOMAIN}_standard_drinks"
+
+# Polling schedule shared by all accounts
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# API request budget shared by all accounts
+DATA_ORCHESTRATOR = f"{DOMAIN}_orchestrator"
+
+# Circuit breakers shared by all accounts, keyed by host
+DATA_BREAKERS = f"{DOMAIN}_breakers"
+
 # OAuth Configuration
 OAUTH_CLIENT_ID = "fe14e7b9-d4e1-4967-8fce-617c6f48a055"
 # Use the exact URLs from the CURL commands
@@ -30,6 +45,50 @@ ENDPOINT_DRINKS = "/tracking/v1/activity"  # Updated path based on logs
 
 # Update intervals
 SCAN_INTERVAL_HOURS = 1
+POLL_JITTER_SECONDS = 60  # Random shift of each refresh within an account's slot
+POLL_MIN_DELAY_SECONDS = 60  # Closer slots are skipped until the next interval
+
+# Adaptive polling bounds
+POLL_MIN_INTERVAL_MINUTES = 5
+POLL_ACTIVE_INTERVAL_MINUTES = 15  # Interval in the hours an account usually logs drinks
+POLL_MAX_INTERVAL_HOURS = 4  # Longest backoff after polls that show no change
+POLL_SNAP_BACK_MINUTES = 60  # Poll at the minimum interval for this long after a write
+POLL_DEFAULT_ACTIVE_HOURS = (17, 18, 19, 20, 21, 22, 23)  # Used until enough activity is seen
+
+# Most API requests in flight at once across all accounts
+MAX_CONCURRENT_REQUESTS = 4
+
+# Circuit breaker
+BREAKER_FAILURE_THRESHOLD = 5  # Consecutive failures before requests are paused
+BREAKER_RESET_SECONDS = 60  # Pause before the first probe request
+BREAKER_MAX_RESET_SECONDS = 1800  # Longest pause after repeated failed probes
+
+# Options
+CONF_TRACE_REQUESTS = "trace_requests"
+CONF_SLOW_REFRESH_SECONDS = "slow_refresh_seconds"
+
+# Request tracing
+TRACE_BUFFER_SIZE = 100  # Most recent traced requests kept per account
+
+# Refresh profiling
+PROFILE_HISTORY_SIZE = 20  # Most recent refreshes kept per account
+
+# Rolling windows (in days) for the unit breakdown sensors
+BREAKDOWN_WINDOWS = {
+    "weekly": 7,
+    "monthly": 30,
+}
+
+# History backfill
+BACKFILL_CHUNK_DAYS = 28
+BACKFILL_CHUNK_DELAY = 5  # Seconds between chunks
+BACKFILL_RATE_LIMITED_DELAY = 60  # Seconds between chunks after a rate limit
+
+# Custom drinks sync
+CUSTOM_DRINKS_SYNC_HOURS = 24  # Between syncs of all of an account's custom drinks
+CUSTOM_DRINKS_PAGE_SIZE = 50
+CUSTOM_DRINKS_SYNC_CONCURRENCY = 3  # Search pages requested at once
+CUSTOM_DRINKS_MAX_PAGES = 60  # Search pages read by one sync at most
 
 # Service names
 SERVICE_LOG_DRINK_FREE_DAY = "log_drink_free_day"
@@ -62,6 +121,11 @@ WEEKLY_UNITS = "weekly_units"
 LAST_DRINK_DATE = "last_drink_date"
 SLEEP_QUALITY = "sleep_quality"
 
+# Long-term statistic keys
+STATISTIC_DAILY_UNITS = "daily_units"
+STATISTIC_DAILY_DRINKS = "daily_drinks"
+STATISTIC_DRINK_FREE_DAY = "drink_free_day"
+
 # Risk levels
 RISK_LEVEL_LOW = "low"
 RISK_LEVEL_INCREASING = "increasing"
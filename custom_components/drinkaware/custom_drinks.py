@@ -0,0 +1,101 @@
+"""
+Custom drinks sync for the Drinkaware integration.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from .const import (
+    CUSTOM_DRINKS_MAX_PAGES,
+    CUSTOM_DRINKS_PAGE_SIZE,
+    CUSTOM_DRINKS_SYNC_CONCURRENCY,
+    CUSTOM_DRINKS_SYNC_HOURS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CustomDrinkSync:
+    """Page through all of an account's custom drinks and merge them into its catalog.
+
+    Search returns the most recently used drinks first. The first sync reads
+    every page; later syncs stop at the first batch of pages with nothing new
+    or changed, since everything after it was merged before.
+    """
+
+    def __init__(self, coordinator):
+        """Initialize the sync."""
+        self.coordinator = coordinator
+        self.last_sync = None  # When the last sync finished
+        self.complete = False  # True once a sync has read every page
+        self.pages = 0  # Pages read by the last sync
+        self.merged = 0  # Drinks added or updated by the last sync
+
+    @property
+    def due(self):
+        """Return True if the catalog exists and has not been synced recently."""
+        if self.coordinator.catalog is None:
+            return False
+        return self.last_sync is None or datetime.now() - self.last_sync >= timedelta(hours=CUSTOM_DRINKS_SYNC_HOURS)
+
+    def _merge(self, drinks):
+        """Merge new or changed custom drinks into the catalog and return how many there were."""
+        catalog = self.coordinator.catalog
+        changed = [drink for drink in drinks if drink.is_custom and catalog.get(drink.drink_id) != drink]
+        if changed:
+            self.coordinator.catalog = catalog.with_custom_drinks(changed)
+        return len(changed)
+
+    async def async_sync(self):
+        """Read search pages a batch at a time, merging each batch, and return the drinks merged."""
+        coordinator = self.coordinator
+        page = 1
+        pages = merged = 0
+        while pages < CUSTOM_DRINKS_MAX_PAGES:
+            batch = range(page, page + CUSTOM_DRINKS_SYNC_CONCURRENCY)
+            # Requests still go through the shared request budget, so the batch only overlaps as far as it allows
+            results = await asyncio.gather(
+                *(coordinator._fetch_search_drinks(number, CUSTOM_DRINKS_PAGE_SIZE) for number in batch)
+            )
+            if any(drinks is None for drinks in results):
+                _LOGGER.debug("Custom drinks sync for %s stopped at page %s", coordinator.account_name, page)
+                return merged
+
+            pages += len(results)
+            batch_merged = self._merge([drink for drinks in results for drink in drinks])
+            merged += batch_merged
+
+            if any(len(drinks) < CUSTOM_DRINKS_PAGE_SIZE for drinks in results):
+                self.complete = True
+                break
+            if self.complete and not batch_merged:
+                # Older pages were merged by an earlier sync
+                break
+            if coordinator._rate_limited:
+                _LOGGER.debug("Custom drinks sync for %s paused by rate limiting", coordinator.account_name)
+                return merged
+            page += CUSTOM_DRINKS_SYNC_CONCURRENCY
+        else:
+            # Search may keep returning full pages, so a sync stops here and later ones only read new drinks
+            _LOGGER.warning(
+                "Custom drinks sync for %s stopped after %s pages, older custom drinks may be missing",
+                coordinator.account_name, pages,
+            )
+            self.complete = True
+
+        self.last_sync = datetime.now()
+        self.pages = pages
+        self.merged = merged
+        _LOGGER.debug(
+            "Synced custom drinks for %s: %s pages, %s added or updated", coordinator.account_name, pages, merged
+        )
+        return merged
+
+    def as_dict(self):
+        """Return the sync state for diagnostics."""
+        return {
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "complete": self.complete,
+            "pages": self.pages,
+            "merged": self.merged,
+        }
@@ -0,0 +1,40 @@
+"""
+Diagnostics support for the Drinkaware integration.
+"""
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .scheduler import async_get_scheduler
+from .orchestrator import async_get_orchestrator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    schedule = async_get_scheduler(hass).as_dict()
+    requests = async_get_orchestrator(hass).as_dict()
+
+    return {
+        "account_name": coordinator.account_name,
+        "polling": {
+            "update_interval_seconds": (
+                coordinator.update_interval.total_seconds() if coordinator.update_interval else None
+            ),
+            "last_update_success": coordinator.last_update_success,
+            **schedule["entries"].get(entry.entry_id, {}),
+        },
+        "schedule": schedule,
+        "requests": requests["accounts"].get(entry.entry_id, {}),
+        "coalesced_requests": coordinator.coalescer.as_dict(),
+        "endpoints": coordinator.request_metrics.as_dict(),
+        "traces": coordinator.tracer.as_dict() if coordinator.tracer else {"enabled": False},
+        "refresh_profiles": coordinator.profiler.as_dict(),
+        "custom_drinks_sync": coordinator.custom_drink_sync.as_dict(),
+        "request_budget": {
+            "max_in_flight": requests["max_in_flight"],
+            "in_flight": requests["in_flight"],
+            "queued": requests["queued"],
+        },
+        "circuit_breakers": [coordinator.breaker.as_dict(), coordinator.login_breaker.as_dict()],
+    }
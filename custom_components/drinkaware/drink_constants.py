@@ -100,6 +100,67 @@ MEASURE_DESCRIPTIONS = {
     MEASURE_ID_PORT_SHERRY: "Small port/sherry glass (75ml)",
 }
 
+# Measure volumes in millilitres, used to work out units
+MEASURE_VOLUMES_ML = {
+    MEASURE_ID_PINT: 568,
+    MEASURE_ID_HALF_PINT: 284,
+    MEASURE_ID_SMALL_BOTTLE: 330,
+    MEASURE_ID_MEDIUM_BOTTLE: 440,
+    MEASURE_ID_LARGE_BOTTLE: 500,
+    MEASURE_ID_EXTRA_LARGE_BOTTLE: 660,
+    MEASURE_ID_SMALL_WINE: 125,
+    MEASURE_ID_MEDIUM_WINE: 175,
+    MEASURE_ID_LARGE_WINE: 250,
+    MEASURE_ID_CHAMPAGNE: 125,
+    MEASURE_ID_MEDIUM_CHAMPAGNE: 187,
+    MEASURE_ID_SINGLE_SPIRIT: 25,
+    MEASURE_ID_DOUBLE_SPIRIT: 50,
+    MEASURE_ID_PORT_SHERRY: 75,
+}
+
+# Drink type groups used for unit breakdowns
+DRINK_TYPE_BEER = "beer"
+DRINK_TYPE_WINE = "wine"
+DRINK_TYPE_CHAMPAGNE = "champagne"
+DRINK_TYPE_SPIRITS = "spirits"
+DRINK_TYPE_PORT_SHERRY = "port_sherry"
+DRINK_TYPE_CIDER = "cider"
+DRINK_TYPE_ALCOPOP = "alcopop"
+DRINK_TYPE_OTHER = "other"
+
+DRINK_TYPE_NAMES = {
+    DRINK_TYPE_BEER: "Beer",
+    DRINK_TYPE_WINE: "Wine",
+    DRINK_TYPE_CHAMPAGNE: "Champagne",
+    DRINK_TYPE_SPIRITS: "Spirits",
+    DRINK_TYPE_PORT_SHERRY: "Port/Sherry",
+    DRINK_TYPE_CIDER: "Cider",
+    DRINK_TYPE_ALCOPOP: "Alcopop",
+    DRINK_TYPE_OTHER: "Other",
+}
+
+# Mapping of standard drinks to their drink type group
+DRINK_TYPES = {
+    DRINK_ID_LAGER: DRINK_TYPE_BEER,
+    DRINK_ID_BEER: DRINK_TYPE_BEER,
+    DRINK_ID_ALE_STOUT: DRINK_TYPE_BEER,
+    DRINK_ID_WHITE_WINE: DRINK_TYPE_WINE,
+    DRINK_ID_RED_WINE: DRINK_TYPE_WINE,
+    DRINK_ID_ROSE_WINE: DRINK_TYPE_WINE,
+    DRINK_ID_CHAMPAGNE: DRINK_TYPE_CHAMPAGNE,
+    DRINK_ID_PROSECCO: DRINK_TYPE_CHAMPAGNE,
+    DRINK_ID_VODKA: DRINK_TYPE_SPIRITS,
+    DRINK_ID_GIN: DRINK_TYPE_SPIRITS,
+    DRINK_ID_TEQUILA: DRINK_TYPE_SPIRITS,
+    DRINK_ID_RUM: DRINK_TYPE_SPIRITS,
+    DRINK_ID_WHISKEY: DRINK_TYPE_SPIRITS,
+    DRINK_ID_BRANDY: DRINK_TYPE_SPIRITS,
+    DRINK_ID_OTHER_SPIRIT: DRINK_TYPE_SPIRITS,
+    DRINK_ID_PORT_SHERRY: DRINK_TYPE_PORT_SHERRY,
+    DRINK_ID_CIDER: DRINK_TYPE_CIDER,
+    DRINK_ID_ALCOPOP: DRINK_TYPE_ALCOPOP,
+}
+
 # Mapping of drink types to compatible measure types
 DRINK_MEASURE_COMPATIBILITY = {
     # Beer/Lager/Ale
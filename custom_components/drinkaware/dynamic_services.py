@@ -17,11 +17,7 @@ from .const import (
     ATTR_SLEEP_QUALITY,
 )
 
-from .drink_constants import (
-    DRINK_MEASURE_COMPATIBILITY,
-    MEASURE_DESCRIPTIONS,
-    DRINK_NAMES,
-)
+from .compatibility import get_compatibility
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +45,7 @@ def async_get_available_drinks(hass: HomeAssistant):
         if entry_id == "account_name_map":
             continue
 
-        if hasattr(coordinator, 'drinks_cache') and coordinator.drinks_cache:
+        if getattr(coordinator, "catalog", None) is not None:
             # Process standard drinks from categories
             _process_standard_drinks(coordinator, drinks_data)
 
@@ -66,39 +62,16 @@ def async_get_available_drinks(hass: HomeAssistant):
 
 
 def _process_standard_drinks(coordinator, drinks_data):
-    """Process standard drinks from categories in the drinks cache."""
-    if "categories" in coordinator.drinks_cache:
-        for category in coordinator.drinks_cache["categories"]:
-            for drink in category.get("drinks", []):
-                drink_id = drink.get("drinkId")
-                if drink_id:
-                    drinks_data[drink_id] = drink
+    """Process standard drinks from the drinks catalog."""
+    for drink in coordinator.catalog.standard_drinks:
+        drinks_data[drink.drink_id] = drink
 
 
 def _process_custom_drinks(coordinator, custom_drinks):
-    """Process custom drinks from different sources in the drinks cache."""
-    # Add custom drinks from search results
-    if "drinks" in coordinator.drinks_cache:
-        _extract_custom_drinks(coordinator.drinks_cache["drinks"], custom_drinks, coordinator.account_name)
-
-    # Process the customDrinks array if it exists
-    if "customDrinks" in coordinator.drinks_cache:
-        _extract_custom_drinks(coordinator.drinks_cache["customDrinks"], custom_drinks, coordinator.account_name)
-
-    # Process results array which is present in search results
-    if "results" in coordinator.drinks_cache:
-        _extract_custom_drinks(coordinator.drinks_cache["results"], custom_drinks, coordinator.account_name)
-
-
-def _extract_custom_drinks(drinks_array, custom_drinks, account_name):
-    """Extract custom drinks from an array and add to the custom_drinks list."""
-    for drink in drinks_array:
-        if "derivedDrinkId" in drink:
-            # Add account name to the drink info
-            custom_drinks.append({
-                **drink,
-                "account_name": account_name
-            })
+    """Process custom drinks from the drinks catalog."""
+    for drink in coordinator.catalog.custom_drinks:
+        # Pair the drink with its account's name
+        custom_drinks.append((drink, coordinator.account_name))
 
 
 def _compile_standard_drink_options(drinks_data):
@@ -106,9 +79,9 @@ def _compile_standard_drink_options(drinks_data):
     drink_options = []
 
     # Add standard drinks first
-    for drink_id, drink in sorted(drinks_data.items(), key=lambda x: x[1].get("title", "")):
-        abv = drink.get("abv", 0)
-        title = drink.get("title", "Unknown Drink")
+    for drink_id, drink in sorted(drinks_data.items(), key=lambda x: x[1].title or ""):
+        abv = drink.abv if drink.abv is not None else 0
+        title = drink.title if drink.title is not None else "Unknown Drink"
         drink_options.append({
             "value": drink_id,
             "label": f"{title} ({abv}% ABV)"
@@ -122,11 +95,10 @@ def _compile_custom_drink_options(custom_drinks):
     drink_options = []
 
     # Add custom drinks
-    for drink in sorted(custom_drinks, key=lambda x: x.get("title", "")):
-        drink_id = drink.get("drinkId")
-        abv = drink.get("abv", 0)
-        title = drink.get("title", "Custom Drink")
-        account_name = drink.get("account_name", "Unknown")
+    for drink, account_name in sorted(custom_drinks, key=lambda x: x[0].title or ""):
+        drink_id = drink.drink_id
+        abv = drink.abv if drink.abv is not None else 0
+        title = drink.title if drink.title is not None else "Custom Drink"
 
         if drink_id:
             drink_options.append({
@@ -139,29 +111,12 @@ def _compile_custom_drink_options(custom_drinks):
 
 @callback
 def async_get_compatible_measures(hass: HomeAssistant, drink_id):
-    """Get compatible measures for a specific drink."""
-    # Get the list of compatible measure IDs for this drink
-    compatible_measure_ids = DRINK_MEASURE_COMPATIBILITY.get(drink_id, [])
-
-    # If we don't have specific compatibility info, return all measures
-    if not compatible_measure_ids:
-        return None  # Return None to use the default complete list
-
-    # Create a list of all available measures
-    measure_options = []
-
-    # Define all known measures
-    all_measures = [
-        {"value": measure_id, "label": desc}
-        for measure_id, desc in MEASURE_DESCRIPTIONS.items()
-    ]
+    """Get compatible measures for a specific drink.
 
-    # Filter measures by compatibility
-    for measure in all_measures:
-        if measure["value"] in compatible_measure_ids:
-            measure_options.append(measure)
-
-    return measure_options
+    Returns None to use the default complete list if we don't have specific
+    compatibility info for this drink.
+    """
+    return get_compatibility().measure_options(drink_id)
 
 
 @callback
@@ -317,36 +272,9 @@ def validate_drink_measure_compatibility(value):
     if not drink_id or not measure_id:
         return value
 
-    # Get compatible measure IDs for this drink
-    compatible_measure_ids = DRINK_MEASURE_COMPATIBILITY.get(drink_id, [])
-
-    # If we don't have compatibility info for this drink, assume it's compatible
-    if not compatible_measure_ids:
-        return value
-
-    # Check if the measure is compatible
-    if measure_id not in compatible_measure_ids:
-        # Get human-readable measure description
-        measure_description = MEASURE_DESCRIPTIONS.get(measure_id, "Unknown measure")
-
-        # Get human-readable drink name
-        drink_name = DRINK_NAMES.get(drink_id, "Unknown drink")
-
-        # Get a list of compatible measure descriptions
-        compatible_measures = []
-        for m_id in compatible_measure_ids:
-            if m_id in MEASURE_DESCRIPTIONS:
-                compatible_measures.append(MEASURE_DESCRIPTIONS[m_id])
-            else:
-                compatible_measures.append(m_id)
-
-        # Format the error message
-        error_msg = (
-            f"Incompatible drink and measure combination: {drink_name} cannot be served in {measure_description}. "
-        )
-        if compatible_measures:
-            error_msg += f"Compatible measures for {drink_name} are: {', '.join(compatible_measures)}"
-
+    # Drinks without compatibility info are assumed to be compatible
+    error_msg = get_compatibility().error(drink_id, measure_id)
+    if error_msg:
         raise vol.Invalid(error_msg)
 
     return value
@@ -0,0 +1,228 @@
+"""
+Local daily history for the Drinkaware integration.
+"""
+import logging
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import DOMAIN
+from .series import DaySeries
+from .store import DrinkAwareStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# JSON storage used before the SQLite store, migrated on first load
+LEGACY_STORAGE_VERSION = 1
+
+# Fields kept for each summary day
+DAY_FIELDS = ("units", "drinks", "drinkFreeDay")
+
+# Coordinator data kept so a restart can start from local rows
+SNAPSHOT_KEYS = ("assessment", "stats", "goals")
+
+
+def _compact_day(day):
+    """Return only the summary fields we keep locally."""
+    return {field: day.get(field) for field in DAY_FIELDS if field in day}
+
+
+def extract_drinks(activity):
+    """Extract the list of drinks from an activity response."""
+    if "activity" in activity and activity["activity"]:
+        return activity["activity"]
+    if "drinks" in activity and activity["drinks"]:
+        return activity["drinks"]
+    return []
+
+
+def activity_to_rows(drinks):
+    """Convert drinks from an activity response into store rows."""
+    rows = []
+    for drink in drinks:
+        if not drink.get("drinkId") or not drink.get("measureId"):
+            continue
+        rows.append({
+            "drink_id": drink["drinkId"],
+            "measure_id": drink["measureId"],
+            "name": drink.get("name"),
+            "measure_name": drink.get("measureName"),
+            "abv": drink.get("abv"),
+            "quantity": drink.get("quantity", 0),
+            "units": drink.get("units"),
+        })
+    return rows
+
+
+def rows_to_activity(rows):
+    """Convert store rows back into the activity response shape."""
+    return {
+        "activity": [
+            {
+                "drinkId": row["drink_id"],
+                "measureId": row["measure_id"],
+                "name": row["name"],
+                "measureName": row["measure_name"],
+                "abv": row["abv"],
+                "quantity": row["quantity"],
+                "units": row["units"],
+            }
+            for row in rows
+        ]
+    }
+
+
+class DrinkAwareHistory:
+    """Per-account history backed by an embedded SQLite store.
+
+    Summary days and sleep quality are mirrored in memory for sensors and the
+    calendar, with a sorted index of their dates for range queries; activity
+    is read from the store on demand.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id):
+        """Initialize the history."""
+        self.hass = hass
+        self._store = DrinkAwareStore(hass.config.path(STORAGE_DIR, f"{DOMAIN}_{entry_id}.db"))
+        self._legacy_store = Store(hass, LEGACY_STORAGE_VERSION, f"{DOMAIN}.history.{entry_id}")
+        self._loaded = False
+        self.days = {}  # date string -> compact summary day
+        self.sleep = {}  # date string -> sleep quality
+        self.dates = DaySeries()  # Dates with a summary day or sleep quality
+        self.backfill_cursor = None  # Oldest date the backfill has fetched
+        self.backfill_complete = False
+        self.activity_hours = None  # Local hour -> changes seen by polling in that hour
+        self._activity_listeners = []
+
+    @callback
+    def async_add_activity_listener(self, listener):
+        """Call listener(date_str, rows) whenever a day's drinks are stored."""
+        self._activity_listeners.append(listener)
+
+        @callback
+        def remove_listener():
+            self._activity_listeners.remove(listener)
+
+        return remove_listener
+
+    def _load(self):
+        """Open the store and read the in-memory mirror."""
+        self._store.open()
+        days = self._store.get_days()
+        sleep = self._store.get_sleep_quality()
+        backfill = self._store.get_meta("backfill", {})
+        snapshot = self._store.get_meta("snapshot")
+        activity_hours = self._store.get_meta("activity_hours")
+        return days, sleep, backfill, snapshot, activity_hours
+
+    async def async_load(self):
+        """Load the history and return the last stored coordinator snapshot, if any."""
+        days, sleep, backfill, snapshot, activity_hours = await self.hass.async_add_executor_job(self._load)
+        self._loaded = True
+        self.activity_hours = activity_hours
+
+        self.days = {day.pop("date"): day for day in days}
+        self.sleep = sleep
+        self.dates = DaySeries([*self.days, *self.sleep])
+        self.backfill_cursor = backfill.get("cursor")
+        self.backfill_complete = backfill.get("complete", False)
+
+        await self._async_migrate_legacy()
+        _LOGGER.debug("Loaded %s history days from the local store", len(self.days))
+        return snapshot
+
+    async def _async_migrate_legacy(self):
+        """Move history from the old JSON storage into the SQLite store."""
+        legacy = await self._legacy_store.async_load()
+        if not legacy:
+            return
+
+        await self.async_merge_days(
+            [{"date": date_str, **day} for date_str, day in legacy.get("days", {}).items()]
+        )
+        if not self.backfill_cursor:
+            self.backfill_cursor = legacy.get("backfill_cursor")
+            self.backfill_complete = legacy.get("backfill_complete", False)
+            await self.async_save()
+
+        await self._legacy_store.async_remove()
+        _LOGGER.info("Migrated %s history days to the local store", len(legacy.get("days", {})))
+
+    async def async_close(self):
+        """Close the store."""
+        if self._loaded:
+            await self.hass.async_add_executor_job(self._store.close)
+            self._loaded = False
+
+    async def async_save(self):
+        """Persist the backfill progress."""
+        await self.hass.async_add_executor_job(
+            self._store.set_meta,
+            "backfill",
+            {"cursor": self.backfill_cursor, "complete": self.backfill_complete},
+        )
+
+    async def async_save_activity_hours(self, activity_hours):
+        """Persist the hours in which polling has seen drinks change."""
+        self.activity_hours = list(activity_hours)
+        await self.hass.async_add_executor_job(self._store.set_meta, "activity_hours", self.activity_hours)
+
+    async def async_save_snapshot(self, data):
+        """Persist the parts of the coordinator data that are not kept as rows."""
+        snapshot = {
+            "saved": datetime.now().isoformat(),
+            "data": {key: data[key] for key in SNAPSHOT_KEYS if key in data},
+        }
+        await self.hass.async_add_executor_job(self._store.set_meta, "snapshot", snapshot)
+
+    async def async_merge_days(self, days):
+        """Upsert summary days and return the days that changed."""
+        changed = []
+        for day in days:
+            date_str = day.get("date")
+            if not date_str:
+                continue
+            compact = _compact_day(day)
+            if self.days.get(date_str) != compact:
+                self.days[date_str] = compact
+                self.dates.add(date_str)
+                changed.append({"date": date_str, **compact})
+
+        if changed:
+            await self.hass.async_add_executor_job(self._store.upsert_days, changed)
+        return changed
+
+    @callback
+    def async_get_days(self, start=None, end=None):
+        """Return summary days between two date strings (inclusive), oldest first."""
+        return [
+            {"date": date_str, **self.days[date_str]}
+            for date_str in self.dates.range(start, end)
+            if date_str in self.days
+        ]
+
+    async def async_set_activity(self, date_str, drinks):
+        """Replace the stored drinks for a day with those from an activity response."""
+        rows = activity_to_rows(drinks)
+        await self.hass.async_add_executor_job(self._store.replace_activity, date_str, rows)
+        for listener in self._activity_listeners:
+            listener(date_str, rows)
+
+    async def async_get_activity(self, start=None, end=None, drink_id=None):
+        """Return stored drinks between two date strings (inclusive)."""
+        return await self.hass.async_add_executor_job(self._store.get_activity, start, end, drink_id)
+
+    async def async_set_sleep_quality(self, date_str, quality):
+        """Upsert the sleep quality for a day."""
+        if self.sleep.get(date_str) == quality:
+            return
+        self.sleep[date_str] = quality
+        self.dates.add(date_str)
+        await self.hass.async_add_executor_job(self._store.set_sleep_quality, date_str, quality)
+
+    async def async_remove(self):
+        """Remove the stored history."""
+        await self.hass.async_add_executor_job(self._store.remove)
+        await self._legacy_store.async_remove()
+        self._loaded = False
@@ -0,0 +1,148 @@
+"""
+Per-endpoint request metrics for the Drinkaware integration.
+"""
+import logging
+import re
+from bisect import bisect_left
+from collections import Counter
+from urllib.parse import urlparse
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the latency histogram buckets; slower requests fall in the last one
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STATUS_TIMEOUT = "timeout"
+STATUS_CLIENT_ERROR = "client_error"
+
+_DATE_SEGMENT = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[0-9A-Fa-f-]{8,}$")
+
+
+def endpoint_name(url):
+    """Return a URL's path with dates and IDs replaced, so calls to one endpoint share a name."""
+    segments = []
+    for segment in urlparse(url).path.split("/"):
+        if _DATE_SEGMENT.match(segment):
+            segment = "{date}"
+        elif _ID_SEGMENT.match(segment):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class EndpointMetrics:
+    """Counters for the requests made to one endpoint."""
+
+    def __init__(self):
+        """Initialize the counters."""
+        self.requests = 0
+        self.statuses = Counter()  # Status code, or timeout/client_error -> requests
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.bytes_received = 0
+        self.retries = 0  # Requests repeated after a 429
+        self.rate_limit_wait = 0.0  # Seconds slept before those retries
+
+    @property
+    def latency_mean(self):
+        """Return the mean latency in seconds, or None before the first response."""
+        timed = sum(self.latency_buckets)
+        return self.latency_total / timed if timed else None
+
+    def as_dict(self):
+        """Return the counters for diagnostics and attributes."""
+        histogram = {f"le_{bound:g}s": count for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets)}
+        histogram[f"gt_{LATENCY_BUCKETS[-1]:g}s"] = self.latency_buckets[-1]
+        mean = self.latency_mean
+        return {
+            "requests": self.requests,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items(), key=str)},
+            "latency_mean_ms": round(mean * 1000, 1) if mean is not None else None,
+            "latency_max_ms": round(self.latency_max * 1000, 1),
+            "latency_histogram": histogram,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait, 1),
+        }
+
+
+class RequestMetrics:
+    """Request counts, status codes, latencies and sizes for one account, split by endpoint."""
+
+    def __init__(self):
+        """Initialize the metrics."""
+        self.endpoints = {}  # Endpoint name -> EndpointMetrics
+        self.token_refreshes = 0
+        self.token_refresh_failures = 0
+
+    def endpoint(self, url):
+        """Return the counters for the endpoint a URL belongs to."""
+        name = endpoint_name(url)
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    @callback
+    def async_record_response(self, url, status, latency, size):
+        """Record a response and how long it took to arrive."""
+        metrics = self.endpoint(url)
+        metrics.requests += 1
+        metrics.statuses[status] += 1
+        metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        metrics.latency_total += latency
+        metrics.latency_max = max(metrics.latency_max, latency)
+        metrics.bytes_received += size
+
+    @callback
+    def async_record_error(self, url, error):
+        """Record a request that got no response."""
+        metrics = self.endpoint(url)
+        metrics.requests += 1
+        metrics.statuses[error] += 1
+
+    @callback
+    def async_record_retry(self, url, wait):
+        """Record a request repeated after waiting out a 429."""
+        metrics = self.endpoint(url)
+        metrics.retries += 1
+        metrics.rate_limit_wait += wait
+
+    @callback
+    def async_record_token_refresh(self, success):
+        """Record an attempt to refresh the access token."""
+        self.token_refreshes += 1
+        if not success:
+            self.token_refresh_failures += 1
+
+    def totals(self):
+        """Return the counters summed over every endpoint."""
+        endpoints = self.endpoints.values()
+        timed = sum(sum(metrics.latency_buckets) for metrics in endpoints)
+        latency_total = sum(metrics.latency_total for metrics in endpoints)
+        return {
+            "requests": sum(metrics.requests for metrics in endpoints),
+            "errors": sum(
+                count
+                for metrics in endpoints
+                for status, count in metrics.statuses.items()
+                if not isinstance(status, int) or status >= 400
+            ),
+            "latency_mean_ms": round(1000 * latency_total / timed, 1) if timed else None,
+            "bytes_received": sum(metrics.bytes_received for metrics in endpoints),
+            "retries": sum(metrics.retries for metrics in endpoints),
+            "rate_limit_wait_seconds": round(sum(metrics.rate_limit_wait for metrics in endpoints), 1),
+            "token_refreshes": self.token_refreshes,
+            "token_refresh_failures": self.token_refresh_failures,
+        }
+
+    def as_dict(self):
+        """Return the totals and per-endpoint counters for diagnostics."""
+        return {
+            "totals": self.totals(),
+            "endpoints": {name: metrics.as_dict() for name, metrics in sorted(self.endpoints.items())},
+        }
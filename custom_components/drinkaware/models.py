@@ -0,0 +1,268 @@
+"""
+Compact models for the Drinkaware API payloads the integration keeps.
+
+Responses are parsed into these once, when they are fetched, keeping only
+the fields sensors, services and schemas use. IDs, dates and titles repeat
+across days, drinks and accounts, so they are interned and shared.
+"""
+import sys
+from dataclasses import dataclass
+
+# Assessment score attribute name -> API field, in the order they are shown
+ASSESSMENT_SCORES = (
+    ("Frequency", "frequencyScore"),
+    ("Units", "unitNumberScore"),
+    ("Binge Frequency", "bingeFrequencyScore"),
+    ("Unable to Stop", "unableToStopScore"),
+    ("Expectations", "expectationScore"),
+    ("Morning Drinking", "morningScore"),
+    ("Guilt", "guiltScore"),
+    ("Memory Loss", "memoryLossScore"),
+    ("Injury", "injuryScore"),
+    ("Concerns from Others", "relativeConcernedScore"),
+)
+
+
+def _intern(value):
+    """Return the shared copy of a string, or the value unchanged if it isn't one."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True, frozen=True)
+class DaySummary:
+    """Drinks and units logged on one day."""
+
+    date: str
+    drinks: int = 0
+    units: float = 0
+    drink_free_day: bool = True
+
+    @classmethod
+    def from_api(cls, day):
+        """Parse a day from a summary response, or from a stored history row."""
+        return cls(
+            date=_intern(day.get("date")),
+            drinks=day.get("drinks") or 0,
+            units=day.get("units") or 0,
+            drink_free_day=day.get("drinkFreeDay", True),
+        )
+
+    def to_api(self):
+        """Return the day in the summary response shape."""
+        return {"date": self.date, "drinks": self.drinks, "units": self.units, "drinkFreeDay": self.drink_free_day}
+
+
+@dataclass(slots=True, frozen=True)
+class Goal:
+    """A goal and the progress towards it."""
+
+    type: str
+    target: int = 0
+    progress: int = 0
+    start_date: str = None
+
+    @classmethod
+    def from_api(cls, goal):
+        """Parse a goal from a goals response."""
+        return cls(
+            type=_intern(goal.get("type")),
+            target=goal.get("target") or 0,
+            progress=goal.get("progress") or 0,
+            start_date=goal.get("startDate"),
+        )
+
+    def to_api(self):
+        """Return the goal in the goals response shape."""
+        return {"type": self.type, "target": self.target, "progress": self.progress, "startDate": self.start_date}
+
+
+@dataclass(slots=True, frozen=True)
+class Stats:
+    """Tracking totals and streaks."""
+
+    drink_free_days: int = 0
+    drink_free_streak: int = 0
+    drink_free_streak_highest: int = 0
+    days_tracked: int = 0
+    days_tracked_streak: int = 0
+    days_tracked_streak_highest: int = 0
+    goals_achieved: int = 0
+    tracking_since: str = None
+
+    @classmethod
+    def from_api(cls, stats):
+        """Parse a stats response."""
+        drink_free = stats.get("drinkFreeDays") or {}
+        tracked = stats.get("daysTracked") or {}
+        return cls(
+            drink_free_days=drink_free.get("total", 0),
+            drink_free_streak=drink_free.get("streakCurrent", 0),
+            drink_free_streak_highest=drink_free.get("streakHighest", 0),
+            days_tracked=tracked.get("total", 0),
+            days_tracked_streak=tracked.get("streakCurrent", 0),
+            days_tracked_streak_highest=tracked.get("streakHighest", 0),
+            goals_achieved=stats.get("goalsAchieved", 0),
+            tracking_since=stats.get("trackingSince"),
+        )
+
+    def to_api(self):
+        """Return the stats in the stats response shape."""
+        return {
+            "drinkFreeDays": {
+                "total": self.drink_free_days,
+                "streakCurrent": self.drink_free_streak,
+                "streakHighest": self.drink_free_streak_highest,
+            },
+            "daysTracked": {
+                "total": self.days_tracked,
+                "streakCurrent": self.days_tracked_streak,
+                "streakHighest": self.days_tracked_streak_highest,
+            },
+            "goalsAchieved": self.goals_achieved,
+            "trackingSince": self.tracking_since,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class Assessment:
+    """The latest self assessment."""
+
+    risk_level: str = None
+    total_score: int = None
+    created: str = None
+    scores: tuple = ()  # Values in ASSESSMENT_SCORES order
+
+    @classmethod
+    def from_api(cls, assessment):
+        """Parse an assessment from a self assessment response."""
+        return cls(
+            risk_level=_intern(assessment.get("riskLevel")),
+            total_score=assessment.get("totalScore"),
+            created=assessment.get("created"),
+            scores=tuple(assessment.get(field) for _, field in ASSESSMENT_SCORES),
+        )
+
+    def score_attributes(self):
+        """Return the individual scores keyed by their attribute names."""
+        return {name: score for (name, _), score in zip(ASSESSMENT_SCORES, self.scores)}
+
+    def to_api(self):
+        """Return the assessment in the self assessment response shape."""
+        return {
+            "riskLevel": self.risk_level,
+            "totalScore": self.total_score,
+            "created": self.created,
+            **{field: score for (_, field), score in zip(ASSESSMENT_SCORES, self.scores)},
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class Measure:
+    """A measure a drink can be served in."""
+
+    measure_id: str
+    title: str = None
+    litres: float = None
+
+    @classmethod
+    def from_api(cls, measure):
+        """Parse a measure from a drink's measure list."""
+        return cls(
+            measure_id=_intern(measure.get("measureId")),
+            title=_intern(measure.get("title")),
+            litres=measure.get("litres"),
+        )
+
+    def to_api(self):
+        """Return the measure in the drinks response shape."""
+        return {"measureId": self.measure_id, "title": self.title, "litres": self.litres}
+
+
+@dataclass(slots=True, frozen=True)
+class Drink:
+    """A standard or custom drink."""
+
+    drink_id: str
+    title: str = None
+    abv: float = None
+    measures: tuple = ()
+    derived_drink_id: str = None  # Standard drink a custom drink is based on
+
+    @classmethod
+    def from_api(cls, drink):
+        """Parse a drink from a drinks, search or custom drink response."""
+        measures = tuple(
+            Measure.from_api(measure) for measure in drink.get("measures") or () if measure.get("measureId")
+        )
+        # Search results carry a single measure inline
+        if not measures and drink.get("measureId"):
+            litres = drink.get("measure")
+            measures = (Measure(
+                measure_id=_intern(drink["measureId"]),
+                title=_intern(drink.get("measureName")),
+                litres=litres if isinstance(litres, (int, float)) else None,
+            ),)
+        return cls(
+            drink_id=_intern(drink.get("drinkId")),
+            title=_intern(drink.get("title")),
+            abv=drink.get("abv"),
+            measures=measures,
+            derived_drink_id=_intern(drink.get("derivedDrinkId")),
+        )
+
+    @property
+    def is_custom(self):
+        """Return True if the drink is a custom drink based on a standard one."""
+        return self.derived_drink_id is not None
+
+    def to_api(self):
+        """Return the drink in the drinks response shape."""
+        drink = {
+            "drinkId": self.drink_id,
+            "title": self.title,
+            "abv": self.abv,
+            "measures": [measure.to_api() for measure in self.measures],
+        }
+        if self.derived_drink_id is not None:
+            drink["derivedDrinkId"] = self.derived_drink_id
+        return drink
+
+
+def as_drink(drink):
+    """Return a Drink, parsing it first if it is still a response dict."""
+    return drink if isinstance(drink, Drink) else Drink.from_api(drink)
+
+
+def parse_days(days):
+    """Parse summary days, skipping any without a date."""
+    return tuple(DaySummary.from_api(day) for day in days if day.get("date"))
+
+
+def parse_search_drinks(search):
+    """Parse the drinks in a search response."""
+    return tuple(Drink.from_api(drink) for drink in search.get("results") or ())
+
+
+def parse_data(raw):
+    """Parse fetched or stored API payloads into coordinator data."""
+    data = {}
+    if raw.get("assessment"):
+        data["assessment"] = Assessment.from_api(raw["assessment"])
+    if raw.get("stats"):
+        data["stats"] = Stats.from_api(raw["stats"])
+    if "goals" in raw:
+        data["goals"] = tuple(Goal.from_api(goal) for goal in raw["goals"] or ())
+    if "summary" in raw:
+        data["summary"] = parse_days(raw["summary"] or ())
+    return data
+
+
+def data_to_api(data):
+    """Return coordinator data in the API response shapes, for storing."""
+    raw = {}
+    for key, value in data.items():
+        if isinstance(value, tuple):
+            raw[key] = [item.to_api() for item in value]
+        else:
+            raw[key] = value.to_api()
+    return raw
@@ -0,0 +1,224 @@
+"""
+Request budget shared by all Drinkaware accounts.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_ORCHESTRATOR, MAX_CONCURRENT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_LOW = "low"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_LOW)
+
+# Task holding a slot, so nested requests in the same task do not queue behind themselves
+_slot_holder = contextvars.ContextVar("drinkaware_slot_holder", default=None)
+# Priority of the requests made by the current work, set for service calls and bulk fetches
+_priority = contextvars.ContextVar("drinkaware_priority", default=PRIORITY_BACKGROUND)
+
+
+class AccountMetrics:
+    """Request counts and timings for one account."""
+
+    def __init__(self):
+        """Initialize the metrics."""
+        self.requests = 0
+        self.interactive_requests = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = None
+
+    def as_dict(self):
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "interactive_requests": self.interactive_requests,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "average_wait_seconds": round(self.total_wait / self.requests, 3) if self.requests else None,
+            "max_wait_seconds": round(self.max_wait, 3),
+            "average_latency_seconds": round(self.total_latency / self.requests, 3) if self.requests else None,
+            "max_latency_seconds": round(self.max_latency, 3),
+            "last_latency_seconds": round(self.last_latency, 3) if self.last_latency is not None else None,
+        }
+
+
+class RequestOrchestrator:
+    """Limit how many API requests all accounts make at once.
+
+    Requests wait in one queue per account. When a slot frees up, waiting
+    service calls are served before background polling, and polling before
+    low priority bulk fetches such as the history backfill. Within each
+    priority the accounts take turns so one busy account cannot starve the rest.
+    """
+
+    def __init__(self, max_in_flight=MAX_CONCURRENT_REQUESTS):
+        """Initialize the orchestrator."""
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self._waiting = {priority: OrderedDict() for priority in PRIORITIES}  # entry id -> deque of futures
+        self._metrics = {}  # entry id -> AccountMetrics
+
+    def metrics(self, entry_id):
+        """Return the metrics for an account."""
+        if entry_id not in self._metrics:
+            self._metrics[entry_id] = AccountMetrics()
+        return self._metrics[entry_id]
+
+    @callback
+    def async_remove_entry(self, entry_id):
+        """Forget an unloaded account's metrics."""
+        self._metrics.pop(entry_id, None)
+
+    def _has_waiters(self):
+        """Return True if any request is queued."""
+        return any(self._waiting[priority] for priority in PRIORITIES)
+
+    async def _async_acquire(self, entry_id, priority):
+        """Wait for a free slot and return how long that took."""
+        if self.in_flight < self.max_in_flight and not self._has_waiters():
+            self.in_flight += 1
+            return 0.0
+
+        metrics = self.metrics(entry_id)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[priority].setdefault(entry_id, deque()).append(future)
+        metrics.queued += 1
+        metrics.max_queued = max(metrics.max_queued, metrics.queued)
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled, so pass it on
+                self._async_release()
+            else:
+                self._discard(entry_id, priority, future)
+            raise
+        finally:
+            metrics.queued -= 1
+        return time.monotonic() - started
+
+    def _discard(self, entry_id, priority, future):
+        """Remove a cancelled request from its account's queue."""
+        queue = self._waiting[priority].get(entry_id)
+        if queue is None:
+            return
+        if future in queue:
+            queue.remove(future)
+        if not queue:
+            del self._waiting[priority][entry_id]
+
+    @callback
+    def _async_release(self):
+        """Hand a finished request's slot to the next account in turn."""
+        for priority in PRIORITIES:
+            waiting = self._waiting[priority]
+            while waiting:
+                entry_id, queue = next(iter(waiting.items()))
+                future = queue.popleft()
+                if queue:
+                    waiting.move_to_end(entry_id)  # Let the other accounts go first next time
+                else:
+                    del waiting[entry_id]
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self, entry_id, interactive=False):
+        """Hold one request slot for an account while the block runs."""
+        task = asyncio.current_task()
+        if _slot_holder.get() is task:
+            # Already inside a slot held by this task
+            yield
+            return
+
+        priority = PRIORITY_INTERACTIVE if interactive else _priority.get()
+        interactive = priority == PRIORITY_INTERACTIVE
+        wait = await self._async_acquire(entry_id, priority)
+
+        metrics = self.metrics(entry_id)
+        metrics.in_flight += 1
+        token = _slot_holder.set(task)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            latency = time.monotonic() - started
+            _slot_holder.reset(token)
+            metrics.in_flight -= 1
+            metrics.requests += 1
+            metrics.interactive_requests += interactive
+            metrics.total_wait += wait
+            metrics.max_wait = max(metrics.max_wait, wait)
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            metrics.last_latency = latency
+            self._async_release()
+
+    async def async_run_interactive(self, jobs):
+        """Run coroutines concurrently as service call work, bounded by the request budget."""
+        with interactive_requests():
+            # Tasks copy the current context, so their requests are queued as interactive
+            tasks = [asyncio.ensure_future(job) for job in jobs]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def as_dict(self):
+        """Return the request budget and per account metrics for diagnostics."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queued": {
+                priority: sum(len(queue) for queue in self._waiting[priority].values())
+                for priority in PRIORITIES
+            },
+            "accounts": {entry_id: metrics.as_dict() for entry_id, metrics in self._metrics.items()},
+        }
+
+
+@contextmanager
+def interactive_requests():
+    """Queue the requests made in this context ahead of background polling.
+
+    Each request still takes its own slot, so waits between requests do not
+    hold one.
+    """
+    token = _priority.set(PRIORITY_INTERACTIVE)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextmanager
+def low_priority_requests():
+    """Queue the requests made in this context behind background polling."""
+    token = _priority.set(PRIORITY_LOW)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@callback
+def async_get_orchestrator(hass: HomeAssistant):
+    """Return the request orchestrator shared by all accounts."""
+    if DATA_ORCHESTRATOR not in hass.data:
+        hass.data[DATA_ORCHESTRATOR] = RequestOrchestrator()
+    return hass.data[DATA_ORCHESTRATOR]
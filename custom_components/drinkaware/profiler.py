@@ -0,0 +1,110 @@
+"""
+Per-phase timing of Drinkaware refreshes.
+"""
+import contextvars
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from homeassistant.util import dt as dt_util
+
+from .const import PROFILE_HISTORY_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+# The refresh being timed; background fetches started during it inherit it and add their phases
+_current_profile = contextvars.ContextVar("drinkaware_refresh_profile", default=None)
+
+
+class RefreshProfile:
+    """Time spent in each phase of one refresh."""
+
+    def __init__(self):
+        """Initialize the profile."""
+        self.started = dt_util.utcnow()
+        self.total = None  # Seconds, once the refresh has finished
+        self.phases = {}  # Phase -> seconds, in the order first seen
+        self._started = time.monotonic()
+
+    def add(self, phase, seconds):
+        """Add time to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def as_dict(self):
+        """Return the profile for diagnostics."""
+        return {
+            "started": self.started.isoformat(),
+            "total_seconds": round(self.total, 3) if self.total is not None else None,
+            "phases": {phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+        }
+
+
+class RefreshProfiler:
+    """Keep the per-phase timings of an account's recent refreshes.
+
+    Phases are timed where they run, so a rate-limit wait inside a fetch is
+    counted both as "sleep" and as part of that fetch. Activity and catalog
+    fetches run in the background and are added to the refresh that started
+    them when they finish, which may be after its total was recorded.
+    """
+
+    def __init__(self, name, size=PROFILE_HISTORY_SIZE, slow_threshold=None):
+        """Initialize the profiler."""
+        self.name = name
+        self.history = deque(maxlen=size)
+        self.slow_threshold = slow_threshold  # Seconds, or None to never warn
+
+    @property
+    def last(self):
+        """Return the most recent refresh profile, or None."""
+        return self.history[-1] if self.history else None
+
+    @contextmanager
+    def refresh(self):
+        """Time a refresh; a refresh retried from inside another is timed as part of it."""
+        profile = _current_profile.get()
+        if profile is not None:
+            yield profile
+            return
+
+        profile = RefreshProfile()
+        token = _current_profile.set(profile)
+        try:
+            yield profile
+        finally:
+            _current_profile.reset(token)
+            profile.total = time.monotonic() - profile._started
+            self.history.append(profile)
+            if self.slow_threshold and profile.total > self.slow_threshold:
+                _LOGGER.warning(
+                    "Refreshing %s took %.1fs, over the %.1fs threshold (%s)",
+                    self.name,
+                    profile.total,
+                    self.slow_threshold,
+                    ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in profile.phases.items()),
+                )
+
+    @staticmethod
+    @contextmanager
+    def phase(name):
+        """Time a phase of the refresh in progress, if there is one."""
+        profile = _current_profile.get()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.add(name, time.monotonic() - started)
+
+    def as_dict(self):
+        """Return the recent profiles and the mean time per phase for diagnostics."""
+        totals = {}
+        for profile in self.history:
+            for phase, seconds in profile.phases.items():
+                totals.setdefault(phase, []).append(seconds)
+        return {
+            "slow_threshold_seconds": self.slow_threshold,
+            "phase_means": {phase: round(sum(times) / len(times), 3) for phase, times in totals.items()},
+            "refreshes": [profile.as_dict() for profile in self.history],
+        }
@@ -0,0 +1,252 @@
+"""
+Staggered, adaptive polling schedule for the Drinkaware integration.
+"""
+import logging
+import random
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_SCHEDULER,
+    SCAN_INTERVAL_HOURS,
+    POLL_JITTER_SECONDS,
+    POLL_MIN_DELAY_SECONDS,
+    POLL_MIN_INTERVAL_MINUTES,
+    POLL_ACTIVE_INTERVAL_MINUTES,
+    POLL_MAX_INTERVAL_HOURS,
+    POLL_SNAP_BACK_MINUTES,
+    POLL_DEFAULT_ACTIVE_HOURS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Changes that must be seen before the learned hours replace the default ones
+MIN_OBSERVED_CHANGES = 5
+# Summary days needed for a weekday before it can be treated as a quiet day
+MIN_WEEKDAY_SAMPLES = 4
+# Weekdays with drinks on fewer of their days than this are quiet
+QUIET_WEEKDAY_RATIO = 0.2
+# Doublings of the interval allowed while nothing changes
+MAX_BACKOFF_STEPS = 8
+
+
+class AdaptivePolling:
+    """Pick an account's polling interval from when its drinks usually change.
+
+    Polls are faster in the hours changes have been seen before, back off
+    exponentially while polls show no change, and return to the minimum
+    interval for a while after the integration writes to the account.
+    """
+
+    def __init__(
+        self,
+        base=timedelta(hours=SCAN_INTERVAL_HOURS),
+        active=timedelta(minutes=POLL_ACTIVE_INTERVAL_MINUTES),
+        minimum=timedelta(minutes=POLL_MIN_INTERVAL_MINUTES),
+        maximum=timedelta(hours=POLL_MAX_INTERVAL_HOURS),
+    ):
+        """Initialize the adaptive polling."""
+        self.base = base
+        self.active = active
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = base
+        self.activity_hours = [0] * 24  # Local hour -> changes seen in that hour
+        self.unchanged_polls = 0
+        self._weekdays = [(0, 0)] * 7  # Weekday -> (days with drinks, days tracked)
+        self._last_summary = None
+        self._fast_until = None
+
+    @callback
+    def async_learn(self, activity_hours=None, days=None):
+        """Learn from stored activity hours and daily summaries."""
+        if activity_hours and len(activity_hours) == 24:
+            self.activity_hours = list(activity_hours)
+
+        weekdays = [[0, 0] for _ in range(7)]
+        for date_str, day in (days or {}).items():
+            try:
+                weekday = dt_util.parse_date(date_str).weekday()
+            except (TypeError, ValueError, AttributeError):
+                continue
+            weekdays[weekday][0] += (day.get("drinks") or 0) > 0
+            weekdays[weekday][1] += 1
+        self._weekdays = [tuple(counts) for counts in weekdays]
+
+    @callback
+    def async_record_poll(self, summary, now=None):
+        """Record a poll's summary days and return True if drinks changed since the last poll."""
+        days = {day.date: (day.drinks, day.units) for day in summary}
+        previous, self._last_summary = self._last_summary, days
+        if previous is None:
+            return False
+
+        # The window moving on to a new day is not a change unless that day already has drinks
+        changed = any(
+            previous.get(date_str, (0, 0)) != value
+            for date_str, value in days.items()
+            if date_str in previous or value[0]
+        )
+        if not changed:
+            self.unchanged_polls += 1
+            return False
+
+        self.unchanged_polls = 0
+        self.activity_hours[dt_util.as_local(now or dt_util.utcnow()).hour] += 1
+        return True
+
+    @callback
+    def async_snap_back(self, now=None):
+        """Poll at the minimum interval for a while after a write."""
+        self.unchanged_polls = 0
+        self._fast_until = (now or dt_util.utcnow()) + timedelta(minutes=POLL_SNAP_BACK_MINUTES)
+
+    def is_active(self, now):
+        """Return True if drinks are usually logged around this time."""
+        local = dt_util.as_local(now)
+        drinking_days, tracked_days = self._weekdays[local.weekday()]
+        if tracked_days >= MIN_WEEKDAY_SAMPLES and drinking_days / tracked_days < QUIET_WEEKDAY_RATIO:
+            return False
+
+        if sum(self.activity_hours) < MIN_OBSERVED_CHANGES:
+            return local.hour in POLL_DEFAULT_ACTIVE_HOURS
+
+        # Count the next hour too so polling speeds up just before a busy hour
+        busiest = max(self.activity_hours)
+        seen = max(self.activity_hours[local.hour], self.activity_hours[(local.hour + 1) % 24])
+        return seen * 4 >= busiest
+
+    @callback
+    def async_next_interval(self, now=None):
+        """Work out and remember the interval before the next poll."""
+        now = now or dt_util.utcnow()
+        if self._fast_until is not None and now < self._fast_until:
+            interval = self.minimum
+        else:
+            interval = self.active if self.is_active(now) else self.base
+            interval *= 2 ** min(self.unchanged_polls, MAX_BACKOFF_STEPS)
+
+        self.interval = max(self.minimum, min(interval, self.maximum))
+        return self.interval
+
+    def as_dict(self):
+        """Return the adaptive state for diagnostics."""
+        return {
+            "interval_seconds": self.interval.total_seconds(),
+            "unchanged_polls": self.unchanged_polls,
+            "activity_hours": list(self.activity_hours),
+            "fast_until": self._fast_until.isoformat() if self._fast_until else None,
+        }
+
+
+class PollingScheduler:
+    """Spread account refreshes evenly across the polling interval.
+
+    Each account gets a slot based on its position among the sorted entry ids,
+    so the schedule is the same after every restart. Slots are measured from
+    the Unix epoch, and each refresh is moved by a small random jitter. An
+    account polling at its own adaptive interval keeps the same relative slot
+    within that interval.
+    """
+
+    def __init__(self, interval=timedelta(hours=SCAN_INTERVAL_HOURS), jitter=POLL_JITTER_SECONDS):
+        """Initialize the scheduler."""
+        self.interval = interval
+        self._jitter = jitter
+        self._entries = []  # Sorted entry ids
+        self._next_refresh = {}  # entry id -> next scheduled refresh
+        self._polling = {}  # entry id -> AdaptivePolling
+
+    @callback
+    def async_add_entry(self, entry_id):
+        """Give an account a slot in the schedule."""
+        if entry_id not in self._entries:
+            self._entries = sorted(self._entries + [entry_id])
+        if entry_id not in self._polling:
+            self._polling[entry_id] = AdaptivePolling(base=self.interval)
+
+    @callback
+    def async_remove_entry(self, entry_id):
+        """Free an account's slot, spreading the others again."""
+        if entry_id in self._entries:
+            self._entries = [other for other in self._entries if other != entry_id]
+        self._next_refresh.pop(entry_id, None)
+        self._polling.pop(entry_id, None)
+
+    def polling(self, entry_id):
+        """Return an account's adaptive polling, or None if it has no slot."""
+        return self._polling.get(entry_id)
+
+    @callback
+    def async_snap_back(self, entry_id):
+        """Poll an account quickly for a while after a write."""
+        if entry_id in self._polling:
+            self._polling[entry_id].async_snap_back()
+
+    def _slot_width(self, interval=None):
+        """Return the seconds between neighbouring slots."""
+        return (interval or self.interval).total_seconds() / max(len(self._entries), 1)
+
+    def offset(self, entry_id, interval=None):
+        """Return an account's offset into the interval in seconds."""
+        if entry_id not in self._entries:
+            return 0.0
+        return self._entries.index(entry_id) * self._slot_width(interval)
+
+    @callback
+    def async_next_refresh(self, entry_id, now=None, interval=None):
+        """Work out and remember when an account should next refresh."""
+        now = now or dt_util.utcnow()
+        jitter = min(self._jitter, self._slot_width(interval) / 4)
+        interval = (interval or self.interval).total_seconds()
+
+        timestamp = now.timestamp()
+        slot_start = timestamp - (timestamp % interval) + self.offset(entry_id, timedelta(seconds=interval))
+        next_refresh = slot_start + random.uniform(-jitter, jitter)
+        while next_refresh - timestamp < POLL_MIN_DELAY_SECONDS:
+            next_refresh += interval
+
+        self._next_refresh[entry_id] = dt_util.utc_from_timestamp(next_refresh)
+        return self._next_refresh[entry_id]
+
+    @callback
+    def async_delay_until_next_refresh(self, entry_id, now=None, interval=None):
+        """Return how long an account should wait before its next refresh."""
+        now = now or dt_util.utcnow()
+        return self.async_next_refresh(entry_id, now, interval) - now
+
+    @callback
+    def async_delay_until_next_poll(self, entry_id, now=None):
+        """Return the delay before an account's next refresh at its adaptive interval."""
+        now = now or dt_util.utcnow()
+        polling = self._polling.get(entry_id)
+        interval = polling.async_next_interval(now) if polling else None
+        return self.async_delay_until_next_refresh(entry_id, now, interval)
+
+    def as_dict(self):
+        """Return the schedule for diagnostics."""
+        return {
+            "interval_seconds": self.interval.total_seconds(),
+            "slot_seconds": round(self._slot_width(), 1),
+            "jitter_seconds": min(self._jitter, self._slot_width() / 4),
+            "entries": {
+                entry_id: {
+                    "offset_seconds": round(self.offset(entry_id), 1),
+                    "next_refresh": (
+                        self._next_refresh[entry_id].isoformat() if entry_id in self._next_refresh else None
+                    ),
+                    "adaptive": self._polling[entry_id].as_dict() if entry_id in self._polling else None,
+                }
+                for entry_id in self._entries
+            },
+        }
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant):
+    """Return the polling scheduler shared by all accounts."""
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = PollingScheduler()
+    return hass.data[DATA_SCHEDULER]
@@ -12,10 +12,10 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
@@ -31,11 +31,14 @@ from .const import (
     GOAL_PROGRESS,
     WEEKLY_UNITS,
     LAST_DRINK_DATE,
+    BREAKDOWN_WINDOWS,
     RISK_LEVEL_LOW,
     RISK_LEVEL_INCREASING,
     RISK_LEVEL_HIGH,
     RISK_LEVEL_DEPENDENCY,
 )
+from .analytics import GROUP_DRINK_TYPE, GROUP_MEASURE
+from .drink_constants import DRINK_TYPE_NAMES, MEASURE_DESCRIPTIONS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,6 +113,40 @@ SENSOR_DESCRIPTIONS = [
     ),
 ]
 
+# Optional diagnostic sensors for the account's API traffic, keyed by RequestMetrics totals
+REQUEST_METRIC_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key="requests",
+        name="API Requests",
+        icon="mdi:api",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="latency_mean_ms",
+        name="API Latency",
+        icon="mdi:timer-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    ),
+    SensorEntityDescription(
+        key="bytes_received",
+        name="API Data Received",
+        icon="mdi:download-network",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+    ),
+]
+
+# Optional diagnostic sensor for the account's current adaptive polling interval
+POLLING_INTERVAL_DESCRIPTION = SensorEntityDescription(
+    key="polling_interval",
+    name="Polling Interval",
+    icon="mdi:timer-sync-outline",
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.MINUTES,
+)
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -142,10 +179,59 @@ async def async_setup_entry(
     for description in SENSOR_DESCRIPTIONS:
         entities.append(DrinkAwareSensor(coordinator, description))
 
+    entities.extend(_create_breakdown_sensors(coordinator))
+
+    for description in REQUEST_METRIC_DESCRIPTIONS:
+        entities.append(DrinkAwareRequestMetricSensor(coordinator, description))
+    entities.append(DrinkAwarePollingIntervalSensor(coordinator, POLLING_INTERVAL_DESCRIPTION))
+
     async_add_entities(entities, True)
 
 
-class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
+def _create_breakdown_sensors(coordinator):
+    """Create unit breakdown sensors for each rolling window."""
+    entities = []
+    for window in BREAKDOWN_WINDOWS:
+        for drink_type, type_name in DRINK_TYPE_NAMES.items():
+            entities.append(DrinkAwareBreakdownSensor(
+                coordinator, window, GROUP_DRINK_TYPE, drink_type, f"{window.title()} {type_name} Units"
+            ))
+        entities.append(DrinkAwareBreakdownSensor(
+            coordinator, window, GROUP_MEASURE, None, f"{window.title()} Units by Measure"
+        ))
+    return entities
+
+
+class DrinkAwareBaseSensor(CoordinatorEntity, SensorEntity):
+    """Coordinator sensor that only writes its state when it has changed."""
+
+    _last_fingerprint = None
+
+    def _state_inputs(self):
+        """Return the data the attributes are built from, compared instead of the attributes."""
+        return self.coordinator.data
+
+    def _state_fingerprint(self):
+        """Return the value and its inputs, for comparison with those of the last write."""
+        return (bool(self.available), self.native_value, self._state_inputs())
+
+    def _update_attributes(self):
+        """Rebuild attributes kept between writes, before a write."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the value or its inputs changed since the last write."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            self.coordinator.suppressed_writes += 1
+            return
+
+        self._last_fingerprint = fingerprint
+        self._update_attributes()
+        self.async_write_ha_state()
+
+
+class DrinkAwareSensor(DrinkAwareBaseSensor):
     """Representation of a Drinkaware sensor."""
 
     def __init__(
@@ -193,7 +279,7 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         if "assessment" not in self.coordinator.data:
             return None
 
-        risk_level = self.coordinator.data["assessment"].get("riskLevel")
+        risk_level = self.coordinator.data["assessment"].risk_level
         return RISK_LEVELS.get(risk_level, risk_level)
 
     def _get_total_score_value(self):
@@ -201,35 +287,35 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         if "assessment" not in self.coordinator.data:
             return None
 
-        return self.coordinator.data["assessment"].get("totalScore")
+        return self.coordinator.data["assessment"].total_score
 
     def _get_drink_free_days_value(self):
         """Get drink free days sensor value."""
         if "stats" not in self.coordinator.data:
             return None
 
-        return self.coordinator.data["stats"].get("drinkFreeDays", {}).get("total", 0)
+        return self.coordinator.data["stats"].drink_free_days
 
     def _get_drink_free_streak_value(self):
         """Get drink free streak sensor value."""
         if "stats" not in self.coordinator.data:
             return None
 
-        return self.coordinator.data["stats"].get("drinkFreeDays", {}).get("streakCurrent", 0)
+        return self.coordinator.data["stats"].drink_free_streak
 
     def _get_days_tracked_value(self):
         """Get days tracked sensor value."""
         if "stats" not in self.coordinator.data:
             return None
 
-        return self.coordinator.data["stats"].get("daysTracked", {}).get("total", 0)
+        return self.coordinator.data["stats"].days_tracked
 
     def _get_goals_achieved_value(self):
         """Get goals achieved sensor value."""
         if "stats" not in self.coordinator.data:
             return None
 
-        return self.coordinator.data["stats"].get("goalsAchieved", 0)
+        return self.coordinator.data["stats"].goals_achieved
 
     def _get_goal_progress_value(self):
         """Get goal progress sensor value."""
@@ -237,9 +323,9 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
             return None
 
         for goal in self.coordinator.data["goals"]:
-            if goal.get("type") == "drinkFreeDays":
-                if goal.get("target", 0) > 0:
-                    return round((goal.get("progress", 0) / goal.get("target", 1)) * 100)
+            if goal.type == "drinkFreeDays":
+                if goal.target > 0:
+                    return round((goal.progress / goal.target) * 100)
         return 0
 
     def _get_weekly_units_value(self):
@@ -260,10 +346,9 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
         # Filter and sum only the units from the last 7 days
         for day in self.coordinator.data["summary"]:
-            day_date = day.get("date", "")
             # Include only dates that are within the last 7 days
-            if day_date >= six_days_ago and day_date <= today:
-                total_units += day.get("units", 0)
+            if day.date >= six_days_ago and day.date <= today:
+                total_units += day.units
 
         return round(total_units, 1)
 
@@ -274,17 +359,35 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
         last_drink_date = None
         for day in self.coordinator.data["summary"]:
-            if not day.get("drinkFreeDay", True):
-                date_str = day.get("date")
-                if date_str:
-                    try:
-                        date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                        if last_drink_date is None or date > last_drink_date:
-                            last_drink_date = date
-                    except ValueError:
-                        pass
+            if not day.drink_free_day:
+                try:
+                    date = datetime.strptime(day.date, "%Y-%m-%d").date()
+                    if last_drink_date is None or date > last_drink_date:
+                        last_drink_date = date
+                except ValueError:
+                    pass
+
+        # Fall back to the local history if there were no drinks in the recent summary
+        if last_drink_date is None:
+            last_drink_date = self._get_history_last_drink_date()
         return last_drink_date
 
+    def _get_history_last_drink_date(self):
+        """Get the most recent drinking day from the local history."""
+        history = getattr(self.coordinator, "history", None)
+        if not history or not history.days:
+            return None
+
+        # The dates are kept sorted, so this stops at the most recent drinking day
+        for date_str in reversed(history.dates):
+            day = history.days.get(date_str)
+            if day is not None and not day.get("drinkFreeDay", True):
+                try:
+                    return datetime.strptime(date_str, "%Y-%m-%d").date()
+                except ValueError:
+                    continue
+        return None
+
     def _get_drinks_today_value(self):
         """Get drinks today sensor value."""
         if "summary" not in self.coordinator.data:
@@ -292,8 +395,8 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
         today = datetime.now().strftime("%Y-%m-%d")
         for day in self.coordinator.data["summary"]:
-            if day.get("date") == today:
-                return day.get("drinks", 0)
+            if day.date == today:
+                return day.drinks
         return 0
 
     async def async_update(self):
@@ -306,6 +409,21 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         self._update_attributes()
         await super().async_update()
 
+        # State is written after a manual update, so compare against it next time
+        self._last_fingerprint = None
+
+    def _state_inputs(self):
+        """Return the coordinator data and the other account data the attributes read."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        history = getattr(self.coordinator, "history", None)
+        return (
+            self.coordinator.data,
+            today,  # The weekly attributes move with the date
+            self.coordinator.catalog,
+            getattr(self.coordinator, "_activity_cache", {}).get(today),
+            history.dates[0] if history and history.dates else None,
+        )
+
     async def _update_today_drink_details(self):
         """Update drink details for today if needed."""
         today = datetime.now().strftime("%Y-%m-%d")
@@ -319,7 +437,12 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
                 self.coordinator._activity_cache = {}
 
             # Refresh the activity data for today
-            self.coordinator._activity_cache[today] = await self.coordinator._fetch_activity_for_day(today)
+            activity = await self.coordinator._fetch_activity_for_day(today)
+            self.coordinator._activity_cache[today] = activity
+
+            # Keep the local store in step with what we fetched
+            if activity:
+                await self.coordinator.history.async_set_activity(today, self._get_drinks_from_activity(activity))
 
     def _check_if_fetch_needed(self, today):
         """Check if we need to fetch detailed drink data for today."""
@@ -328,7 +451,7 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
         if "summary" in self.coordinator.data:
             for day in self.coordinator.data["summary"]:
-                if day.get("date") == today and day.get("drinks", 0) > 0:
+                if day.date == today and day.drinks > 0:
                     return True
         return False
 
@@ -356,42 +479,30 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
             return
 
         assessment = self.coordinator.data["assessment"]
-        scores = {
-            "Frequency": assessment.get("frequencyScore"),
-            "Units": assessment.get("unitNumberScore"),
-            "Binge Frequency": assessment.get("bingeFrequencyScore"),
-            "Unable to Stop": assessment.get("unableToStopScore"),
-            "Expectations": assessment.get("expectationScore"),
-            "Morning Drinking": assessment.get("morningScore"),
-            "Guilt": assessment.get("guiltScore"),
-            "Memory Loss": assessment.get("memoryLossScore"),
-            "Injury": assessment.get("injuryScore"),
-            "Concerns from Others": assessment.get("relativeConcernedScore"),
-        }
-        self._attributes.update(scores)
-        self._attributes["Assessment Date"] = assessment.get("created")
+        self._attributes.update(assessment.score_attributes())
+        self._attributes["Assessment Date"] = assessment.created
 
     def _update_drink_free_days_attributes(self):
         """Update attributes for drink free days sensor."""
         if "stats" not in self.coordinator.data:
             return
 
-        self._attributes["Highest Streak"] = (
-            self.coordinator.data["stats"].get("drinkFreeDays", {}).get("streakHighest", 0)
-        )
+        self._attributes["Highest Streak"] = self.coordinator.data["stats"].drink_free_streak_highest
 
     def _update_days_tracked_attributes(self):
         """Update attributes for days tracked sensor."""
         if "stats" not in self.coordinator.data:
             return
 
-        self._attributes["Current Streak"] = (
-            self.coordinator.data["stats"].get("daysTracked", {}).get("streakCurrent", 0)
-        )
-        self._attributes["Highest Streak"] = (
-            self.coordinator.data["stats"].get("daysTracked", {}).get("streakHighest", 0)
-        )
-        self._attributes["Tracking Since"] = self.coordinator.data["stats"].get("trackingSince")
+        stats = self.coordinator.data["stats"]
+        self._attributes["Current Streak"] = stats.days_tracked_streak
+        self._attributes["Highest Streak"] = stats.days_tracked_streak_highest
+        self._attributes["Tracking Since"] = stats.tracking_since
+
+        # Show how far back the locally stored history goes
+        history = getattr(self.coordinator, "history", None)
+        if history and history.dates:
+            self._attributes["History Since"] = history.dates[0]
 
     def _update_goal_progress_attributes(self):
         """Update attributes for goal progress sensor."""
@@ -399,10 +510,10 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
             return
 
         for goal in self.coordinator.data["goals"]:
-            if goal.get("type") == "drinkFreeDays":
-                self._attributes["Target"] = goal.get("target")
-                self._attributes["Progress"] = goal.get("progress")
-                self._attributes["Start Date"] = goal.get("startDate")
+            if goal.type == "drinkFreeDays":
+                self._attributes["Target"] = goal.target
+                self._attributes["Progress"] = goal.progress
+                self._attributes["Start Date"] = goal.start_date
 
     def _update_weekly_units_attributes(self):
         """Update attributes for weekly units sensor."""
@@ -418,12 +529,11 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         six_days_ago = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
 
         for day in self.coordinator.data["summary"]:
-            date = day.get("date")
-            if date and date >= six_days_ago and date <= today:
-                self._attributes[date] = {
-                    "Units": day.get("units", 0),
-                    "Drinks": day.get("drinks", 0),
-                    "Drink Free": day.get("drinkFreeDay", True)
+            if day.date >= six_days_ago and day.date <= today:
+                self._attributes[day.date] = {
+                    "Units": day.units,
+                    "Drinks": day.drinks,
+                    "Drink Free": day.drink_free_day
                 }
 
     def _add_weekly_period_attributes(self):
@@ -466,9 +576,9 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
             return
 
         for day in self.coordinator.data["summary"]:
-            if day.get("date") == today:
-                self._attributes["Today's Units"] = day.get("units", 0)
-                self._attributes["Drink Free Day"] = day.get("drinkFreeDay", True)
+            if day.date == today:
+                self._attributes["Today's Units"] = day.units
+                self._attributes["Drink Free Day"] = day.drink_free_day
                 break
 
     def _update_today_detailed_attributes(self, today):
@@ -525,7 +635,7 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
     def _update_available_drinks_attributes(self):
         """Update attributes with available standard and custom drinks."""
-        if not hasattr(self.coordinator, 'drinks_cache') or not self.coordinator.drinks_cache:
+        if getattr(self.coordinator, "catalog", None) is None:
             return
 
         # Get standard and custom drinks
@@ -537,90 +647,49 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
 
         # Add to attributes
         self._attributes["available_standard_drinks"] = standard_drinks
-        self._attributes["available_custom_drinks"] = custom_drinks
+        self._attributes["available_custom_drinks"] = [drink.to_api() for drink in custom_drinks]
         self._attributes["custom_drinks_reference"] = user_friendly_custom_drinks
 
     def _get_standard_drinks_from_categories(self):
-        """Extract standard drinks from categories in the drinks cache."""
-        standard_drinks = []
-
-        if "categories" not in self.coordinator.drinks_cache:
-            return standard_drinks
-
-        for category in self.coordinator.drinks_cache["categories"]:
-            category_name = category.get("title", "Unknown Category")
-            for drink in category.get("drinks", []):
-                standard_drinks.append({
-                    "id": drink.get("drinkId"),
-                    "category": category_name,
-                    "title": drink.get("title"),
-                    "abv": drink.get("abv"),
-                    "measures": [
-                        {
-                            "id": m.get("measureId"),
-                            "title": m.get("title"),
-                            "size_ml": round(m.get("litres", 0) * 1000)
-                        }
-                        for m in drink.get("measures", [])
-                    ]
-                })
-        return standard_drinks
+        """List the standard drinks in the drinks catalog with their categories."""
+        catalog = self.coordinator.catalog
+        return [
+            {
+                "id": drink.drink_id,
+                "category": catalog.category(drink.drink_id),
+                "title": drink.title,
+                "abv": drink.abv,
+                "measures": [
+                    {
+                        "id": m.measure_id,
+                        "title": m.title,
+                        "size_ml": round((m.litres or 0) * 1000)
+                    }
+                    for m in drink.measures
+                ]
+            }
+            for drink in catalog.standard_drinks
+        ]
 
     def _get_custom_drinks(self):
-        """Get custom drinks from all possible sources in the drinks cache."""
-        custom_drinks = []
-
-        # Check customDrinks array
-        if "customDrinks" in self.coordinator.drinks_cache:
-            custom_drinks.extend(self.coordinator.drinks_cache["customDrinks"])
-
-        # Check search results for custom drinks
-        if "results" in self.coordinator.drinks_cache:
-            for drink in self.coordinator.drinks_cache["results"]:
-                if "derivedDrinkId" in drink:
-                    # Check if this drink is already in our custom_drinks list
-                    drink_id = drink.get("drinkId")
-                    existing_ids = [d.get("drinkId") for d in custom_drinks]
-                    if drink_id and drink_id not in existing_ids:
-                        custom_drinks.append(drink)
-
-        return custom_drinks
+        """Get custom drinks from the drinks catalog."""
+        return list(self.coordinator.catalog.custom_drinks)
 
     def _create_user_friendly_custom_drinks(self, custom_drinks):
         """Create a more user-friendly representation of custom drinks."""
         user_friendly_drinks = []
 
         for drink in custom_drinks:
-            drink_id = drink.get("drinkId", "")
-            title = drink.get("title", "Unknown")
-            abv = drink.get("abv", 0)
-
             # Create a user-friendly entry with the most important information
             user_friendly_drink = {
-                "name": title,
-                "drink_id": drink_id,
-                "abv": abv
+                "name": drink.title if drink.title is not None else "Unknown",
+                "drink_id": drink.drink_id or "",
+                "abv": drink.abv if drink.abv is not None else 0
             }
 
             # Add measures if available
-            if "measures" in drink and drink["measures"]:
-                user_friendly_drink["measures"] = self._format_measures(drink["measures"])
-            elif "measure" in drink:
-                # Handle case when measure is a float or a dictionary
-                measure_value = drink["measure"]
-                if isinstance(measure_value, dict):
-                    user_friendly_drink["measures"] = [{
-                        "name": measure_value.get("title", "Unknown"),
-                        "measure_id": measure_value.get("id", ""),
-                        "size_ml": measure_value.get("size_ml", 0)
-                    }]
-                else:
-                    # Handle case when measure is a float representing volume in liters
-                    user_friendly_drink["measures"] = [{
-                        "name": self._format_measure_size(measure_value),
-                        "measure_id": drink.get("measureId", ""),
-                        "size_ml": int(measure_value * 1000) if isinstance(measure_value, (float, int)) else 0
-                    }]
+            if drink.measures:
+                user_friendly_drink["measures"] = self._format_measures(drink.measures)
 
             user_friendly_drinks.append(user_friendly_drink)
 
@@ -646,9 +715,9 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         measure_list = []
         for measure in measures:
             measure_list.append({
-                "name": measure.get("title", "Unknown"),
-                "measure_id": measure.get("id", ""),
-                "size_ml": measure.get("size_ml", 0)
+                "name": measure.title or self._format_measure_size(measure.litres),
+                "measure_id": measure.measure_id,
+                "size_ml": round(measure.litres * 1000) if measure.litres is not None else 0
             })
         return measure_list
 
@@ -659,3 +728,134 @@ class DrinkAwareSensor(CoordinatorEntity, SensorEntity):
         if not self._attributes:
             self._update_attributes()
         return self._attributes
+
+
+class DrinkAwareBreakdownSensor(DrinkAwareBaseSensor):
+    """Units over a rolling window for one drink type, or split by measure."""
+
+    _attr_icon = "mdi:chart-pie"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: DrinkAwareDataUpdateCoordinator,
+        window,
+        group,
+        key,
+        name,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._window = window
+        self._group = group
+        self._key = key
+        suffix = f"{group}_{key}" if key else group
+        self._attr_name = f"Drinkaware {coordinator.account_name} {name}"
+        self._attr_unique_id = f"drinkaware_{coordinator.entry_id}_units_{suffix}_{window}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.entry_id)},
+            "name": f"Drinkaware {coordinator.account_name}",
+            "manufacturer": "Drinkaware",
+            "model": "Account",
+            "sw_version": "1.0",
+        }
+        # Only the shortest window is enabled by default
+        self._attr_entity_registry_enabled_default = window == next(iter(BREAKDOWN_WINDOWS))
+
+    def _state_inputs(self):
+        """Return the per-measure units shown as attributes."""
+        if self._group == GROUP_MEASURE:
+            return self.coordinator.analytics.get_units(self._window, self._group)
+        return None
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the units for this breakdown."""
+        if self._key is not None:
+            return self.coordinator.analytics.get_units(self._window, self._group, self._key)
+
+        totals = self.coordinator.analytics.get_units(self._window, self._group)
+        return round(sum(totals.values()), 1)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the per-measure units and the window length."""
+        attributes = {
+            "account_name": self.coordinator.account_name,
+            "Days Included": BREAKDOWN_WINDOWS[self._window],
+        }
+        if self._group == GROUP_MEASURE:
+            totals = self.coordinator.analytics.get_units(self._window, self._group)
+            for measure_id, units in totals.items():
+                attributes[MEASURE_DESCRIPTIONS.get(measure_id, measure_id)] = units
+        return attributes
+
+
+class DrinkAwareRequestMetricSensor(DrinkAwareBaseSensor):
+    """Total of one request metric for the account, with the per-endpoint values as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: DrinkAwareDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_name = f"Drinkaware {coordinator.account_name} {description.name}"
+        self._attr_unique_id = f"drinkaware_{coordinator.entry_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.entry_id)},
+            "name": f"Drinkaware {coordinator.account_name}",
+            "manufacturer": "Drinkaware",
+            "model": "Account",
+            "sw_version": "1.0",
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True, the counters are kept even when refreshes fail."""
+        return True
+
+    def _state_inputs(self):
+        """Return the account's request totals, which change whenever an endpoint's metrics do."""
+        return self.coordinator.request_metrics.totals()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the metric summed over every endpoint."""
+        return self.coordinator.request_metrics.totals()[self.entity_description.key]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the metric for each endpoint."""
+        key = self.entity_description.key
+        attributes = {"account_name": self.coordinator.account_name}
+        for endpoint, metrics in sorted(self.coordinator.request_metrics.endpoints.items()):
+            attributes[endpoint] = metrics.as_dict()[key]
+        if key == "requests":
+            totals = self.coordinator.request_metrics.totals()
+            for total in ("errors", "retries", "rate_limit_wait_seconds", "token_refreshes"):
+                attributes[total] = totals[total]
+        return attributes
+
+
+class DrinkAwarePollingIntervalSensor(DrinkAwareRequestMetricSensor):
+    """Minutes between polls of the account, as currently chosen by adaptive polling."""
+
+    def _state_inputs(self):
+        """Return nothing beyond the value, the attributes are fixed."""
+        return None
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the polling interval in minutes."""
+        return int(self.coordinator.polling.interval.total_seconds() // 60)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the account name."""
+        return {"account_name": self.coordinator.account_name}
@@ -0,0 +1,52 @@
+"""
+Date-indexed day series for the Drinkaware integration.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class DaySeries:
+    """Date strings (YYYY-MM-DD) kept sorted, so date ranges are found by bisection.
+
+    ISO dates sort the same as strings, so no parsing is needed. New dates are
+    usually the most recent ones, which append at the end.
+    """
+
+    def __init__(self, dates=()):
+        """Initialize the series."""
+        self._dates = sorted(set(dates))
+
+    def __len__(self):
+        """Return the number of dates."""
+        return len(self._dates)
+
+    def __iter__(self):
+        """Iterate over the dates, oldest first."""
+        return iter(self._dates)
+
+    def __reversed__(self):
+        """Iterate over the dates, newest first."""
+        return reversed(self._dates)
+
+    def __getitem__(self, index):
+        """Return the date at an index, oldest first."""
+        return self._dates[index]
+
+    def __contains__(self, date_str):
+        """Return True if the date is in the series."""
+        index = bisect_left(self._dates, date_str)
+        return index < len(self._dates) and self._dates[index] == date_str
+
+    def add(self, date_str):
+        """Add a date, keeping the series sorted."""
+        if not self._dates or date_str > self._dates[-1]:
+            self._dates.append(date_str)
+            return
+        index = bisect_left(self._dates, date_str)
+        if index == len(self._dates) or self._dates[index] != date_str:
+            self._dates.insert(index, date_str)
+
+    def range(self, start=None, end=None):
+        """Return the dates between two date strings (inclusive), oldest first."""
+        low = 0 if start is None else bisect_left(self._dates, start)
+        high = len(self._dates) if end is None else bisect_right(self._dates, end)
+        return self._dates[low:high]
@@ -3,15 +3,18 @@ Services for Drinkaware integration.
 """
 import logging
 import asyncio
+import functools
 from datetime import datetime
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant
 from homeassistant.const import ATTR_DATE
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
+    DATA_SERVICES_ENTRY,
     API_BASE_URL,
     SERVICE_LOG_DRINK_FREE_DAY,
     SERVICE_LOG_DRINK,
@@ -33,6 +36,7 @@ from .drink_constants import (
 )
 
 from .dynamic_services import (
+    async_get_first_config_entry,
     async_get_drink_free_day_schema,
     async_get_log_drink_schema,
     async_get_delete_drink_schema,
@@ -40,6 +44,11 @@ from .dynamic_services import (
     async_get_log_sleep_quality_schema,
     async_get_refresh_schema,
 )
+from .catalog import DrinkCatalog
+from .orchestrator import async_get_orchestrator, interactive_requests
+from .scheduler import async_get_scheduler
+from .breaker import async_get_breaker
+from .coalesce import fresh_reads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,14 +84,50 @@ def get_coordinator_by_entry_id(hass, entry_id):
     return None
 
 
+def _run_interactive(hass, handler):
+    """Run a service handler with its requests queued ahead of background polling."""
+    @functools.wraps(handler)
+    async def async_handle(service_call) -> None:
+        entry_id = service_call.data.get(ATTR_ENTRY_ID)
+
+        # Fail fast rather than waiting on timeouts while the API is down
+        breaker = async_get_breaker(hass, API_BASE_URL)
+        if breaker.is_open:
+            raise HomeAssistantError(
+                f"The Drinkaware API is unavailable, try again in {breaker.retry_in:.0f} seconds"
+            )
+
+        # A write usually means more are coming, so poll quickly for a while
+        async_get_scheduler(hass).async_snap_back(entry_id)
+        with fresh_reads(), interactive_requests():
+            await handler(service_call)
+
+    return async_handle
+
+
+def _request_slot(coordinator):
+    """Return an interactive request slot for a single service request.
+
+    Slots are taken per request, not per service call, so the waits between
+    a service call's requests leave the shared budget to other accounts.
+    """
+    return coordinator.orchestrator.slot(coordinator.entry_id, interactive=True)
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Drinkaware integration."""
+    # Called for every account, so skip it unless the default account in the schemas has changed
+    first_entry = async_get_first_config_entry(hass)
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH) and hass.data.get(DATA_SERVICES_ENTRY) == first_entry:
+        return
+
+    # Service calls are served before background polling when requests have to queue
     service_handlers = {
-        SERVICE_LOG_DRINK_FREE_DAY: _create_log_drink_free_day_handler(hass),
-        SERVICE_LOG_DRINK: _create_log_drink_handler(hass),
-        SERVICE_DELETE_DRINK: _create_delete_drink_handler(hass),
-        SERVICE_REMOVE_DRINK_FREE_DAY: _create_remove_drink_free_day_handler(hass),
-        SERVICE_LOG_SLEEP_QUALITY: _create_log_sleep_quality_handler(hass),
+        SERVICE_LOG_DRINK_FREE_DAY: _run_interactive(hass, _create_log_drink_free_day_handler(hass)),
+        SERVICE_LOG_DRINK: _run_interactive(hass, _create_log_drink_handler(hass)),
+        SERVICE_DELETE_DRINK: _run_interactive(hass, _create_delete_drink_handler(hass)),
+        SERVICE_REMOVE_DRINK_FREE_DAY: _run_interactive(hass, _create_remove_drink_free_day_handler(hass)),
+        SERVICE_LOG_SLEEP_QUALITY: _run_interactive(hass, _create_log_sleep_quality_handler(hass)),
         SERVICE_REFRESH: _create_refresh_handler(hass),
     }
 
@@ -96,6 +141,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             handler,
             schema=service_schemas[service_name],
         )
+    hass.data[DATA_SERVICES_ENTRY] = first_entry
 
 
 def _create_service_schemas(hass: HomeAssistant):
@@ -173,12 +219,16 @@ async def _check_for_existing_drinks(coordinator, date):
     # Check existing drinks in the API data
     if coordinator.data and "summary" in coordinator.data:
         for day_data in coordinator.data["summary"]:
-            if day_data.get("date") == date_str and day_data.get("drinks", 0) > 0:
+            if day_data.date == date_str and day_data.drinks > 0:
                 has_drinks = True
-                drink_count = day_data.get("drinks", 0)
+                drink_count = day_data.drinks
                 _LOGGER.info(f"Found {drink_count} drinks for {date_str}")
                 break
 
+    # Older days are not in the recent summary, so check the local history
+    if not has_drinks and date_str in coordinator.history.days:
+        has_drinks = coordinator.history.days[date_str].get("drinks", 0) > 0
+
     return has_drinks, date_str
 
 
@@ -193,24 +243,24 @@ async def _remove_all_drinks_for_day(coordinator, date_str):
         "Accept": "application/json",
     }
 
-    async with coordinator.session.get(url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.get(url, headers=headers) as resp:
         if resp.status != 200:
             text = await resp.text()
             _LOGGER.error(f"Error retrieving drinks for {date_str}: {resp.status} - {text}")
             raise HomeAssistantError(f"Failed to retrieve drinks: {text}")
 
-        activity = await resp.json()
+        activity = await resp.json(loads=json_loads)
 
-        # Handle different possible formats in the response
-        drinks = _extract_drinks_from_activity(activity)
-        _LOGGER.info(f"Found {len(drinks)} drinks to remove")
+    # Handle different possible formats in the response
+    drinks = _extract_drinks_from_activity(activity)
+    _LOGGER.info(f"Found {len(drinks)} drinks to remove")
 
-        if not drinks:
-            _LOGGER.warning("No drinks found in API response, but summary indicates drinks exist")
+    if not drinks:
+        _LOGGER.warning("No drinks found in API response, but summary indicates drinks exist")
 
-        # Remove each drink individually
-        for drink in drinks:
-            await _remove_single_drink(coordinator, drink, date_str)
+    # Remove each drink individually
+    for drink in drinks:
+        await _remove_single_drink(coordinator, drink, date_str)
 
     # Wait a bit to ensure all deletes are processed
     await asyncio.sleep(1.0)
@@ -247,7 +297,7 @@ async def _remove_single_drink(coordinator, drink, date_str):
                 "Accept": "application/json",
             }
 
-            async with coordinator.session.delete(delete_url, headers=headers) as del_resp:
+            async with _request_slot(coordinator), coordinator.session.delete(delete_url, headers=headers) as del_resp:
                 if del_resp.status not in (200, 204):
                     text = await del_resp.text()
                     _LOGGER.warning(
@@ -264,9 +314,9 @@ async def _remove_single_drink(coordinator, drink, date_str):
 
 async def _verify_drinks_removed(coordinator, url, headers, date_str):
     """Verify that all drinks were removed from a day."""
-    async with coordinator.session.get(url, headers=headers) as verify_resp:
+    async with _request_slot(coordinator), coordinator.session.get(url, headers=headers) as verify_resp:
         if verify_resp.status == 200:
-            verify_data = await verify_resp.json()
+            verify_data = await verify_resp.json(loads=json_loads)
 
             remaining_drinks = _extract_drinks_from_activity(verify_data)
 
@@ -286,7 +336,7 @@ async def _mark_day_as_drink_free(coordinator, date_str):
         "Accept": "application/json",
     }
 
-    async with coordinator.session.put(url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.put(url, headers=headers) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error(f"Error logging drink-free day: {resp.status} - {text}")
@@ -429,10 +479,11 @@ async def _should_increment_drink(coordinator, drink_type, drink_measure, date):
         "Accept": "application/json",
     }
 
-    async with coordinator.session.get(url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.get(url, headers=headers) as resp:
         if resp.status == 200:
-            activity = await resp.json()
+            activity = await resp.json(loads=json_loads)
             drinks = _extract_drinks_from_activity(activity)
+            await coordinator.history.async_set_activity(date_str, drinks)
 
             # Check if this drink type and measure already exists
             for drink in drinks:
@@ -526,10 +577,11 @@ async def _get_drink_info(coordinator, date_str, drink_type, drink_measure):
     current_quantity = 0
     drink_name = "Unknown Drink"
 
-    async with coordinator.session.get(url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.get(url, headers=headers) as resp:
         if resp.status == 200:
-            activity = await resp.json()
+            activity = await resp.json(loads=json_loads)
             drinks = _extract_drinks_from_activity(activity)
+            await coordinator.history.async_set_activity(date_str, drinks)
 
             for drink in drinks:
                 if (drink.get("drinkId") == drink_type and
@@ -553,7 +605,7 @@ async def _delete_drink(coordinator, date_str, drink_type, drink_measure, drink_
         "Accept": "application/json",
     }
 
-    async with coordinator.session.delete(delete_url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.delete(delete_url, headers=headers) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error(f"Error deleting drink: {resp.status} - {text}")
@@ -630,7 +682,8 @@ def _create_refresh_handler(hass: HomeAssistant):
             )
 
         try:
-            await coordinator.async_refresh()
+            with interactive_requests():
+                await coordinator.async_refresh()
             _LOGGER.info("Drinkaware data for %s refreshed successfully", coordinator.account_name)
         except Exception as err:
             _LOGGER.error("Error refreshing Drinkaware data: %s", err)
@@ -649,7 +702,8 @@ async def _refresh_all_accounts(hass):
 
     if refresh_tasks:
         _LOGGER.info("Refreshing data for all Drinkaware accounts")
-        await asyncio.gather(*refresh_tasks, return_exceptions=True)
+        # The accounts' requests share the global budget and take turns
+        await async_get_orchestrator(hass).async_run_interactive(refresh_tasks)
         _LOGGER.info("Refreshed all Drinkaware accounts")
 
 
@@ -699,13 +753,13 @@ async def create_custom_drink(coordinator, drink_type, title, abv):
 
 async def _make_custom_drink_request(coordinator, url, headers, payload):
     """Make the API request to create a custom drink."""
-    async with coordinator.session.post(url, headers=headers, json=payload) as resp:
+    async with _request_slot(coordinator), coordinator.session.post(url, headers=headers, json=payload) as resp:
         if resp.status != 200:
             text = await resp.text()
             _LOGGER.error(f"Error creating custom drink: {resp.status} - {text}")
             raise Exception(f"Failed to create custom drink: {resp.status} - {text}")
 
-        result = await resp.json()
+        result = await resp.json(loads=json_loads)
         _LOGGER.info(f"Successfully created custom drink with ID: {result.get('drinkId')}")
         return result
 
@@ -734,26 +788,11 @@ def _process_measure_descriptions(coordinator, result):
 
 
 def _update_custom_drinks_cache(coordinator, result):
-    """Update the drinks cache with the new custom drink."""
-    # Initialize drinks cache if needed
-    if not hasattr(coordinator, 'drinks_cache'):
-        coordinator.drinks_cache = {}
-
-    if "customDrinks" not in coordinator.drinks_cache:
-        coordinator.drinks_cache["customDrinks"] = []
+    """Update the drinks catalog with the new custom drink."""
+    catalog = getattr(coordinator, "catalog", None) or DrinkCatalog()
 
-    # Check if this drink already exists in the cache
-    existing_drink = False
-    for i, drink in enumerate(coordinator.drinks_cache.get("customDrinks", [])):
-        if drink.get("drinkId") == result.get("drinkId"):
-            # Update existing drink in the cache
-            coordinator.drinks_cache["customDrinks"][i] = result
-            existing_drink = True
-            break
-
-    # If not found, add the new custom drink to the cache
-    if not existing_drink:
-        coordinator.drinks_cache["customDrinks"].append(result)
+    # Replaces any existing copy of this drink in the catalog
+    coordinator.catalog = catalog.with_custom_drink(result)
 
 
 async def add_drink(coordinator, drink_type, drink_measure, abv, date, custom_name=None):
@@ -780,7 +819,7 @@ async def _create_custom_drink_with_abv(coordinator, drink_type, abv, custom_nam
     # Get original drink info to get the title
     title = custom_name if custom_name else "Custom Drink"
 
-    if not custom_name and hasattr(coordinator, 'drinks_cache') and coordinator.drinks_cache:
+    if not custom_name and getattr(coordinator, "catalog", None) is not None:
         title = _find_original_drink_title(coordinator, drink_type, title)
 
     # Create custom drink
@@ -789,21 +828,8 @@ async def _create_custom_drink_with_abv(coordinator, drink_type, abv, custom_nam
 
 
 def _find_original_drink_title(coordinator, drink_type, default_title):
-    """Find the original title for a drink from the drinks cache."""
-    # Look in categories first
-    if "categories" in coordinator.drinks_cache:
-        for category in coordinator.drinks_cache.get("categories", []):
-            for drink in category.get("drinks", []):
-                if drink.get("drinkId") == drink_type:
-                    return drink.get("title", default_title)
-
-    # Also check customDrinks if present
-    if "customDrinks" in coordinator.drinks_cache:
-        for drink in coordinator.drinks_cache.get("customDrinks", []):
-            if drink.get("drinkId") == drink_type:
-                return drink.get("title", default_title)
-
-    return default_title
+    """Find the original title for a standard or custom drink from the drinks catalog."""
+    return coordinator.catalog.title(drink_type, default_title)
 
 
 def _prepare_add_drink_request(coordinator, date_str, drink_type, drink_measure):
@@ -828,13 +854,13 @@ def _prepare_add_drink_request(coordinator, date_str, drink_type, drink_measure)
 
 async def _send_add_drink_request(coordinator, url, headers, payload, date_str):
     """Send the request to add a drink."""
-    async with coordinator.session.post(url, headers=headers, json=payload) as resp:
+    async with _request_slot(coordinator), coordinator.session.post(url, headers=headers, json=payload) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error(f"Error adding drink: {resp.status} - {text}")
             raise Exception(f"Failed to add drink: {resp.status} - {text}")
 
-        result = await resp.json()
+        result = await resp.json(loads=json_loads)
         _LOGGER.info(f"Successfully added drink for {date_str} (new quantity: {result.get('quantity', 0)})")
         return True, result.get("quantity", 0)
 
@@ -880,13 +906,13 @@ def _prepare_set_quantity_request(coordinator, date_str, drink_type, drink_measu
 
 async def _send_set_quantity_request(coordinator, url, headers, payload, date_str):
     """Send the request to set a drink quantity."""
-    async with coordinator.session.put(url, headers=headers, json=payload) as resp:
+    async with _request_slot(coordinator), coordinator.session.put(url, headers=headers, json=payload) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error(f"Error setting drink quantity: {resp.status} - {text}")
             raise Exception(f"Failed to set drink quantity: {resp.status} - {text}")
 
-        result = await resp.json()
+        result = await resp.json(loads=json_loads)
         _LOGGER.info(f"Successfully set drink quantity for {date_str} to {result.get('quantity', 0)}")
         return True
 
@@ -904,7 +930,7 @@ async def remove_drink_free_day(coordinator, date):
         "Accept": "application/json",
     }
 
-    async with coordinator.session.delete(url, headers=headers) as resp:
+    async with _request_slot(coordinator), coordinator.session.delete(url, headers=headers) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error("Error removing drink-free day: %s - %s", resp.status, text)
@@ -933,11 +959,13 @@ async def log_sleep_quality(coordinator, quality, date):
         "quality": quality
     }
 
-    async with coordinator.session.put(url, headers=headers, json=payload) as resp:
+    async with _request_slot(coordinator), coordinator.session.put(url, headers=headers, json=payload) as resp:
         if resp.status not in (200, 204):
             text = await resp.text()
             _LOGGER.error("Error logging sleep quality: %s - %s", resp.status, text)
             raise Exception(f"Failed to log sleep quality: {resp.status} - {text}")
 
         _LOGGER.info("Successfully logged sleep quality for %s", date_str)
-        return True
+
+    await coordinator.history.async_set_sleep_quality(date_str, quality)
+    return True
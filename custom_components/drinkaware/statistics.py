@@ -0,0 +1,108 @@
+"""
+Long-term statistics import for the Drinkaware integration.
+"""
+import logging
+from datetime import datetime
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    DOMAIN,
+    STATISTIC_DAILY_UNITS,
+    STATISTIC_DAILY_DRINKS,
+    STATISTIC_DRINK_FREE_DAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statistic key -> (display name, unit, value extractor for a DaySummary)
+STATISTIC_TYPES = {
+    STATISTIC_DAILY_UNITS: ("Daily Units", "units", lambda day: float(day.units)),
+    STATISTIC_DAILY_DRINKS: ("Daily Drinks", "drinks", lambda day: float(day.drinks)),
+    STATISTIC_DRINK_FREE_DAY: ("Drink Free Day", None, lambda day: 1.0 if day.drink_free_day else 0.0),
+}
+
+
+def get_statistic_id(entry_id, key):
+    """Return the external statistic ID for an account's config entry and statistic key.
+
+    Account names need not be unique, so the ID is built from the entry ID.
+    """
+    return f"{DOMAIN}:{slugify(entry_id)}_{key}"
+
+
+class DrinkAwareStatistics:
+    """Import per-day Drinkaware summaries into the recorder as external statistics."""
+
+    def __init__(self, hass: HomeAssistant, entry_id, account_name):
+        """Initialize the statistics importer."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.account_name = account_name
+        self._imported = {}  # date string -> (units, drinks, drink free) last written
+
+    @staticmethod
+    def _fingerprint(day):
+        """Return the values of a summary day that are written as statistics."""
+        return tuple(extract(day) for _, _, extract in STATISTIC_TYPES.values())
+
+    def _get_changed_days(self, days):
+        """Return summary days that are new or differ from what was last imported."""
+        changed = []
+        for day in days:
+            if self._imported.get(day.date) != self._fingerprint(day):
+                changed.append(day)
+        return changed
+
+    @callback
+    def async_import_days(self, days):
+        """Import changed summary days as statistics, batched per statistic."""
+        if "recorder" not in self.hass.config.components:
+            return 0
+
+        changed = self._get_changed_days(days)
+        if not changed:
+            return 0
+
+        starts = {}
+        for day in changed:
+            try:
+                day_date = datetime.strptime(day.date, "%Y-%m-%d").date()
+            except ValueError:
+                _LOGGER.debug("Skipping statistics for invalid date %s", day.date)
+                continue
+            starts[day.date] = dt_util.start_of_local_day(day_date)
+
+        changed = sorted((day for day in changed if day.date in starts), key=lambda d: d.date)
+
+        for key, (name, unit, extract) in STATISTIC_TYPES.items():
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"Drinkaware {self.account_name} {name}",
+                source=DOMAIN,
+                statistic_id=get_statistic_id(self.entry_id, key),
+                unit_of_measurement=unit,
+            )
+            statistics = []
+            for day in changed:
+                value = extract(day)
+                statistics.append(
+                    StatisticData(
+                        start=starts[day.date],
+                        state=value,
+                        mean=value,
+                        min=value,
+                        max=value,
+                    )
+                )
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+        for day in changed:
+            self._imported[day.date] = self._fingerprint(day)
+
+        _LOGGER.debug("Imported statistics for %s changed days for %s", len(changed), self.account_name)
+        return len(changed)
@@ -0,0 +1,177 @@
+"""
+Embedded SQLite store for the Drinkaware integration.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT PRIMARY KEY,
+    units REAL,
+    drinks INTEGER,
+    drink_free INTEGER
+);
+CREATE TABLE IF NOT EXISTS activity (
+    date TEXT NOT NULL,
+    drink_id TEXT NOT NULL,
+    measure_id TEXT NOT NULL,
+    name TEXT,
+    measure_name TEXT,
+    abv REAL,
+    quantity INTEGER,
+    units REAL,
+    PRIMARY KEY (date, drink_id, measure_id)
+);
+CREATE INDEX IF NOT EXISTS activity_drink_id ON activity (drink_id, date);
+CREATE TABLE IF NOT EXISTS sleep (
+    date TEXT PRIMARY KEY,
+    quality TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+ACTIVITY_COLUMNS = ("drink_id", "measure_id", "name", "measure_name", "abv", "quantity", "units")
+
+
+class DrinkAwareStore:
+    """SQLite database holding one account's daily summaries, activity and sleep quality.
+
+    All methods are blocking and must be run in the executor.
+    """
+
+    def __init__(self, path):
+        """Initialize the store."""
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def open(self):
+        """Open the database, creating the schema if needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def close(self):
+        """Close the database."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+    def remove(self):
+        """Close and delete the database files."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(f"{self.path}{suffix}")
+            except FileNotFoundError:
+                pass
+
+    def upsert_days(self, days):
+        """Insert or update summary days."""
+        rows = [
+            (
+                day["date"],
+                day.get("units", 0),
+                day.get("drinks", 0),
+                1 if day.get("drinkFreeDay", False) else 0,
+            )
+            for day in days
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO days (date, units, drinks, drink_free) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET "
+                "units = excluded.units, drinks = excluded.drinks, drink_free = excluded.drink_free",
+                rows,
+            )
+
+    def get_days(self, start=None, end=None):
+        """Return summary days between two date strings (inclusive), oldest first."""
+        query = "SELECT date, units, drinks, drink_free FROM days WHERE date >= ? AND date <= ? ORDER BY date"
+        with self._lock:
+            rows = self._conn.execute(query, (start or "", end or "9999-12-31")).fetchall()
+        return [
+            {
+                "date": row["date"],
+                "units": row["units"],
+                "drinks": row["drinks"],
+                "drinkFreeDay": bool(row["drink_free"]),
+            }
+            for row in rows
+        ]
+
+    def replace_activity(self, date_str, drinks):
+        """Replace the logged drinks for a day."""
+        rows = [(date_str, *(drink.get(column) for column in ACTIVITY_COLUMNS)) for drink in drinks]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM activity WHERE date = ?", (date_str,))
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO activity (date, {', '.join(ACTIVITY_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' for _ in ACTIVITY_COLUMNS)})",
+                rows,
+            )
+
+    def get_activity(self, start=None, end=None, drink_id=None):
+        """Return logged drinks between two date strings (inclusive), optionally for one drink."""
+        query = f"SELECT date, {', '.join(ACTIVITY_COLUMNS)} FROM activity WHERE date >= ? AND date <= ?"
+        params = [start or "", end or "9999-12-31"]
+        if drink_id is not None:
+            query += " AND drink_id = ?"
+            params.append(drink_id)
+        query += " ORDER BY date"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def set_sleep_quality(self, date_str, quality):
+        """Insert or update the sleep quality for a day."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sleep (date, quality) VALUES (?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET quality = excluded.quality",
+                (date_str, quality),
+            )
+
+    def get_sleep_quality(self, start=None, end=None):
+        """Return sleep quality by date between two date strings (inclusive)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, quality FROM sleep WHERE date >= ? AND date <= ? ORDER BY date",
+                (start or "", end or "9999-12-31"),
+            ).fetchall()
+        return {row["date"]: row["quality"] for row in rows}
+
+    def get_meta(self, key, default=None):
+        """Return a JSON value stored under a key."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        return json.loads(row["value"])
+
+    def set_meta(self, key, value):
+        """Store a JSON value under a key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value)),
+            )
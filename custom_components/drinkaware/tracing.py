@@ -0,0 +1,135 @@
+"""
+Opt-in tracing of the Drinkaware integration's HTTP requests.
+"""
+import logging
+import time
+from collections import deque
+
+import aiohttp
+from homeassistant.util import dt as dt_util
+
+from .const import TRACE_BUFFER_SIZE
+from .metrics import endpoint_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _elapsed_ms(started):
+    """Return the milliseconds since a monotonic time."""
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+class RequestTracer:
+    """Keep timings for an account's most recent requests, collected with aiohttp trace hooks.
+
+    Each trace records how long DNS resolution took (or whether it was cached),
+    whether a pooled connection was reused or a new one created, the time
+    spent waiting for a pooled connection, and the time from sending the
+    request headers to receiving the response headers. Connection setup time
+    includes DNS and TLS.
+    """
+
+    def __init__(self, size=TRACE_BUFFER_SIZE):
+        """Initialize the tracer."""
+        self.traces = deque(maxlen=size)
+
+    def trace_config(self):
+        """Return an aiohttp TraceConfig that records into this tracer."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_queued_start.append(self._mark("queued"))
+        trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        trace_config.on_connection_create_start.append(self._mark("connect"))
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_resolvehost_start.append(self._mark("dns"))
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_resolvehost_end)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_request_headers_sent.append(self._mark("headers_sent"))
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        return trace_config
+
+    async def _on_request_start(self, session, context, params):
+        """Start a trace for a request."""
+        context.started = time.monotonic()
+        context.marks = {}
+        context.trace = {
+            "time": dt_util.utcnow().isoformat(),
+            "method": params.method,
+            "host": params.url.host,
+            "endpoint": endpoint_name(str(params.url)),
+            "status": None,
+            "error": None,
+            "dns_ms": None,
+            "dns_cache_hit": None,
+            "connection": None,
+            "queued_ms": None,
+            "connect_ms": None,
+            "ttfb_ms": None,
+            "total_ms": None,
+        }
+
+    @staticmethod
+    def _mark(step):
+        """Return a trace hook noting when a step of the request started."""
+
+        async def on_step(session, context, params):
+            context.marks[step] = time.monotonic()
+
+        return on_step
+
+    def _since(self, context, step):
+        """Return the milliseconds since a step started, or None if it was not seen."""
+        started = context.marks.get(step)
+        return _elapsed_ms(started) if started is not None else None
+
+    async def _on_connection_queued_end(self, session, context, params):
+        """Record how long the request waited for a pooled connection."""
+        context.trace["queued_ms"] = self._since(context, "queued")
+
+    async def _on_connection_create_end(self, session, context, params):
+        """Record that a new connection was opened and how long it took."""
+        context.trace["connection"] = "created"
+        context.trace["connect_ms"] = self._since(context, "connect")
+
+    async def _on_connection_reuseconn(self, session, context, params):
+        """Record that a pooled connection was reused."""
+        context.trace["connection"] = "reused"
+
+    async def _on_dns_resolvehost_end(self, session, context, params):
+        """Record how long resolving the host took."""
+        context.trace["dns_cache_hit"] = False
+        context.trace["dns_ms"] = self._since(context, "dns")
+
+    async def _on_dns_cache_hit(self, session, context, params):
+        """Record that the host was already resolved."""
+        context.trace["dns_cache_hit"] = True
+
+    async def _on_request_end(self, session, context, params):
+        """Finish the trace once the response headers have arrived."""
+        context.trace["status"] = params.response.status
+        context.trace["ttfb_ms"] = self._since(context, "headers_sent")
+        self._finish(context)
+
+    async def _on_request_exception(self, session, context, params):
+        """Finish the trace of a request that failed."""
+        context.trace["error"] = type(params.exception).__name__
+        self._finish(context)
+
+    def _finish(self, context):
+        """Add a finished trace to the buffer."""
+        context.trace["total_ms"] = _elapsed_ms(context.started)
+        self.traces.append(context.trace)
+        _LOGGER.debug("Traced request: %s", context.trace)
+
+    def as_dict(self, limit=None):
+        """Return the most recent traces, newest last, for diagnostics and the websocket API."""
+        traces = list(self.traces)
+        if limit is not None:
+            traces = traces[-limit:]
+        return {
+            "enabled": True,
+            "buffer_size": self.traces.maxlen,
+            "traces": traces,
+        }
@@ -0,0 +1,136 @@
+"""
+Websocket API for the Drinkaware integration.
+"""
+import logging
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ATTR_ENTRY_ID
+from .history import extract_drinks
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days of history sent to summary subscribers unless they ask for more or fewer
+SUMMARY_DEFAULT_DAYS = 14
+SUMMARY_MAX_DAYS = 366
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant):
+    """Register the Drinkaware websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_traces)
+    websocket_api.async_register_command(hass, websocket_subscribe_summary)
+
+
+@callback
+def _async_get_coordinator(hass: HomeAssistant, connection, msg):
+    """Return the coordinator for the message's entry, or send an error and return None."""
+    entry_id = msg[ATTR_ENTRY_ID]
+    if entry_id == "account_name_map" or entry_id not in hass.data.get(DOMAIN, {}):
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Drinkaware account not found")
+        return None
+    return hass.data[DOMAIN][entry_id]
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "drinkaware/traces",
+        vol.Required(ATTR_ENTRY_ID): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_get_traces(hass: HomeAssistant, connection, msg):
+    """Return an account's most recent request traces."""
+    coordinator = _async_get_coordinator(hass, connection, msg)
+    if coordinator is None:
+        return
+
+    if coordinator.tracer is None:
+        connection.send_result(msg["id"], {"enabled": False, "traces": []})
+        return
+    connection.send_result(msg["id"], coordinator.tracer.as_dict(msg.get("limit")))
+
+
+def summary_payload(coordinator, days=SUMMARY_DEFAULT_DAYS):
+    """Return an account's daily series and today's drinks in a compact form."""
+    today = dt_util.now().date()
+    start = (today - timedelta(days=days - 1)).isoformat()
+    series = {
+        day["date"]: {
+            "units": day.get("units") or 0,
+            "drinks": day.get("drinks") or 0,
+            "drink_free": day.get("drinkFreeDay", True),
+        }
+        for day in coordinator.history.async_get_days(start, today.isoformat())
+    }
+
+    activity = coordinator._activity_cache.get(today.isoformat())
+    drinks = [
+        {
+            "drink_id": drink.get("drinkId"),
+            "measure_id": drink.get("measureId"),
+            "name": drink.get("name"),
+            "quantity": drink.get("quantity", 0),
+            "units": drink.get("units"),
+        }
+        for drink in (extract_drinks(activity) if activity else [])
+    ]
+    return {"date": today.isoformat(), "days": series, "today": drinks}
+
+
+def summary_delta(previous, current):
+    """Return what changed between two summary payloads, or None if nothing did."""
+    delta = {}
+    if current["date"] != previous["date"]:
+        delta["date"] = current["date"]
+
+    changed = {
+        date_str: day for date_str, day in current["days"].items() if previous["days"].get(date_str) != day
+    }
+    if changed:
+        delta["days"] = changed
+    removed = sorted(date_str for date_str in previous["days"] if date_str not in current["days"])
+    if removed:
+        delta["removed"] = removed
+
+    if current["today"] != previous["today"]:
+        delta["today"] = current["today"]
+    return delta or None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "drinkaware/subscribe_summary",
+        vol.Required(ATTR_ENTRY_ID): str,
+        vol.Optional("days", default=SUMMARY_DEFAULT_DAYS): vol.All(int, vol.Range(min=1, max=SUMMARY_MAX_DAYS)),
+    }
+)
+@callback
+def websocket_subscribe_summary(hass: HomeAssistant, connection, msg):
+    """Send an account's daily series and today's drinks, then only what changes after each update."""
+    coordinator = _async_get_coordinator(hass, connection, msg)
+    if coordinator is None:
+        return
+
+    sent = summary_payload(coordinator, msg["days"])
+
+    @callback
+    def forward_changes():
+        nonlocal sent
+        current = summary_payload(coordinator, msg["days"])
+        delta = summary_delta(sent, current)
+        if delta is None:
+            return
+        sent = current
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(forward_changes)
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], sent))
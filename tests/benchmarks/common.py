@@ -0,0 +1,90 @@
+"""Shared helpers for the Drinkaware benchmarks."""
+import json
+import os
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.drinkaware.const import DOMAIN
+
+RESULTS_PATH = os.environ.get(
+    "DRINKAWARE_BENCHMARK_RESULTS", os.path.join(os.path.dirname(__file__), "results.json")
+)
+BASELINE_PATH = os.environ.get("DRINKAWARE_BENCHMARK_BASELINE")
+TOLERANCE = float(os.environ.get("DRINKAWARE_BENCHMARK_TOLERANCE", "0.25"))
+LATENCY = float(os.environ.get("DRINKAWARE_BENCHMARK_LATENCY", "0.02"))
+
+# Benchmarks are slow and timing dependent, so they only run when asked for
+benchmark = pytest.mark.skipif(
+    not os.environ.get("DRINKAWARE_BENCHMARK"), reason="Set DRINKAWARE_BENCHMARK=1 to run the benchmarks"
+)
+
+
+class BenchmarkResults:
+    """Collect benchmark results and compare them with a saved baseline.
+
+    Every metric is lower-is-better. A result more than the tolerance above
+    its baseline fails the benchmark that recorded it.
+    """
+
+    def __init__(self):
+        """Load the baseline, if one was given."""
+        self.results = {}
+        self.baseline = {}
+        if BASELINE_PATH and os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, "r") as file:
+                self.baseline = json.load(file).get("results", {})
+
+    def record(self, name, value, unit):
+        """Record a result, failing if it regressed against the baseline."""
+        self.results[name] = {"value": round(value, 4), "unit": unit}
+        baseline = self.baseline.get(name)
+        if baseline and value > baseline["value"] * (1 + TOLERANCE):
+            pytest.fail(
+                f"{name} regressed: {value:.4f} {unit} against a baseline of {baseline['value']} {unit}"
+            )
+
+    def save(self):
+        """Write the results so a later run can use them as its baseline."""
+        if not self.results:
+            return
+        with open(RESULTS_PATH, "w") as file:
+            json.dump(
+                {"saved": time.strftime("%Y-%m-%dT%H:%M:%S"), "latency": LATENCY, "results": self.results},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+
+
+async def async_setup_accounts(hass, count):
+    """Add and set up count Drinkaware accounts, returning their config entries."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Drinkaware - Account {index}",
+            unique_id=f"account{index}@example.com",
+            data={
+                "token": {
+                    "access_token": f"account-{index}-token",
+                    "refresh_token": f"account-{index}-refresh",
+                    "expires_in": 3600,
+                },
+                "account_name": f"Account {index}",
+                "email": f"account{index}@example.com",
+            },
+        )
+        for index in range(count)
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    return entries
+
+
+async def async_unload_accounts(hass, entries):
+    """Unload accounts so no timers or background tasks outlive the benchmark."""
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,24 @@
+"""Fixtures for the Drinkaware benchmarks."""
+import pytest
+
+from tests.mock_api import MockDrinkawareApi
+
+from .common import LATENCY, BenchmarkResults
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Return the results shared by all benchmarks, saving them at the end of the run."""
+    results = BenchmarkResults()
+    yield results
+    results.save()
+
+
+@pytest.fixture
+async def mock_api(socket_enabled, enable_custom_integrations):
+    """Start a local Drinkaware API and point the integration at it."""
+    api = MockDrinkawareApi(latency=LATENCY)
+    await api.start()
+    with api.patch_urls():
+        yield api
+    await api.stop()
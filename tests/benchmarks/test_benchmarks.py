@@ -0,0 +1,80 @@
+"""Latency and request benchmarks against the local Drinkaware API."""
+import os
+import statistics
+import time
+
+from custom_components.drinkaware.const import DOMAIN, SERVICE_LOG_DRINK, SERVICE_LOG_DRINK_FREE_DAY
+from custom_components.drinkaware.drink_constants import DRINK_ID_LAGER, MEASURE_ID_PINT
+
+from .common import async_setup_accounts, async_unload_accounts, benchmark
+
+REPEATS = 5
+STARTUP_ACCOUNTS = int(os.environ.get("DRINKAWARE_BENCHMARK_ACCOUNTS", "10"))
+
+pytestmark = benchmark
+
+
+async def test_refresh(hass, mock_api, benchmark_results):
+    """Measure requests and wall time for one account refresh."""
+    entries = await async_setup_accounts(hass, 1)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entries[0].entry_id]
+
+    durations = []
+    requests = []
+    for _ in range(REPEATS):
+        mock_api.reset_counts()
+        started = time.perf_counter()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        durations.append(time.perf_counter() - started)
+        requests.append(mock_api.total_requests)
+
+    await async_unload_accounts(hass, entries)
+    benchmark_results.record("refresh.requests", statistics.mean(requests), "requests")
+    benchmark_results.record("refresh.seconds", statistics.median(durations), "s")
+
+
+async def test_service_latency(hass, mock_api, benchmark_results):
+    """Measure latency and requests for the drink logging services."""
+    entries = await async_setup_accounts(hass, 1)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    entry_id = entries[0].entry_id
+
+    calls = {
+        SERVICE_LOG_DRINK: {"entry_id": entry_id, "drink_id": DRINK_ID_LAGER, "measure_id": MEASURE_ID_PINT},
+        SERVICE_LOG_DRINK_FREE_DAY: {"entry_id": entry_id, "remove_drinks": True},
+    }
+    for service, data in calls.items():
+        durations = []
+        requests = []
+        for _ in range(REPEATS):
+            mock_api.reset_counts()
+            started = time.perf_counter()
+            await hass.services.async_call(DOMAIN, service, data, blocking=True)
+            durations.append(time.perf_counter() - started)
+            requests.append(mock_api.total_requests)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        benchmark_results.record(f"service.{service}.requests", statistics.mean(requests), "requests")
+        benchmark_results.record(f"service.{service}.seconds", statistics.median(durations), "s")
+
+    await async_unload_accounts(hass, entries)
+
+
+async def test_startup(hass, mock_api, benchmark_results):
+    """Measure setup time and requests for several accounts."""
+    started = time.perf_counter()
+    entries = await async_setup_accounts(hass, STARTUP_ACCOUNTS)
+    duration = time.perf_counter() - started
+    requests = mock_api.total_requests
+
+    await hass.async_block_till_done(wait_background_tasks=True)
+    background_requests = mock_api.total_requests - requests
+
+    await async_unload_accounts(hass, entries)
+    benchmark_results.record("startup.seconds_per_account", duration / STARTUP_ACCOUNTS, "s")
+    benchmark_results.record("startup.requests_per_account", requests / STARTUP_ACCOUNTS, "requests")
+    benchmark_results.record(
+        "startup.background_requests_per_account", background_requests / STARTUP_ACCOUNTS, "requests"
+    )
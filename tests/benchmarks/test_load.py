@@ -0,0 +1,132 @@
+"""Load harness running many Drinkaware accounts against the local API."""
+import asyncio
+import gc
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+from custom_components.drinkaware.const import DOMAIN, SERVICE_LOG_DRINK
+from custom_components.drinkaware.drink_constants import DRINK_ID_LAGER, MEASURE_ID_PINT
+
+from .common import async_setup_accounts, async_unload_accounts, benchmark
+
+LOAD_ACCOUNTS = int(os.environ.get("DRINKAWARE_LOAD_ACCOUNTS", "200"))
+LOAD_CYCLES = int(os.environ.get("DRINKAWARE_LOAD_CYCLES", "3"))
+LOAD_SERVICE_CALLS = int(os.environ.get("DRINKAWARE_LOAD_SERVICE_CALLS", "50"))  # Per update cycle
+
+pytestmark = benchmark
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes a task that sleeps a fixed interval."""
+
+    def __init__(self, interval=0.01):
+        """Initialize the monitor."""
+        self.interval = interval
+        self.lags = []
+        self._task = None
+
+    async def _async_run(self):
+        """Sleep repeatedly, recording how much longer each sleep took than asked."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - started - self.interval))
+
+    def start(self):
+        """Start measuring."""
+        self._task = asyncio.create_task(self._async_run())
+
+    async def stop(self):
+        """Stop measuring."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+def _percentiles(values):
+    """Return the p50, p95 and p99 of a list of values."""
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+async def _async_service_traffic(hass, entry_ids, count, latencies, rng):
+    """Log drinks for random accounts at random moments during an update cycle."""
+
+    async def call(entry_id, delay):
+        await asyncio.sleep(delay)
+        started = time.perf_counter()
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_LOG_DRINK,
+            {"entry_id": entry_id, "drink_id": DRINK_ID_LAGER, "measure_id": MEASURE_ID_PINT},
+            blocking=True,
+        )
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(call(rng.choice(entry_ids), rng.uniform(0, 1)) for _ in range(count)))
+
+
+async def test_load(hass, mock_api, benchmark_results):
+    """Run polling and service traffic for many accounts and report how the integration copes."""
+    rng = random.Random(0)
+
+    # Memory held per account once setup and the history backfill have finished
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    entries = await async_setup_accounts(hass, LOAD_ACCOUNTS)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    entry_ids = [entry.entry_id for entry in entries]
+    coordinators = [hass.data[DOMAIN][entry_id] for entry_id in entry_ids]
+    monitor = LoopLagMonitor()
+    latencies = []
+    cpu_per_cycle = []
+
+    mock_api.reset_counts()
+    monitor.start()
+    started = time.perf_counter()
+    for _ in range(LOAD_CYCLES):
+        # Every account polls once while services are called for random accounts
+        cpu_started = time.process_time()
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators),
+            _async_service_traffic(hass, entry_ids, LOAD_SERVICE_CALLS, latencies, rng),
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        cpu_per_cycle.append(time.process_time() - cpu_started)
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+
+    await async_unload_accounts(hass, entries)
+
+    p50, p95, p99 = _percentiles(latencies)
+    lag_p50, _, lag_p99 = _percentiles(monitor.lags)
+    report = {
+        "load.cpu_seconds_per_cycle": (statistics.mean(cpu_per_cycle), "s"),
+        "load.cpu_ms_per_account_update": (1000 * statistics.mean(cpu_per_cycle) / LOAD_ACCOUNTS, "ms"),
+        "load.loop_lag_p50": (lag_p50, "s"),
+        "load.loop_lag_p99": (lag_p99, "s"),
+        "load.loop_lag_max": (max(monitor.lags, default=0.0), "s"),
+        "load.requests_per_account_update": (mock_api.total_requests / (LOAD_CYCLES * LOAD_ACCOUNTS), "requests"),
+        "load.memory_kib_per_account": ((after - before) / 1024 / LOAD_ACCOUNTS, "KiB"),
+        "load.service_latency_p50": (p50, "s"),
+        "load.service_latency_p95": (p95, "s"),
+        "load.service_latency_p99": (p99, "s"),
+    }
+    print(f"\nDrinkaware load: {LOAD_ACCOUNTS} accounts, {LOAD_CYCLES} cycles, {len(latencies)} service calls")
+    print(f"  request rate: {mock_api.total_requests / elapsed:.1f} requests/s")
+    for name, (value, unit) in report.items():
+        print(f"  {name.removeprefix('load.')}: {value:.4f} {unit}")
+        benchmark_results.record(name, value, unit)
+
+    assert len(latencies) == LOAD_CYCLES * LOAD_SERVICE_CALLS
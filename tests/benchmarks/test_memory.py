@@ -0,0 +1,104 @@
+"""Memory held per account by parsed API payloads, against keeping the raw JSON."""
+import gc
+import json
+import os
+import tracemalloc
+from datetime import date, timedelta
+
+from custom_components.drinkaware.catalog import DrinkCatalog, StandardDrinks
+from custom_components.drinkaware.models import parse_data
+
+from .common import benchmark
+
+MEMORY_ACCOUNTS = int(os.environ.get("DRINKAWARE_MEMORY_ACCOUNTS", "200"))
+SUMMARY_DAYS = 31
+CUSTOM_DRINKS = 20
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+
+pytestmark = benchmark
+
+
+def _load_fixture(filename):
+    """Load a fixture file as text."""
+    with open(os.path.join(FIXTURES_DIR, filename), "r") as file:
+        return file.read()
+
+
+def _account_payloads(index):
+    """Return the response bodies one account's refresh and catalog update receive."""
+    summary = json.loads(_load_fixture("summary.json"))
+    template = summary["activitySummaryDays"][0]
+    start = date(2025, 4, 20)
+    summary["activitySummaryDays"] = [
+        dict(template, date=(start - timedelta(days=day)).isoformat(), drinks=day % 3, units=day % 3 * 2.3)
+        for day in range(SUMMARY_DAYS)
+    ]
+
+    search = json.loads(_load_fixture("drinks.json"))
+    template = search["results"][0]
+    search = {"results": [
+        dict(template, drinkId=f"{index:08x}-{drink:04x}", title=f"Custom drink {drink}")
+        for drink in range(CUSTOM_DRINKS)
+    ]}
+    return {
+        "assessment": _load_fixture("assessment.json"),
+        "stats": _load_fixture("stats.json"),
+        "goals": _load_fixture("goals.json"),
+        "summary": json.dumps(summary),
+        "search": json.dumps(search),
+    }
+
+
+def _keep_raw(payloads, generic):
+    """Keep the decoded responses as the integration used to."""
+    raw = {key: json.loads(body) for key, body in payloads.items()}
+    return {
+        "assessment": raw["assessment"]["assessments"][0],
+        "stats": raw["stats"],
+        "goals": raw["goals"]["goals"],
+        "summary": raw["summary"]["activitySummaryDays"],
+        "generic": json.loads(generic),
+        "custom_drinks": raw["search"]["results"],
+    }
+
+
+def _keep_models(payloads, standard):
+    """Keep the responses parsed into models, with shared standard drinks."""
+    raw = {key: json.loads(body) for key, body in payloads.items()}
+    data = parse_data({
+        "assessment": raw["assessment"]["assessments"][0],
+        "stats": raw["stats"],
+        "goals": raw["goals"]["goals"],
+        "summary": raw["summary"]["activitySummaryDays"],
+    })
+    return data, DrinkCatalog(custom_drinks=raw["search"]["results"], standard=standard)
+
+
+def _measure(build):
+    """Return the bytes held by what build() returns for every account."""
+    payloads = [_account_payloads(index) for index in range(MEMORY_ACCOUNTS)]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [build(account) for account in payloads]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(kept) == MEMORY_ACCOUNTS
+    return after - before
+
+
+def test_memory_per_account(benchmark_results):
+    """Compare the memory held per account by raw JSON and by parsed models."""
+    generic = _load_fixture("drinks.json")
+    standard = StandardDrinks(json.loads(generic))
+
+    raw = _measure(lambda payloads: _keep_raw(payloads, generic))
+    models = _measure(lambda payloads: _keep_models(payloads, standard))
+
+    print(f"\nDrinkaware memory: {MEMORY_ACCOUNTS} accounts")
+    print(f"  raw JSON: {raw / 1024 / MEMORY_ACCOUNTS:.2f} KiB per account")
+    print(f"  models: {models / 1024 / MEMORY_ACCOUNTS:.2f} KiB per account")
+    benchmark_results.record("memory.model_kib_per_account", models / 1024 / MEMORY_ACCOUNTS, "KiB")
+    assert models < raw
@@ -0,0 +1,54 @@
+"""Decoding and projection of a scaled-up generic drinks response."""
+import json
+import os
+import timeit
+
+from homeassistant.util.json import json_loads
+
+from custom_components.drinkaware.catalog import StandardDrinks
+
+from .common import benchmark
+
+PARSE_DRINKS = int(os.environ.get("DRINKAWARE_PARSE_DRINKS", "5000"))
+REPEATS = 5
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+
+pytestmark = benchmark
+
+
+def _scaled_drinks_body():
+    """Return a generic drinks response body with the fixture's drinks repeated PARSE_DRINKS times."""
+    with open(os.path.join(FIXTURES_DIR, "drinks.json"), "r") as file:
+        generic = json.load(file)
+
+    templates = [drink for category in generic["categories"] for drink in category["drinks"]]
+    categories = [dict(category, drinks=[]) for category in generic["categories"]]
+    for index in range(PARSE_DRINKS):
+        template = templates[index % len(templates)]
+        categories[index % len(categories)]["drinks"].append(
+            dict(template, drinkId=f"{index:08x}-0000-0000-0000-000000000000", title=f"{template['title']} {index}")
+        )
+    return json.dumps(dict(generic, categories=categories)).encode()
+
+
+def _best(func):
+    """Return the fastest of several runs of func, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=REPEATS))
+
+
+def test_parse_generic_drinks(benchmark_results):
+    """Compare the stdlib decoder with Home Assistant's, with and without projecting into StandardDrinks."""
+    body = _scaled_drinks_body()
+
+    stdlib = _best(lambda: json.loads(body))
+    fast = _best(lambda: json_loads(body))
+    projected = _best(lambda: StandardDrinks(json_loads(body)))
+
+    print(f"\nDrinkaware parsing: {PARSE_DRINKS} drinks, {len(body) / 1024:.0f} KiB")
+    print(f"  json.loads: {stdlib * 1000:.2f} ms")
+    print(f"  json_loads: {fast * 1000:.2f} ms")
+    print(f"  json_loads + StandardDrinks: {projected * 1000:.2f} ms")
+    benchmark_results.record("parse.generic_drinks_ms", fast * 1000, "ms")
+    benchmark_results.record("parse.standard_drinks_ms", projected * 1000, "ms")
+    assert len(StandardDrinks(json_loads(body)).drinks) == PARSE_DRINKS
@@ -9,6 +9,13 @@ from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant
 
 from custom_components.drinkaware.const import DOMAIN
+from custom_components.drinkaware.analytics import DrinkAwareAnalytics
+from custom_components.drinkaware.catalog import DrinkCatalog
+from custom_components.drinkaware.breaker import CircuitBreaker
+from custom_components.drinkaware.metrics import RequestMetrics
+from custom_components.drinkaware.models import parse_data
+from custom_components.drinkaware.orchestrator import RequestOrchestrator
+from custom_components.drinkaware.series import DaySeries
 
 
 @pytest.fixture
@@ -153,9 +160,15 @@ async def setup_integration(hass: HomeAssistant, mock_config_entry, mock_api_res
         coordinator.refresh_token = "test_refresh_token"
         coordinator.last_update_success = True
         coordinator.session = mock_api_responses
+        coordinator.suppressed_writes = 0
+        coordinator.breaker = CircuitBreaker("api.drinkaware.co.uk")
+        coordinator.login_breaker = CircuitBreaker("login.drinkaware.co.uk")
+        coordinator.request_metrics = RequestMetrics()
+        coordinator.orchestrator = RequestOrchestrator()
+        coordinator.tracer = None
         
         # Set up mock data
-        coordinator.data = {
+        coordinator.data = parse_data({
             "assessment": {"riskLevel": "low", "totalScore": 5},
             "stats": {
                 "drinkFreeDays": {"total": 15, "streakCurrent": 3, "streakHighest": 5},
@@ -173,10 +186,10 @@ async def setup_integration(hass: HomeAssistant, mock_config_entry, mock_api_res
                 {"date": "2025-04-18", "drinks": 0, "units": 0, "drinkFreeDay": True},
                 {"date": "2025-04-17", "drinks": 0, "units": 0, "drinkFreeDay": True}
             ]
-        }
+        })
         
-        # Add mock drinks cache
-        coordinator.drinks_cache = {
+        # Add mock drinks catalog
+        coordinator.catalog = DrinkCatalog({
             "categories": [
                 {
                     "title": "Beer & Cider",
@@ -193,8 +206,19 @@ async def setup_integration(hass: HomeAssistant, mock_config_entry, mock_api_res
                 }
             ],
             "customDrinks": []
-        }
+        })
         
+        # Local history and background backfill
+        coordinator.history = MagicMock()
+        coordinator.history.days = {}
+        coordinator.history.sleep = {}
+        coordinator.history.dates = DaySeries()
+        coordinator._activity_cache = {}
+        coordinator.history.async_load = AsyncMock(return_value=None)
+        coordinator.history.async_set_activity = AsyncMock()
+        coordinator.backfill = MagicMock()
+        coordinator.analytics = DrinkAwareAnalytics(lambda drink_id: None)
+
         # Store coordinator in hass data
         hass.data[DOMAIN][config_entry.entry_id] = coordinator
         
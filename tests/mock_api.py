@@ -0,0 +1,223 @@
+"""Local stand-in for the Drinkaware API and login service.
+
+Serves the fixture payloads over real HTTP so request counts and timings can
+be measured. Use it with patch_urls() so the integration talks to it instead
+of api.drinkaware.co.uk:
+
+    api = MockDrinkawareApi(latency=0.02)
+    await api.start()
+    with api.patch_urls():
+        ...
+    await api.stop()
+"""
+import asyncio
+import copy
+import itertools
+import json
+import os
+from collections import Counter
+from contextlib import ExitStack
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.drinkaware.const import OAUTH_TOKEN_URL
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _load_fixture(filename):
+    """Load a fixture file."""
+    with open(os.path.join(FIXTURES_DIR, filename), "r") as file:
+        return json.load(file)
+
+
+class MockDrinkawareApi:
+    """aiohttp server that behaves like the parts of the Drinkaware API the integration uses.
+
+    Drinks logged through the server are kept per access token and date, so
+    services that read, then write, then verify see consistent data.
+    """
+
+    def __init__(self, latency=0.0):
+        """Initialize the server."""
+        self.latency = latency  # Seconds added to every response
+        self.requests = Counter()  # "METHOD route" -> requests served
+        self._rate_limited = 0  # Requests still to answer with 429
+        self._retry_after = 0
+        self._tokens = itertools.count(1)
+        self._seen_tokens = set()
+        self._expired = set()
+        self._activity = {}  # (token, date) -> list of drinks
+        self.custom_drinks = []  # Returned by search, most recently created first
+        self._server = None
+        self.base_url = None
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/tools/v1/selfassessment", self._fixture("assessment.json"))
+        self.app.router.add_get("/tracking/v1/stats", self._fixture("stats.json"))
+        self.app.router.add_get("/tracking/v1/goals", self._fixture("goals.json"))
+        self.app.router.add_get("/tracking/v1/summary/{end}/{start}", self._fixture("summary.json"))
+        self.app.router.add_get("/drinks/v1/generic", self._fixture("drinks.json"))
+        self.app.router.add_get("/drinks/v1/search", self._search)
+        self.app.router.add_post("/drinks/v1/custom", self._create_custom_drink)
+        self.app.router.add_get("/tracking/v1/activity/{date}", self._get_activity)
+        self.app.router.add_post("/tracking/v1/activity/{date}", self._add_drink)
+        self.app.router.add_put("/tracking/v1/activity/{date}", self._set_drink)
+        self.app.router.add_delete("/tracking/v1/activity/{date}/{drink_id}/{measure_id}", self._delete_drink)
+        self.app.router.add_put("/tracking/v1/activity/{date}/drinkfreeday", self._drink_free_day)
+        self.app.router.add_delete("/tracking/v1/activity/{date}/drinkfreeday", self._no_content)
+        self.app.router.add_put("/tracking/v1/activity/{date}/sleep", self._no_content)
+        self.app.router.add_post(urlparse(OAUTH_TOKEN_URL).path, self._token)
+
+    async def start(self):
+        """Start serving on a free local port."""
+        self._server = TestServer(self.app)
+        await self._server.start_server()
+        self.base_url = str(self._server.make_url("")).rstrip("/")
+
+    async def stop(self):
+        """Stop the server."""
+        if self._server:
+            await self._server.close()
+            self._server = None
+
+    def patch_urls(self):
+        """Return a context manager pointing the integration at this server."""
+        stack = ExitStack()
+        token_url = f"{self.base_url}{urlparse(OAUTH_TOKEN_URL).path}"
+        for module in ("custom_components.drinkaware", "custom_components.drinkaware.services"):
+            stack.enter_context(patch(f"{module}.API_BASE_URL", self.base_url))
+        stack.enter_context(patch("custom_components.drinkaware.OAUTH_TOKEN_URL", token_url))
+        return stack
+
+    def rate_limit(self, count, retry_after=0):
+        """Answer the next count API requests with 429 Too Many Requests."""
+        self._rate_limited = count
+        self._retry_after = retry_after
+
+    def expire_tokens(self):
+        """Make every access token used so far return 401."""
+        self._expired |= self._seen_tokens
+
+    @property
+    def total_requests(self):
+        """Return the number of requests served."""
+        return sum(self.requests.values())
+
+    def reset_counts(self):
+        """Forget the request counts."""
+        self.requests.clear()
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        """Count requests and apply latency, rate limiting and token expiry."""
+        route = request.match_info.route.resource
+        self.requests[f"{request.method} {route.canonical if route else request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if request.path == urlparse(OAUTH_TOKEN_URL).path:
+            return await handler(request)
+
+        if self._rate_limited:
+            self._rate_limited -= 1
+            return web.Response(
+                status=429,
+                text=f"Rate limit is exceeded. Try again in {self._retry_after} seconds.",
+            )
+
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not token or token in self._expired:
+            return web.Response(status=401, text="Unauthorized")
+        self._seen_tokens.add(token)
+        return await handler(request)
+
+    def _fixture(self, filename):
+        """Return a handler serving a fixture file."""
+        payload = _load_fixture(filename)
+
+        async def handle(request):
+            return web.json_response(payload)
+
+        return handle
+
+    def _drinks(self, request):
+        """Return the stored drinks for the request's account and date."""
+        key = (request.headers.get("Authorization"), request.match_info["date"])
+        if key not in self._activity:
+            self._activity[key] = copy.deepcopy(_load_fixture("activity.json")["activity"])
+        return self._activity[key]
+
+    async def _get_activity(self, request):
+        """Return a day's drinks."""
+        return web.json_response({"activity": self._drinks(request)})
+
+    async def _add_drink(self, request):
+        """Add one of a drink."""
+        body = await request.json()
+        drinks = self._drinks(request)
+        for drink in drinks:
+            if drink["drinkId"] == body["drinkId"] and drink["measureId"] == body["measureId"]:
+                drink["quantity"] += body.get("quantityAdjustment", 1)
+                return web.json_response(drink)
+        drink = {"drinkId": body["drinkId"], "measureId": body["measureId"], "quantity": 1}
+        drinks.append(drink)
+        return web.json_response(drink)
+
+    async def _set_drink(self, request):
+        """Set the quantity of a drink."""
+        body = await request.json()
+        drinks = self._drinks(request)
+        drinks[:] = [
+            drink for drink in drinks
+            if (drink["drinkId"], drink["measureId"]) != (body["drinkId"], body["measureId"])
+        ]
+        drink = {"drinkId": body["drinkId"], "measureId": body["measureId"], "quantity": body["quantity"]}
+        if body["quantity"]:
+            drinks.append(drink)
+        return web.json_response(drink)
+
+    async def _delete_drink(self, request):
+        """Remove a drink."""
+        drinks = self._drinks(request)
+        drinks[:] = [
+            drink for drink in drinks
+            if (drink["drinkId"], drink["measureId"])
+            != (request.match_info["drink_id"], request.match_info["measure_id"])
+        ]
+        return web.Response(status=204)
+
+    async def _drink_free_day(self, request):
+        """Mark a day as drink free, which only works once its drinks are removed."""
+        if self._drinks(request):
+            return web.Response(status=400, text="Day has drinks")
+        return web.Response(status=204)
+
+    async def _no_content(self, request):
+        """Accept a write that returns nothing."""
+        return web.Response(status=204)
+
+    async def _search(self, request):
+        """Return a page of custom drinks."""
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query.get("resultsPerPage", 15))
+        start = (page - 1) * per_page
+        return web.json_response({"results": self.custom_drinks[start:start + per_page]})
+
+    async def _create_custom_drink(self, request):
+        """Create a custom drink."""
+        body = await request.json()
+        drink = {"drinkId": f"custom-{next(self._tokens)}", **body}
+        self.custom_drinks.insert(0, drink)
+        return web.json_response(drink)
+
+    async def _token(self, request):
+        """Issue a new access token."""
+        return web.json_response({
+            "access_token": f"mock-{next(self._tokens)}",
+            "refresh_token": "mock-refresh",
+            "expires_in": 3600,
+        })
@@ -0,0 +1,76 @@
+"""Test the Drinkaware unit breakdown analytics."""
+from datetime import date
+
+from custom_components.drinkaware.analytics import (
+    DrinkAwareAnalytics,
+    GROUP_DRINK_TYPE,
+    GROUP_MEASURE,
+    calculate_units,
+)
+from custom_components.drinkaware.drink_constants import (
+    DRINK_ID_LAGER,
+    DRINK_ID_RED_WINE,
+    DRINK_TYPES,
+    MEASURE_ID_PINT,
+    MEASURE_ID_MEDIUM_WINE,
+)
+
+TODAY = date(2025, 4, 20)
+
+LAGER_PINT = {"drink_id": DRINK_ID_LAGER, "measure_id": MEASURE_ID_PINT, "abv": 4.0, "quantity": 1}
+WINE_GLASS = {"drink_id": DRINK_ID_RED_WINE, "measure_id": MEASURE_ID_MEDIUM_WINE, "abv": 12.0, "quantity": 2}
+
+
+def _analytics():
+    """Create analytics with a short and a long window."""
+    return DrinkAwareAnalytics(DRINK_TYPES.get, windows={"weekly": 7, "monthly": 30})
+
+
+def test_calculate_units():
+    """Test units are taken from the row or worked out from the measure volume."""
+    assert round(calculate_units(LAGER_PINT), 2) == 2.27
+    assert round(calculate_units(WINE_GLASS), 2) == 4.2
+    assert calculate_units({**LAGER_PINT, "units": 3.0}) == 3.0
+    assert calculate_units({"drink_id": "x", "measure_id": "unknown", "abv": 5, "quantity": 1}) == 0.0
+
+
+def test_apply_day_updates_totals_incrementally():
+    """Test that re-applying a day replaces its previous contribution."""
+    analytics = _analytics()
+    assert analytics.async_apply_day("2025-04-20", [LAGER_PINT, WINE_GLASS], TODAY) is True
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "wine", today=TODAY) == 4.2
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "beer", today=TODAY) == 2.3
+
+    # Same drinks again: nothing changes
+    assert analytics.async_apply_day("2025-04-20", [LAGER_PINT, WINE_GLASS], TODAY) is False
+
+    # One drink removed
+    assert analytics.async_apply_day("2025-04-20", [WINE_GLASS], TODAY) is True
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "beer", today=TODAY) == 0.0
+    assert analytics.get_units("weekly", GROUP_MEASURE, today=TODAY) == {MEASURE_ID_MEDIUM_WINE: 4.2}
+
+
+def test_days_fall_out_of_windows():
+    """Test that days are subtracted once they are older than a window."""
+    analytics = _analytics()
+    analytics.async_apply_day("2025-04-10", [WINE_GLASS], TODAY)
+    analytics.async_apply_day("2025-04-20", [LAGER_PINT], TODAY)
+
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "wine", today=TODAY) == 0.0
+    assert analytics.get_units("monthly", GROUP_DRINK_TYPE, "wine", today=TODAY) == 4.2
+
+    # Later in May the wine has dropped out of both windows
+    later = date(2025, 5, 15)
+    assert analytics.get_units("monthly", GROUP_DRINK_TYPE, "wine", today=later) == 0.0
+    assert analytics.get_units("monthly", GROUP_DRINK_TYPE, "beer", today=later) == 2.3
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "beer", today=later) == 0.0
+
+
+def test_unknown_drinks_are_grouped_as_other():
+    """Test that drinks without a known type are counted as other."""
+    analytics = _analytics()
+    analytics.async_apply_rows(
+        [{"date": "2025-04-20", "drink_id": "custom", "measure_id": MEASURE_ID_PINT, "abv": 5.0, "quantity": 1}],
+        TODAY,
+    )
+    assert analytics.get_units("weekly", GROUP_DRINK_TYPE, "other", today=TODAY) == 2.8
@@ -0,0 +1,30 @@
+"""Test the Drinkaware binary sensor platform."""
+from unittest.mock import MagicMock
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+
+from custom_components.drinkaware.binary_sensor import DrinkAwareApiProblemSensor
+from custom_components.drinkaware.breaker import CircuitBreaker
+from custom_components.drinkaware.const import DOMAIN
+
+
+def test_api_problem_sensor():
+    """Test that the binary sensor follows the circuit breaker."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.last_update_success = False
+    coordinator.breaker = CircuitBreaker("api.drinkaware.co.uk", threshold=1)
+
+    sensor = DrinkAwareApiProblemSensor(coordinator)
+
+    assert sensor.name == "Drinkaware Test Account API Problem"
+    assert sensor.unique_id == "drinkaware_test_entry_id_api_problem"
+    assert sensor.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
+    assert sensor.device_class == BinarySensorDeviceClass.PROBLEM
+    assert sensor.available
+    assert not sensor.is_on
+
+    coordinator.breaker.async_record_failure()
+    assert sensor.is_on
+    assert sensor.extra_state_attributes["state"] == "open"
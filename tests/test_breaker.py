@@ -0,0 +1,60 @@
+"""Test the Drinkaware circuit breaker."""
+from unittest.mock import MagicMock, patch
+
+from custom_components.drinkaware.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    STATE_CLOSED,
+    STATE_OPEN,
+    STATE_HALF_OPEN,
+)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """Test that a run of failures opens the breaker and a success resets the count."""
+    breaker = CircuitBreaker("api.example.com", threshold=3, reset_timeout=60)
+    listener = MagicMock()
+    breaker.async_add_listener(listener)
+
+    breaker.async_record_failure()
+    breaker.async_record_failure()
+    breaker.async_record_success()
+    breaker.async_record_failure()
+    breaker.async_record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.async_allow_request()
+
+    breaker.async_record_failure()
+    assert breaker.state == STATE_OPEN
+    assert breaker.is_open
+    assert not breaker.async_allow_request()
+    assert breaker.as_dict()["consecutive_failures"] == 3
+    assert "api.example.com is unavailable" in str(CircuitOpenError(breaker))
+    listener.assert_called_once()
+
+
+def test_half_open_probe():
+    """Test that one probe is let through once the timeout passes."""
+    breaker = CircuitBreaker("api.example.com", threshold=1, reset_timeout=60, max_reset_timeout=100)
+
+    with patch("custom_components.drinkaware.breaker.time.monotonic", return_value=1000):
+        breaker.async_record_failure()
+
+    with patch("custom_components.drinkaware.breaker.time.monotonic", return_value=1061):
+        assert breaker.async_allow_request()
+        assert breaker.state == STATE_HALF_OPEN
+        # Only the probe gets through
+        assert not breaker.async_allow_request()
+
+        # A failed probe opens the breaker again for longer, up to the maximum
+        breaker.async_record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_in == 100
+
+    with patch("custom_components.drinkaware.breaker.time.monotonic", return_value=1162):
+        assert breaker.async_allow_request()
+        breaker.async_record_success()
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.as_dict()["retry_at"] is None
+    assert breaker.async_allow_request()
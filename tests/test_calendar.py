@@ -0,0 +1,72 @@
+"""Test the Drinkaware calendar platform."""
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.drinkaware.calendar import DrinkAwareCalendar
+from custom_components.drinkaware.const import DOMAIN
+from custom_components.drinkaware.series import DaySeries
+
+
+def _mock_coordinator():
+    """Create a coordinator with a few days of local history."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.history.days = {
+        "2025-04-18": {"units": 0, "drinks": 0, "drinkFreeDay": True},
+        "2025-04-19": {"units": 2.3, "drinks": 1, "drinkFreeDay": False},
+        "2025-04-20": {"units": 4.5, "drinks": 2, "drinkFreeDay": False},
+        "2025-04-21": {"units": 0, "drinks": 0, "drinkFreeDay": False},
+    }
+    coordinator.history.sleep = {"2025-04-19": "poor"}
+    coordinator.history.dates = DaySeries([*coordinator.history.days, *coordinator.history.sleep])
+    return coordinator
+
+
+async def test_calendar_events(hass):
+    """Test that range queries return the local days as all-day events."""
+    coordinator = _mock_coordinator()
+    calendar = DrinkAwareCalendar(coordinator)
+
+    assert calendar.name == "Drinkaware Test Account Calendar"
+    assert calendar.unique_id == "drinkaware_test_entry_id_calendar"
+    assert calendar.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
+
+    # The range ends at midnight, so the 20th is not included
+    start = dt_util.as_local(datetime(2025, 4, 18))
+    events = await calendar.async_get_events(hass, start, start + timedelta(days=2))
+
+    assert [(event.start, event.summary) for event in events] == [
+        (date(2025, 4, 18), "Drink-free day"),
+        (date(2025, 4, 19), "Drinking day (2.3 units)"),
+        (date(2025, 4, 19), "Sleep: poor"),
+    ]
+    assert events[1].end == date(2025, 4, 20)
+    assert events[1].description == "1 drinks, 2.3 units"
+
+    # Nothing is fetched to answer a query
+    coordinator._make_api_request.assert_not_called()
+
+
+async def test_untracked_days_have_no_event(hass):
+    """Test that days with no drinks that are not drink-free are left out."""
+    calendar = DrinkAwareCalendar(_mock_coordinator())
+
+    start = dt_util.as_local(datetime(2025, 4, 20))
+    events = await calendar.async_get_events(hass, start, start + timedelta(days=2))
+
+    assert [(event.start, event.summary) for event in events] == [(date(2025, 4, 20), "Drinking day (4.5 units)")]
+
+
+async def test_calendar_current_event(hass):
+    """Test that the current event is today's first event."""
+    coordinator = _mock_coordinator()
+    calendar = DrinkAwareCalendar(coordinator)
+    assert calendar.event is None
+
+    today = dt_util.now().date().isoformat()
+    coordinator.history.days[today] = {"units": 0, "drinks": 0, "drinkFreeDay": True}
+    coordinator.history.dates.add(today)
+    assert calendar.event.summary == "Drink-free day"
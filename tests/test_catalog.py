@@ -0,0 +1,101 @@
+"""Test the Drinkaware drinks catalog."""
+import asyncio
+from unittest.mock import AsyncMock
+import pytest
+
+from custom_components.drinkaware.catalog import DrinkCatalog, StandardDrinks, async_get_shared_standard_drinks
+from custom_components.drinkaware.drink_constants import (
+    DRINK_ID_BEER,
+    DRINK_ID_LAGER,
+    MEASURE_ID_PINT,
+)
+
+CUSTOM_IPA = "12345678-ABCD-1234-5678-123456789ABC"
+CRAFT_BEER = "87654321-ABCD-1234-5678-123456789ABC"
+
+
+def test_catalog_indexes(load_fixture):
+    """Test lookups across standard drinks, custom drinks and search results."""
+    catalog = DrinkCatalog(load_fixture("drinks.json"))
+
+    assert DRINK_ID_LAGER in catalog
+    assert catalog.title(DRINK_ID_LAGER) == "Lager"
+    assert catalog.category(DRINK_ID_LAGER) == "Beer & Cider"
+    assert catalog.is_custom(DRINK_ID_LAGER) is False
+
+    assert catalog.is_custom(CUSTOM_IPA) is True
+    assert catalog.derived_drink_id(CRAFT_BEER) == DRINK_ID_BEER
+    assert {drink.drink_id for drink in catalog.drinks_derived_from(DRINK_ID_BEER)} == {CUSTOM_IPA, CRAFT_BEER}
+
+    pint_drinks = {drink.drink_id for drink in catalog.drinks_with_measure(MEASURE_ID_PINT)}
+    assert {DRINK_ID_LAGER, CUSTOM_IPA} <= pint_drinks
+    assert [drink.drink_id for drink in catalog.drinks_with_abv(6.5)] == [CUSTOM_IPA]
+
+    assert catalog.title("unknown", "Custom Drink") == "Custom Drink"
+    assert catalog.drinks_in_category("unknown") == ()
+
+
+def test_catalog_dedupes_custom_drinks(load_fixture):
+    """Test that custom drinks found in several sources appear once."""
+    search = {"results": load_fixture("drinks.json")["results"]}
+    catalog = DrinkCatalog.from_responses(load_fixture("drinks.json"), search)
+
+    custom_ids = [drink.drink_id for drink in catalog.custom_drinks]
+    assert sorted(custom_ids) == sorted({CUSTOM_IPA, CRAFT_BEER})
+
+
+def test_with_custom_drink_returns_new_catalog(load_fixture):
+    """Test adding and updating a custom drink without changing the original."""
+    catalog = DrinkCatalog(load_fixture("drinks.json"))
+    updated = catalog.with_custom_drink({
+        "drinkId": CUSTOM_IPA,
+        "title": "Stronger IPA",
+        "abv": 7.0,
+        "derivedDrinkId": DRINK_ID_BEER,
+    })
+
+    assert catalog.title(CUSTOM_IPA) == "Custom IPA"
+    assert updated.title(CUSTOM_IPA) == "Stronger IPA"
+    assert len(updated) == len(catalog)
+    assert updated.drinks_with_abv(6.5) == ()
+
+
+async def test_shared_standard_drinks_single_flight(hass, load_fixture):
+    """Test that concurrent accounts share one fetch of the standard drinks."""
+    shared = async_get_shared_standard_drinks(hass)
+    fetch = AsyncMock(return_value=StandardDrinks(load_fixture("drinks.json")))
+
+    first, second = await asyncio.gather(shared.async_get(fetch), shared.async_get(fetch))
+    assert first is second
+    assert fetch.call_count == 1
+
+    # Fresh standard drinks are reused, without any account's custom drinks
+    assert await shared.async_get(fetch) is first
+    assert fetch.call_count == 1
+    assert CRAFT_BEER not in first.by_id
+
+    # Catalogs built on the shared drinks only index their own custom drinks
+    catalog = DrinkCatalog(custom_drinks=load_fixture("drinks.json")["results"], standard=first)
+    assert catalog.standard_drinks is first.drinks
+    assert [drink.drink_id for drink in catalog.custom_drinks] == [CRAFT_BEER]
+
+
+async def test_shared_standard_drinks_failed_fetch(hass, load_fixture):
+    """Test that a failed fetch is retried by the next account."""
+    shared = async_get_shared_standard_drinks(hass)
+
+    assert await shared.async_get(AsyncMock(return_value=None)) is None
+
+    standard = await shared.async_get(AsyncMock(return_value=StandardDrinks(load_fixture("drinks.json"))))
+    assert DRINK_ID_LAGER in standard.by_id
+
+
+async def test_shared_standard_drinks_fetch_error(hass, load_fixture):
+    """Test that a fetch that raises before suspending is retried by the next account."""
+    shared = async_get_shared_standard_drinks(hass)
+
+    with pytest.raises(RuntimeError):
+        await shared.async_get(AsyncMock(side_effect=RuntimeError("API unavailable")))
+
+    standard = await shared.async_get(AsyncMock(return_value=StandardDrinks(load_fixture("drinks.json"))))
+    assert DRINK_ID_LAGER in standard.by_id
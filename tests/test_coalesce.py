@@ -0,0 +1,84 @@
+"""Test the Drinkaware request coalescing."""
+import asyncio
+
+import pytest
+
+from custom_components.drinkaware.coalesce import RequestCoalescer, fresh_reads
+
+
+async def test_identical_requests_share_one_fetch():
+    """Test that concurrent requests for a key make one fetch."""
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return {"activity": []}
+
+    tasks = [asyncio.create_task(coalescer.async_request("summary", fetch)) for _ in range(3)]
+    other = asyncio.create_task(coalescer.async_request("stats", fetch))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, other)
+
+    assert len(calls) == 2
+    assert results[0] is results[1] is results[2]
+    assert coalescer.as_dict() == {"requests": 4, "hits": 2, "hit_rate": 0.5, "in_flight": 0}
+
+    # Finished requests are not cached
+    await coalescer.async_request("summary", fetch)
+    assert len(calls) == 3
+
+
+async def test_errors_and_fresh_reads():
+    """Test that errors reach every waiter and fresh reads never join."""
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await release.wait()
+        raise RuntimeError("API down")
+
+    async def fresh_request():
+        with fresh_reads():
+            return await coalescer.async_request("summary", fail)
+
+    tasks = [
+        asyncio.create_task(coalescer.async_request("summary", fail)),
+        asyncio.create_task(coalescer.async_request("summary", fail)),
+        asyncio.create_task(fresh_request()),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 2
+    assert coalescer.hits == 1
+
+
+async def test_waiters_retry_when_the_leader_is_cancelled():
+    """Test that cancelling the leading request does not cancel the others."""
+    coalescer = RequestCoalescer()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def quick():
+        return "ok"
+
+    leader = asyncio.create_task(coalescer.async_request("summary", slow))
+    await started.wait()
+    waiter = asyncio.create_task(coalescer.async_request("summary", quick))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,73 @@
+"""Test the Drinkaware drink and measure compatibility matrix."""
+from custom_components.drinkaware.catalog import DrinkCatalog
+from custom_components.drinkaware.compatibility import CompatibilityMatrix
+from custom_components.drinkaware.drink_constants import (
+    DRINK_ID_LAGER,
+    DRINK_ID_VODKA,
+    MEASURE_ID_PINT,
+    MEASURE_ID_HALF_PINT,
+    MEASURE_ID_SINGLE_SPIRIT,
+    MEASURE_ID_DOUBLE_SPIRIT,
+)
+
+
+def test_compatible_measures():
+    """Test validation and measure options for a known drink."""
+    matrix = CompatibilityMatrix.from_constants()
+
+    assert matrix.is_compatible(DRINK_ID_VODKA, MEASURE_ID_SINGLE_SPIRIT)
+    assert matrix.error(DRINK_ID_VODKA, MEASURE_ID_SINGLE_SPIRIT) is None
+    assert [option["value"] for option in matrix.measure_options(DRINK_ID_VODKA)] == [
+        MEASURE_ID_SINGLE_SPIRIT,
+        MEASURE_ID_DOUBLE_SPIRIT,
+    ]
+
+    # Unknown drinks are not restricted
+    assert matrix.is_compatible("unknown", MEASURE_ID_PINT)
+    assert matrix.measure_options("unknown") is None
+
+
+def test_incompatible_error_message():
+    """Test the pre-rendered error messages."""
+    matrix = CompatibilityMatrix.from_constants()
+
+    assert matrix.error(DRINK_ID_VODKA, MEASURE_ID_PINT) == (
+        "Incompatible drink and measure combination: Vodka cannot be served in Pint (568ml). "
+        "Compatible measures for Vodka are: Single spirit measure (25ml), Double spirit measure (50ml)"
+    )
+    assert "cannot be served in Unknown measure." in matrix.error(DRINK_ID_VODKA, "not-a-measure")
+
+
+def test_learn_from_catalog():
+    """Test that measures listed in the live catalog are allowed."""
+    matrix = CompatibilityMatrix.from_constants()
+    catalog = DrinkCatalog({
+        "categories": [
+            {
+                "title": "Spirits",
+                "drinks": [
+                    {
+                        "drinkId": DRINK_ID_VODKA,
+                        "title": "Vodka",
+                        "measures": [{"measureId": "triple-measure", "title": "Triple (75ml)"}],
+                    },
+                    {
+                        "drinkId": "new-drink",
+                        "title": "Hard Seltzer",
+                        "measures": [{"measureId": MEASURE_ID_HALF_PINT, "title": "Half pint"}],
+                    },
+                ],
+            }
+        ]
+    })
+
+    learned = matrix.with_catalog(catalog)
+    assert learned.is_compatible(DRINK_ID_VODKA, "triple-measure")
+    assert not learned.is_compatible("new-drink", MEASURE_ID_PINT)
+    assert "Hard Seltzer cannot be served in Pint (568ml)" in learned.error("new-drink", MEASURE_ID_PINT)
+
+    # The original matrix is unchanged and learning again is a no-op
+    assert not matrix.is_compatible(DRINK_ID_VODKA, "triple-measure")
+    assert learned.with_catalog(catalog) is learned
+    assert matrix.with_catalog(DrinkCatalog({"categories": []})) is matrix
+    assert learned.is_compatible(DRINK_ID_LAGER, MEASURE_ID_PINT)
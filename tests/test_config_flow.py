@@ -2,7 +2,9 @@
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 from homeassistant import config_entries, data_entry_flow
-from custom_components.drinkaware.const import DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.drinkaware.const import DOMAIN, CONF_TRACE_REQUESTS
 
 
 async def test_form_user(hass):
@@ -246,4 +248,21 @@ async def test_code_step_failure(hass):
             
             # Check that we have an error
             assert result["type"] == "form"
-            assert result["errors"]["base"] == "no_code_in_url"
\ No newline at end of file
+            assert result["errors"]["base"] == "no_code_in_url"
+
+async def test_options_flow(hass):
+    """Test turning on request tracing from the options."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"account_name": "Test Account"}, options={})
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.drinkaware.async_setup_entry", return_value=True):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        assert result["type"] == "form"
+        assert result["step_id"] == "init"
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_TRACE_REQUESTS: True}
+        )
+
+    assert result["type"] == "create_entry"
+    assert entry.options == {CONF_TRACE_REQUESTS: True}
@@ -1,10 +1,12 @@
 """Test the Drinkaware data update coordinator."""
+import json
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 from datetime import datetime, timedelta
 import aiohttp
 
 from custom_components.drinkaware import DrinkAwareDataUpdateCoordinator
+from custom_components.drinkaware.catalog import GenericDrinks
 from custom_components.drinkaware.const import DOMAIN
 
 
@@ -16,7 +18,7 @@ def mock_session():
     # Mock response for API calls
     mock_resp = AsyncMock()
     mock_resp.status = 200
-    mock_resp.json = AsyncMock(return_value={"success": True})
+    mock_resp.read = AsyncMock(return_value=b'{"success": true}')
     mock_resp.text = AsyncMock(return_value="Success")
     
     # Configure session methods to return the mock response
@@ -54,7 +56,7 @@ async def test_coordinator_initialization(coordinator):
     assert coordinator.account_name == "Test Account"
     assert coordinator.email == "test@example.com"
     assert coordinator._rate_limited is False
-    assert coordinator.drinks_cache is None
+    assert coordinator.catalog is None
 
 
 @pytest.mark.parametrize(
@@ -71,7 +73,7 @@ async def test_make_api_request(coordinator, mock_session, status_code, expected
     mock_resp = AsyncMock()
     mock_resp.status = status_code
     if status_code == 200:
-        mock_resp.json = AsyncMock(return_value={"success": True})
+        mock_resp.read = AsyncMock(return_value=b'{"success": true}')
     mock_resp.text = AsyncMock(return_value="Error message")
     
     # Update the session get method to return our custom response
@@ -100,13 +102,15 @@ async def test_rate_limit_handling(coordinator, mock_session):
     # Configure the mock response for successful retry
     success_resp = AsyncMock()
     success_resp.status = 200
-    success_resp.json = AsyncMock(return_value={"success": True})
+    success_resp.read = AsyncMock(return_value=b'{"success": true}')
     
     # Set up the session to return rate limit first, then success
     mock_session.get.return_value.__aenter__.side_effect = [rate_limit_resp, success_resp]
     
-    # Mock sleep to avoid waiting in the test
-    with patch("asyncio.sleep") as mock_sleep:
+    # Mock sleep to avoid waiting in the test, noting whether the request slot was released first
+    in_flight = []
+    record_in_flight = lambda seconds: in_flight.append(coordinator.orchestrator.in_flight)
+    with patch("asyncio.sleep", side_effect=record_in_flight) as mock_sleep:
         # Call the method
         result = await coordinator._make_api_request("https://api.drinkaware.co.uk/test")
         
@@ -119,6 +123,16 @@ async def test_rate_limit_handling(coordinator, mock_session):
         # Verify that the request was made twice
         assert mock_session.get.call_count == 2
 
+    # Other accounts can use the slot while this one waits
+    assert in_flight == [0]
+
+    # Both responses and the retry are counted against the endpoint
+    metrics = coordinator.request_metrics.endpoints["/test"]
+    assert metrics.requests == 2
+    assert metrics.statuses == {429: 1, 200: 1}
+    assert metrics.retries == 1
+    assert metrics.rate_limit_wait == 2
+
 
 async def test_refresh_token(coordinator, mock_session, hass):
     """Test token refresh functionality."""
@@ -153,4 +167,100 @@ async def test_refresh_token(coordinator, mock_session, hass):
     # Verify that config entry was updated
     hass.config_entries.async_update_entry.assert_called_once()
     update_data = hass.config_entries.async_update_entry.call_args.kwargs["data"]
-    assert update_data["token"]["access_token"] == "new_access_token"
\ No newline at end of file
+    assert update_data["token"]["access_token"] == "new_access_token"
+
+async def test_catalog_update_runs_in_background(coordinator, hass):
+    """Test that the drinks catalog is fetched once in a background task."""
+    with patch.object(coordinator, "_update_catalog_if_needed") as mock_update:
+        coordinator.async_schedule_catalog_update()
+        coordinator.async_schedule_catalog_update()
+        await hass.async_block_till_done()
+
+    assert mock_update.call_count == 1
+
+
+async def test_failed_first_catalog_fetch_is_retried(coordinator):
+    """Test that no catalog is built without standard drinks, so the next update tries again."""
+    with patch.object(coordinator, "_fetch_available_drinks", return_value=None), patch.object(
+        coordinator, "_fetch_search_drinks"
+    ) as mock_search:
+        await coordinator._update_catalog_if_needed()
+
+    assert coordinator.catalog is None
+    assert coordinator._catalog_update_due()
+    mock_search.assert_not_called()
+
+
+async def test_catalog_keeps_custom_drinks_from_generic_response(coordinator, load_fixture):
+    """Test that the custom drinks listed with the standard drinks are kept in the account's catalog."""
+    generic = load_fixture("drinks.json")
+    with patch.object(
+        coordinator, "_fetch_available_drinks", return_value=GenericDrinks(generic)
+    ), patch.object(coordinator, "_fetch_search_drinks", return_value=()):
+        await coordinator._update_catalog_if_needed()
+
+    for drink in generic["customDrinks"]:
+        assert coordinator.catalog.is_custom(drink["drinkId"])
+        assert coordinator.catalog.title(drink["drinkId"]) == drink["title"]
+    assert len(coordinator.catalog.standard_drinks) == len(GenericDrinks(generic).standard.drinks)
+
+
+async def test_search_drinks_are_parsed_in_the_request(coordinator, mock_session, load_fixture):
+    """Test that search responses are reduced to Drink models as they are decoded."""
+    mock_resp = mock_session.get.return_value.__aenter__.return_value
+    mock_resp.read = AsyncMock(return_value=json.dumps(load_fixture("drinks.json")).encode())
+
+    drinks = await coordinator._fetch_search_drinks()
+
+    assert isinstance(drinks, tuple)
+    assert [drink.title for drink in drinks] == [result["title"] for result in load_fixture("drinks.json")["results"]]
+    mock_resp.json.assert_not_called()
+
+
+async def test_changed_days_in_breakdown_window_refetch_activity(coordinator, hass):
+    """Test that edits to earlier days in the breakdown windows refetch those days' drinks."""
+    today = datetime.now()
+    days = [
+        {"date": (today - timedelta(days=offset)).strftime("%Y-%m-%d"), "drinks": 1, "units": 2.3, "drinkFreeDay": False}
+        for offset in (0, 1, 400)
+    ]
+    yesterday, too_old = days[1]["date"], days[2]["date"]
+    drinks = [{"drinkId": "drink-1", "measureId": "measure-1", "name": "Lager", "abv": 4.0, "quantity": 1}]
+
+    with patch.object(coordinator, "_fetch_summary", return_value={"activitySummaryDays": days}), patch.object(
+        coordinator.history, "async_merge_days", return_value=days[1:]
+    ), patch.object(coordinator, "_async_update_today_activity"), patch.object(
+        coordinator, "_fetch_activity_for_day", return_value={"activity": drinks}
+    ) as mock_fetch, patch.object(coordinator.history, "async_set_activity") as mock_set:
+        await coordinator._fetch_and_update_summary({})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_fetch.assert_called_once_with(yesterday)
+    mock_set.assert_called_once_with(yesterday, drinks)
+    assert too_old not in coordinator._stale_activity_days
+    assert not coordinator._stale_activity_days
+
+
+async def test_open_breaker_keeps_last_data(coordinator, mock_session):
+    """Test that polls short-circuit to the last data while the API is down."""
+    coordinator.data = {"stats": {"daysTracked": {"total": 30}}}
+    for _ in range(5):
+        coordinator.breaker.async_record_failure()
+
+    assert await coordinator._async_update_data() == coordinator.data
+    mock_session.get.assert_not_called()
+
+
+async def test_refresh_phases_are_timed(coordinator, hass):
+    """Test that each refresh records the time spent in its phases."""
+    with patch.object(coordinator, "_fetch_and_update_summary", side_effect=lambda data: data), patch.object(
+        coordinator, "_update_catalog_if_needed"
+    ), patch.object(coordinator.history, "async_save_snapshot"):
+        await coordinator._async_update_data()
+        await hass.async_block_till_done()
+
+    profile = coordinator.profiler.last
+    assert list(profile.phases)[:4] == ["assessment", "stats", "goals", "summary"]
+    assert "catalog" in profile.phases
+    assert profile.total >= profile.phases["assessment"]
+    assert coordinator.profiler.as_dict()["refreshes"][0]["phases"].keys() == profile.phases.keys()
@@ -0,0 +1,98 @@
+"""Test the Drinkaware custom drinks sync."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.drinkaware.catalog import DrinkCatalog
+from custom_components.drinkaware.const import (
+    CUSTOM_DRINKS_MAX_PAGES,
+    CUSTOM_DRINKS_PAGE_SIZE,
+    CUSTOM_DRINKS_SYNC_CONCURRENCY,
+)
+from custom_components.drinkaware.custom_drinks import CustomDrinkSync
+from custom_components.drinkaware.drink_constants import DRINK_ID_BEER
+from custom_components.drinkaware.models import Drink
+
+CUSTOM_DRINKS = CUSTOM_DRINKS_PAGE_SIZE * CUSTOM_DRINKS_SYNC_CONCURRENCY + 10
+
+
+def _custom_drink(index, title=None):
+    """Return a custom drink as a search result."""
+    return Drink(drink_id=f"custom-{index}", title=title or f"Custom {index}", abv=5.0, derived_drink_id=DRINK_ID_BEER)
+
+
+def _mock_coordinator(load_fixture, drinks):
+    """Create a coordinator whose search pages through drinks."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator._rate_limited = False
+    coordinator.catalog = DrinkCatalog(load_fixture("drinks.json"))
+
+    async def search(page, per_page):
+        start = (page - 1) * per_page
+        return tuple(drinks[start:start + per_page])
+
+    coordinator._fetch_search_drinks = AsyncMock(side_effect=search)
+    return coordinator
+
+
+async def test_first_sync_reads_every_page(load_fixture):
+    """Test that the first sync merges every page into the catalog."""
+    drinks = [_custom_drink(index) for index in range(CUSTOM_DRINKS)]
+    coordinator = _mock_coordinator(load_fixture, drinks)
+    sync = CustomDrinkSync(coordinator)
+    assert sync.due
+
+    assert await sync.async_sync() == CUSTOM_DRINKS
+    assert sync.complete
+    assert not sync.due
+    assert sync.pages == 2 * CUSTOM_DRINKS_SYNC_CONCURRENCY
+    assert all(drink.drink_id in coordinator.catalog for drink in drinks)
+    assert coordinator._fetch_search_drinks.call_args_list[0].args == (1, CUSTOM_DRINKS_PAGE_SIZE)
+
+
+async def test_later_syncs_stop_at_known_drinks(load_fixture):
+    """Test that once synced, a sync stops at the first batch with nothing new."""
+    drinks = [_custom_drink(index) for index in range(CUSTOM_DRINKS)]
+    coordinator = _mock_coordinator(load_fixture, drinks)
+    sync = CustomDrinkSync(coordinator)
+    await sync.async_sync()
+    catalog = coordinator.catalog
+    coordinator._fetch_search_drinks.reset_mock()
+
+    # Nothing changed, so only the first batch is read and the catalog is kept
+    assert await sync.async_sync() == 0
+    assert coordinator._fetch_search_drinks.call_count == CUSTOM_DRINKS_SYNC_CONCURRENCY
+    assert coordinator.catalog is catalog
+
+    # A renamed drink is merged by drink ID
+    drinks[0] = _custom_drink(0, title="Renamed")
+    assert await sync.async_sync() == 1
+    assert coordinator.catalog.title("custom-0") == "Renamed"
+    assert len(coordinator.catalog) == len(catalog)
+
+
+async def test_failed_page_leaves_sync_due(load_fixture):
+    """Test that a failed page stops the sync so it is tried again."""
+    coordinator = _mock_coordinator(load_fixture, [])
+    coordinator._fetch_search_drinks = AsyncMock(return_value=None)
+    sync = CustomDrinkSync(coordinator)
+
+    assert await sync.async_sync() == 0
+    assert sync.due
+    assert not sync.complete
+
+
+async def test_sync_stops_at_page_limit(load_fixture):
+    """Test that a search that never returns a short page stops at the page limit."""
+    coordinator = _mock_coordinator(load_fixture, [])
+    coordinator._fetch_search_drinks = AsyncMock(
+        side_effect=lambda page, per_page: tuple(_custom_drink(page * per_page + index) for index in range(per_page))
+    )
+    sync = CustomDrinkSync(coordinator)
+
+    with patch("custom_components.drinkaware.custom_drinks._LOGGER") as mock_logger:
+        assert await sync.async_sync() == CUSTOM_DRINKS_MAX_PAGES * CUSTOM_DRINKS_PAGE_SIZE
+
+    assert coordinator._fetch_search_drinks.call_count == CUSTOM_DRINKS_MAX_PAGES
+    assert sync.complete
+    assert not sync.due
+    mock_logger.warning.assert_called_once()
@@ -0,0 +1,28 @@
+"""Test the Drinkaware dynamic service options."""
+from unittest.mock import MagicMock
+
+from custom_components.drinkaware.catalog import DrinkCatalog
+from custom_components.drinkaware.const import DOMAIN
+from custom_components.drinkaware.dynamic_services import async_get_available_drinks
+
+
+def _coordinator(account_name, generic):
+    """Create a mock coordinator with a drinks catalog."""
+    coordinator = MagicMock()
+    coordinator.account_name = account_name
+    coordinator.catalog = DrinkCatalog(generic)
+    return coordinator
+
+
+async def test_available_drinks(hass, load_fixture):
+    """Test that standard drinks are listed once and custom drinks once per account."""
+    first = _coordinator("First", load_fixture("drinks.json"))
+    second = _coordinator("Second", load_fixture("drinks.json"))
+    hass.data[DOMAIN] = {"first": first, "second": second, "account_name_map": {}}
+
+    labels = [option["label"] for option in async_get_available_drinks(hass)]
+
+    assert len([label for label in labels if label.startswith("Lager ")]) == 1
+    assert "Custom IPA (6.5% ABV) - Custom [First]" in labels
+    assert "Custom IPA (6.5% ABV) - Custom [Second]" in labels
+    assert labels.index("Cider (4.5% ABV)") < labels.index("Lager (4.0% ABV)")
@@ -0,0 +1,146 @@
+"""Test the Drinkaware local history and backfill."""
+from unittest.mock import patch, MagicMock, AsyncMock
+from datetime import date, timedelta
+import pytest
+
+from custom_components.drinkaware.history import DrinkAwareHistory
+from custom_components.drinkaware.backfill import DrinkAwareBackfill
+from custom_components.drinkaware.const import BACKFILL_RATE_LIMITED_DELAY
+from custom_components.drinkaware.orchestrator import PRIORITY_LOW, _priority
+
+
+@pytest.fixture
+async def history(hass):
+    """Create an empty history backed by a fresh local store."""
+    history = DrinkAwareHistory(hass, "test_entry_id")
+    await history.async_remove()
+    await history.async_load()
+    yield history
+    await history.async_remove()
+
+
+async def test_merge_days_returns_changed_days(history):
+    """Test that merging only reports new or changed days."""
+    days = [
+        {"date": "2025-04-20", "drinks": 2, "units": 4.5, "drinkFreeDay": False, "ignored": "x"},
+        {"date": "2025-04-19", "drinks": 0, "units": 0, "drinkFreeDay": True},
+    ]
+
+    changed = await history.async_merge_days(days)
+    assert [day["date"] for day in changed] == ["2025-04-20", "2025-04-19"]
+    assert "ignored" not in history.days["2025-04-20"]
+
+    assert await history.async_merge_days(days) == []
+
+    changed = await history.async_merge_days([dict(days[0], drinks=3)])
+    assert changed == [{"date": "2025-04-20", "drinks": 3, "units": 4.5, "drinkFreeDay": False}]
+
+
+async def test_get_days_range(history):
+    """Test range reads are inclusive and sorted oldest first."""
+    await history.async_merge_days([
+        {"date": "2025-04-20", "drinks": 2, "units": 4.5, "drinkFreeDay": False},
+        {"date": "2025-04-18", "drinks": 0, "units": 0, "drinkFreeDay": True},
+        {"date": "2025-04-19", "drinks": 1, "units": 2.3, "drinkFreeDay": False},
+    ])
+
+    days = history.async_get_days("2025-04-19", "2025-04-20")
+    assert [day["date"] for day in days] == ["2025-04-19", "2025-04-20"]
+
+
+async def test_history_survives_reload(hass, history):
+    """Test that days, activity and sleep quality are read back from the store after a restart."""
+    await history.async_merge_days([{"date": "2025-04-20", "drinks": 2, "units": 4.5, "drinkFreeDay": False}])
+    await history.async_set_activity("2025-04-20", [
+        {"drinkId": "drink-1", "measureId": "measure-1", "name": "Lager", "abv": 4.0, "quantity": 2},
+        {"name": "No IDs, skipped"},
+    ])
+    await history.async_set_sleep_quality("2025-04-20", "great")
+    await history.async_save_snapshot({"stats": {"goalsAchieved": 2}, "summary": []})
+    await history.async_close()
+
+    reloaded = DrinkAwareHistory(hass, "test_entry_id")
+    snapshot = await reloaded.async_load()
+
+    assert reloaded.days == {"2025-04-20": {"units": 4.5, "drinks": 2, "drinkFreeDay": False}}
+    assert reloaded.sleep == {"2025-04-20": "great"}
+    assert list(reloaded.dates) == ["2025-04-20"]
+    assert snapshot["data"] == {"stats": {"goalsAchieved": 2}}
+
+    activity = await reloaded.async_get_activity("2025-04-20", "2025-04-20")
+    assert len(activity) == 1
+    assert activity[0]["drink_id"] == "drink-1"
+    assert activity[0]["quantity"] == 2
+
+    assert await reloaded.async_get_activity(drink_id="other") == []
+    await reloaded.async_close()
+
+
+async def test_backfill_walks_back_to_tracking_since(history):
+    """Test that the backfill fetches chunks until trackingSince and persists progress."""
+    tracking_since = date.today() - timedelta(days=60)
+
+    coordinator = MagicMock()
+    coordinator._rate_limited = False
+    priorities = []
+
+    async def fetch_summary_range(start, end):
+        priorities.append(_priority.get())
+        days = []
+        current = start
+        while current <= end:
+            days.append({"date": current.strftime("%Y-%m-%d"), "drinks": 0, "units": 0, "drinkFreeDay": True})
+            current += timedelta(days=1)
+        return {"activitySummaryDays": days}
+
+    coordinator._fetch_summary_range = AsyncMock(side_effect=fetch_summary_range)
+    backfill = DrinkAwareBackfill(coordinator, history)
+
+    with patch.object(history, "async_save", AsyncMock()) as mock_save, \
+         patch("custom_components.drinkaware.backfill.asyncio.sleep", AsyncMock()):
+        await backfill._async_run(tracking_since)
+
+    assert history.backfill_complete is True
+    assert history.backfill_cursor == tracking_since.strftime("%Y-%m-%d")
+    assert min(history.days) == tracking_since.strftime("%Y-%m-%d")
+    assert coordinator._fetch_summary_range.call_count == 2
+    assert mock_save.call_count == 3
+
+    # Chunks queue behind regular polling
+    assert priorities == [PRIORITY_LOW, PRIORITY_LOW]
+
+
+async def test_backfill_retries_after_a_failed_chunk(history):
+    """Test that a chunk that raises is fetched again after a delay, keeping the saved progress."""
+    tracking_since = date.today() - timedelta(days=20)
+
+    coordinator = MagicMock()
+    coordinator._rate_limited = False
+    days = [{"date": tracking_since.strftime("%Y-%m-%d"), "drinks": 0, "units": 0, "drinkFreeDay": True}]
+    coordinator._fetch_summary_range = AsyncMock(
+        side_effect=[Exception("401 Unauthorized - Token expired"), {"activitySummaryDays": days}]
+    )
+    backfill = DrinkAwareBackfill(coordinator, history)
+
+    with patch.object(history, "async_save", AsyncMock()), \
+         patch("custom_components.drinkaware.backfill.asyncio.sleep", AsyncMock()) as mock_sleep:
+        await backfill._async_run(tracking_since)
+
+    assert coordinator._fetch_summary_range.call_count == 2
+    assert coordinator._fetch_summary_range.call_args_list[0] == coordinator._fetch_summary_range.call_args_list[1]
+    mock_sleep.assert_any_call(BACKFILL_RATE_LIMITED_DELAY)
+    assert history.backfill_complete is True
+
+
+async def test_backfill_resumes_from_cursor(history):
+    """Test that a stored cursor is used as the starting point."""
+    tracking_since = date(2024, 1, 1)
+    history.backfill_cursor = "2024-03-01"
+    backfill = DrinkAwareBackfill(MagicMock(), history)
+
+    start, end = backfill._next_chunk(tracking_since)
+    assert end == date(2024, 2, 29)
+    assert start == date(2024, 2, 2)
+
+    history.backfill_cursor = "2024-01-01"
+    assert backfill._next_chunk(tracking_since) is None
@@ -0,0 +1,68 @@
+"""Test the Drinkaware request metrics."""
+import pytest
+
+from custom_components.drinkaware.metrics import (
+    STATUS_TIMEOUT,
+    RequestMetrics,
+    endpoint_name,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://api.drinkaware.co.uk/tracking/v1/stats", "/tracking/v1/stats"),
+        ("https://api.drinkaware.co.uk/tracking/v1/summary/2025-04-23/2025-04-09", "/tracking/v1/summary/{date}/{date}"),
+        ("https://api.drinkaware.co.uk/tracking/v1/activity/2025-04-23", "/tracking/v1/activity/{date}"),
+        (
+            "https://api.drinkaware.co.uk/tracking/v1/activity/2025-04-23/"
+            "FAB60DBF-911F-4286-9C3E-0F0BCB40E3B7/B59DCD68-96FF-4B4C-BA69-3707D085C407",
+            "/tracking/v1/activity/{date}/{id}/{id}",
+        ),
+        ("https://api.drinkaware.co.uk/tracking/v1/activity/2025-04-23/drinkfreeday", "/tracking/v1/activity/{date}/drinkfreeday"),
+    ],
+)
+def test_endpoint_name(url, expected):
+    """Test that dates and IDs are replaced so calls to one endpoint share a name."""
+    assert endpoint_name(url) == expected
+
+
+def test_responses_are_counted_per_endpoint():
+    """Test the counts, statuses, latency histogram and sizes for each endpoint."""
+    metrics = RequestMetrics()
+    metrics.async_record_response("https://api/tracking/v1/activity/2025-04-22", 200, 0.05, 100)
+    metrics.async_record_response("https://api/tracking/v1/activity/2025-04-23", 200, 0.3, 300)
+    metrics.async_record_response("https://api/tracking/v1/activity/2025-04-23", 429, 20.0, 50)
+    metrics.async_record_retry("https://api/tracking/v1/activity/2025-04-23", 3)
+    metrics.async_record_error("https://api/tracking/v1/stats", STATUS_TIMEOUT)
+
+    activity = metrics.as_dict()["endpoints"]["/tracking/v1/activity/{date}"]
+    assert activity["requests"] == 3
+    assert activity["statuses"] == {"200": 2, "429": 1}
+    assert activity["latency_histogram"]["le_0.1s"] == 1
+    assert activity["latency_histogram"]["le_0.5s"] == 1
+    assert activity["latency_histogram"]["gt_10s"] == 1
+    assert activity["latency_max_ms"] == 20000.0
+    assert activity["bytes_received"] == 450
+    assert activity["retries"] == 1
+    assert activity["rate_limit_wait_seconds"] == 3
+
+    # A timeout is a request and an error, but has no latency
+    stats = metrics.as_dict()["endpoints"]["/tracking/v1/stats"]
+    assert stats["statuses"] == {"timeout": 1}
+    assert stats["latency_mean_ms"] is None
+
+    totals = metrics.totals()
+    assert totals["requests"] == 4
+    assert totals["errors"] == 2
+    assert totals["bytes_received"] == 450
+
+
+def test_token_refreshes_are_counted():
+    """Test that token refreshes and their failures are counted."""
+    metrics = RequestMetrics()
+    metrics.async_record_token_refresh(success=True)
+    metrics.async_record_token_refresh(success=False)
+
+    assert metrics.totals()["token_refreshes"] == 2
+    assert metrics.totals()["token_refresh_failures"] == 1
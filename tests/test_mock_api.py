@@ -0,0 +1,30 @@
+"""Test the local Drinkaware API used by the benchmarks."""
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from tests.mock_api import MockDrinkawareApi
+
+
+async def test_mock_api(hass, socket_enabled):
+    """Test fixture serving, 429 injection and token expiry."""
+    api = MockDrinkawareApi()
+    await api.start()
+    session = async_get_clientsession(hass)
+    headers = {"Authorization": "Bearer token"}
+
+    try:
+        async with session.get(f"{api.base_url}/tracking/v1/stats", headers=headers) as resp:
+            assert resp.status == 200
+            assert (await resp.json())["daysTracked"]["total"] == 30
+
+        api.rate_limit(1, retry_after=2)
+        async with session.get(f"{api.base_url}/tracking/v1/stats", headers=headers) as resp:
+            assert resp.status == 429
+            assert "Try again in 2 seconds" in await resp.text()
+
+        api.expire_tokens()
+        async with session.get(f"{api.base_url}/tracking/v1/stats", headers=headers) as resp:
+            assert resp.status == 401
+
+        assert api.requests["GET /tracking/v1/stats"] == 3
+    finally:
+        await api.stop()
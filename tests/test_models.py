@@ -0,0 +1,68 @@
+"""Test the Drinkaware API payload models."""
+from custom_components.drinkaware.models import (
+    Assessment,
+    Drink,
+    data_to_api,
+    parse_data,
+    parse_days,
+)
+
+
+def test_parse_data(load_fixture):
+    """Test that fetched payloads are parsed into models."""
+    data = parse_data({
+        "assessment": load_fixture("assessment.json")["assessments"][0],
+        "stats": load_fixture("stats.json"),
+        "goals": load_fixture("goals.json")["goals"],
+        "summary": load_fixture("summary.json")["activitySummaryDays"],
+    })
+
+    assert isinstance(data["assessment"], Assessment)
+    assert data["stats"].tracking_since == load_fixture("stats.json")["trackingSince"]
+    assert data["goals"][0].type == "drinkFreeDays"
+    assert len(data["summary"]) == len(load_fixture("summary.json")["activitySummaryDays"])
+
+    # Stored snapshots round-trip through the API shapes
+    assert parse_data(data_to_api(data)) == data
+
+
+def test_parse_days_shares_dates():
+    """Test that days without a date are skipped and dates are interned."""
+    date = "".join(["2025-04-", "20"])
+    days = parse_days([{"date": date, "drinks": 2, "units": 4.5, "drinkFreeDay": False}, {"drinks": 1}])
+
+    assert len(days) == 1
+    assert days[0].date is parse_days([{"date": "2025-04-20"}])[0].date
+    assert days[0].drinks == 2
+    assert not days[0].drink_free_day
+
+
+def test_assessment_score_attributes():
+    """Test that scores are labelled in display order."""
+    assessment = Assessment.from_api({"riskLevel": "low", "frequencyScore": 1, "guiltScore": 2})
+
+    attributes = assessment.score_attributes()
+    assert list(attributes)[:2] == ["Frequency", "Units"]
+    assert attributes["Frequency"] == 1
+    assert attributes["Guilt"] == 2
+    assert attributes["Units"] is None
+
+
+def test_drink_from_search_result():
+    """Test that a search result's inline measure becomes the drink's measure."""
+    drink = Drink.from_api({
+        "drinkId": "custom-1",
+        "derivedDrinkId": "standard-1",
+        "title": "Craft IPA",
+        "abv": 6.5,
+        "measureId": "measure-1",
+        "measureName": "Pint",
+        "measure": 0.568,
+    })
+
+    assert drink.is_custom
+    assert [(measure.measure_id, measure.title, measure.litres) for measure in drink.measures] == [
+        ("measure-1", "Pint", 0.568)
+    ]
+    assert Drink.from_api(drink.to_api()) == drink
+    assert not hasattr(drink, "__dict__")
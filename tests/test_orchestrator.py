@@ -0,0 +1,133 @@
+"""Test the Drinkaware request orchestrator."""
+import asyncio
+
+from custom_components.drinkaware.orchestrator import RequestOrchestrator, interactive_requests, low_priority_requests
+
+
+async def _request(orchestrator, entry_id, served, release, interactive=False):
+    """Hold a slot until released, recording the order requests were served in."""
+    async with orchestrator.slot(entry_id, interactive=interactive):
+        served.append(entry_id)
+        await release.wait()
+
+
+async def test_requests_are_capped_and_fair():
+    """Test that accounts take turns once the budget is used up."""
+    orchestrator = RequestOrchestrator(max_in_flight=1)
+    served = []
+    release = asyncio.Event()
+
+    # Account "a" queues three requests before "b" and "c" queue one each
+    tasks = [
+        asyncio.create_task(_request(orchestrator, entry_id, served, release))
+        for entry_id in ("a", "a", "a", "b", "c")
+    ]
+    await asyncio.sleep(0)
+    assert orchestrator.in_flight == 1
+    assert orchestrator.as_dict()["queued"]["background"] == 4
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert served == ["a", "a", "b", "c", "a"]
+    assert orchestrator.in_flight == 0
+    metrics = orchestrator.as_dict()["accounts"]
+    assert metrics["a"]["requests"] == 3
+    assert metrics["a"]["max_queued"] == 2
+    assert metrics["b"]["queued"] == 0
+
+
+async def test_interactive_requests_go_first():
+    """Test that service calls jump ahead of queued polling."""
+    orchestrator = RequestOrchestrator(max_in_flight=1)
+    served = []
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_request(orchestrator, "a", served, release)),
+        asyncio.create_task(_request(orchestrator, "b", served, release)),
+        asyncio.create_task(_request(orchestrator, "c", served, release, interactive=True)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert served == ["a", "c", "b"]
+    assert orchestrator.metrics("c").interactive_requests == 1
+
+
+async def test_low_priority_requests_go_last():
+    """Test that bulk fetches wait behind polling and service calls."""
+    orchestrator = RequestOrchestrator(max_in_flight=1)
+    served = []
+    release = asyncio.Event()
+
+    async def backfill(entry_id):
+        with low_priority_requests():
+            await _request(orchestrator, entry_id, served, release)
+
+    tasks = [
+        asyncio.create_task(_request(orchestrator, "a", served, release)),
+        asyncio.create_task(backfill("b")),
+        asyncio.create_task(_request(orchestrator, "c", served, release)),
+        asyncio.create_task(_request(orchestrator, "d", served, release, interactive=True)),
+    ]
+    await asyncio.sleep(0)
+    assert orchestrator.as_dict()["queued"] == {"interactive": 1, "background": 1, "low": 1}
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert served == ["a", "d", "c", "b"]
+    assert orchestrator.metrics("b").interactive_requests == 0
+
+
+async def test_nested_slots_and_cancellation():
+    """Test that a task can nest slots and cancelled waiters give up their place."""
+    orchestrator = RequestOrchestrator(max_in_flight=1)
+
+    async with orchestrator.slot("a"):
+        # Nested requests in the same task reuse the held slot
+        async with orchestrator.slot("a"):
+            assert orchestrator.in_flight == 1
+
+        waiter = asyncio.create_task(orchestrator.slot("b").__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert orchestrator.as_dict()["queued"]["background"] == 0
+
+    assert orchestrator.in_flight == 0
+
+
+async def test_run_interactive_bounds_concurrency():
+    """Test that gathered service work stays within the budget."""
+    orchestrator = RequestOrchestrator(max_in_flight=2)
+    peak = 0
+
+    async def refresh(entry_id):
+        nonlocal peak
+        async with orchestrator.slot(entry_id):
+            peak = max(peak, orchestrator.in_flight)
+            await asyncio.sleep(0)
+
+    results = await orchestrator.async_run_interactive([refresh(entry_id) for entry_id in "abcde"])
+
+    assert results == [None] * 5
+    assert peak == 2
+    assert orchestrator.metrics("a").interactive_requests == 1
+
+
+async def test_interactive_requests_context():
+    """Test that requests made for a service call are interactive without holding a slot between them."""
+    orchestrator = RequestOrchestrator()
+
+    with interactive_requests():
+        for _ in range(2):
+            async with orchestrator.slot("a"):
+                assert orchestrator.in_flight == 1
+            assert orchestrator.in_flight == 0
+    async with orchestrator.slot("a"):
+        pass
+
+    assert orchestrator.metrics("a").requests == 3
+    assert orchestrator.metrics("a").interactive_requests == 2
@@ -0,0 +1,72 @@
+"""Test the Drinkaware refresh profiler."""
+import asyncio
+import logging
+
+from custom_components.drinkaware.profiler import RefreshProfiler
+
+
+async def test_phases_are_added_to_the_refresh():
+    """Test that phases are summed per refresh and only recent refreshes are kept."""
+    profiler = RefreshProfiler("Test Account", size=2)
+
+    for _ in range(3):
+        with profiler.refresh():
+            with profiler.phase("stats"):
+                await asyncio.sleep(0)
+            with profiler.phase("sleep"):
+                await asyncio.sleep(0.01)
+            with profiler.phase("sleep"):
+                await asyncio.sleep(0.01)
+
+    assert len(profiler.history) == 2
+    assert list(profiler.last.phases) == ["stats", "sleep"]
+    assert profiler.last.phases["sleep"] >= 0.02
+    assert profiler.last.total >= profiler.last.phases["sleep"]
+    assert set(profiler.as_dict()["phase_means"]) == {"stats", "sleep"}
+
+    # Phases outside a refresh are not recorded
+    with profiler.phase("catalog"):
+        pass
+    assert "catalog" not in profiler.last.phases
+
+
+async def test_retried_refresh_is_timed_once():
+    """Test that a refresh started from inside another is part of it."""
+    profiler = RefreshProfiler("Test Account")
+
+    with profiler.refresh() as outer:
+        with profiler.refresh() as inner:
+            with profiler.phase("token"):
+                pass
+
+    assert inner is outer
+    assert len(profiler.history) == 1
+    assert "token" in outer.phases
+
+
+async def test_background_phases_join_the_refresh_that_started_them():
+    """Test that tasks started during a refresh add their phases to it."""
+    profiler = RefreshProfiler("Test Account")
+
+    async def fetch_catalog():
+        with profiler.phase("catalog"):
+            await asyncio.sleep(0)
+
+    with profiler.refresh() as profile:
+        task = asyncio.create_task(fetch_catalog())
+    await task
+
+    assert "catalog" in profile.phases
+
+
+async def test_slow_refresh_warning(caplog):
+    """Test that refreshes over the threshold log a warning."""
+    profiler = RefreshProfiler("Test Account", slow_threshold=0.01)
+
+    with caplog.at_level(logging.WARNING):
+        with profiler.refresh():
+            with profiler.phase("summary"):
+                await asyncio.sleep(0.02)
+
+    assert "Refreshing Test Account took" in caplog.text
+    assert "summary" in caplog.text
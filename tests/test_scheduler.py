@@ -0,0 +1,115 @@
+"""Test the Drinkaware polling scheduler."""
+from datetime import datetime, timedelta, timezone
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.drinkaware.models import DaySummary
+from custom_components.drinkaware.scheduler import AdaptivePolling, PollingScheduler
+
+NOW = datetime(2025, 4, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_entries_are_spread_across_the_interval():
+    """Test that accounts get evenly spaced, deterministic slots."""
+    scheduler = PollingScheduler(interval=timedelta(hours=1), jitter=0)
+    for entry_id in ("c", "a", "d", "b"):
+        scheduler.async_add_entry(entry_id)
+
+    assert [scheduler.offset(entry_id) for entry_id in ("a", "b", "c", "d")] == [0, 900, 1800, 2700]
+    assert scheduler.async_next_refresh("b", NOW) == NOW + timedelta(minutes=15)
+    assert scheduler.async_delay_until_next_refresh("d", NOW) == timedelta(minutes=45)
+
+    # Removing an account spreads the others again
+    scheduler.async_remove_entry("b")
+    assert [scheduler.offset(entry_id) for entry_id in ("a", "c", "d")] == [0, 1200, 2400]
+
+
+def test_next_refresh_skips_slots_that_are_too_close():
+    """Test that a slot in the past or about to start moves to the next interval."""
+    scheduler = PollingScheduler(interval=timedelta(hours=1), jitter=0)
+    scheduler.async_add_entry("a")
+
+    assert scheduler.async_next_refresh("a", NOW) == NOW + timedelta(hours=1)
+    assert scheduler.async_next_refresh("a", NOW + timedelta(minutes=5)) == NOW + timedelta(hours=1)
+
+
+def test_jitter_stays_within_the_slot():
+    """Test that jitter never moves a refresh by more than a quarter of a slot."""
+    scheduler = PollingScheduler(interval=timedelta(hours=1), jitter=600)
+    for entry_id in ("a", "b"):
+        scheduler.async_add_entry(entry_id)
+
+    for _ in range(50):
+        next_refresh = scheduler.async_next_refresh("b", NOW)
+        assert abs((next_refresh - (NOW + timedelta(minutes=30))).total_seconds()) <= 600
+
+    schedule = scheduler.as_dict()
+    assert schedule["entries"]["b"]["offset_seconds"] == 1800
+    assert schedule["entries"]["b"]["next_refresh"] == next_refresh.isoformat()
+
+
+def test_adaptive_interval_backs_off_and_snaps_back():
+    """Test that unchanged polls back off until a change or a write."""
+    polling = AdaptivePolling()
+    quiet = NOW.replace(hour=4)  # Outside the default evening hours
+    summary = [DaySummary("2025-04-20")]
+
+    assert not polling.async_record_poll(summary, quiet)
+    assert polling.async_next_interval(quiet) == timedelta(hours=1)
+
+    # Each unchanged poll doubles the interval, up to the maximum
+    for expected in (timedelta(hours=2), timedelta(hours=4), timedelta(hours=4)):
+        assert not polling.async_record_poll(summary, quiet)
+        assert polling.async_next_interval(quiet) == expected
+
+    # A new drink resets the backoff and is remembered against the hour it was seen
+    assert polling.async_record_poll([DaySummary("2025-04-20", drinks=1, units=2.3)], quiet)
+    assert polling.async_next_interval(quiet) == timedelta(hours=1)
+    assert polling.activity_hours[dt_util.as_local(quiet).hour] == 1
+
+    # The window moving on to an empty new day is not a change
+    assert not polling.async_record_poll(
+        [DaySummary("2025-04-21"), DaySummary("2025-04-20", drinks=1, units=2.3)],
+        quiet,
+    )
+
+    # After a write the account is polled at the minimum interval for a while
+    polling.async_snap_back(quiet)
+    assert polling.async_next_interval(quiet + timedelta(minutes=30)) == timedelta(minutes=5)
+    assert polling.async_next_interval(quiet + timedelta(hours=2)) == timedelta(hours=1)
+
+
+def test_adaptive_interval_learns_active_hours():
+    """Test that learned hours and quiet weekdays change the interval."""
+    polling = AdaptivePolling()
+    local = dt_util.as_local(NOW)
+
+    hours = [0] * 24
+    hours[(local.hour + 1) % 24] = 8  # Drinks usually change the hour after NOW
+    days = {
+        (local - timedelta(weeks=week)).strftime("%Y-%m-%d"): {"drinks": 2}
+        for week in range(1, 5)
+    }
+    polling.async_learn(hours, days)
+    assert polling.is_active(NOW)
+    assert polling.async_next_interval(NOW) == timedelta(minutes=15)
+    assert not polling.is_active(NOW + timedelta(hours=4))
+
+    # A weekday that rarely has drinks is never treated as active
+    polling.async_learn(hours, {date_str: {"drinks": 0} for date_str in days})
+    assert not polling.is_active(NOW)
+
+
+def test_scheduler_polls_at_adaptive_interval():
+    """Test that an account keeps its relative slot at its adaptive interval."""
+    scheduler = PollingScheduler(interval=timedelta(hours=1), jitter=0)
+    for entry_id in ("a", "b"):
+        scheduler.async_add_entry(entry_id)
+
+    scheduler.async_snap_back("b")
+    delay = scheduler.async_delay_until_next_poll("b", dt_util.utcnow())
+    assert timedelta(seconds=60) <= delay <= timedelta(minutes=6)
+    assert scheduler.as_dict()["entries"]["b"]["adaptive"]["interval_seconds"] == 300
+
+    # The second of two slots in a 5 minute interval
+    assert scheduler.async_next_refresh("b", NOW, timedelta(minutes=5)) == NOW + timedelta(minutes=2, seconds=30)
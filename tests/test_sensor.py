@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 from datetime import datetime, timedelta
 
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, EntityCategory
 from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorDeviceClass,
@@ -24,7 +24,13 @@ from custom_components.drinkaware.const import (
     SLEEP_QUALITY,
     RISK_LEVEL_LOW,
 )
-from custom_components.drinkaware.sensor import DrinkAwareSensor
+from custom_components.drinkaware.models import Assessment, parse_days
+from custom_components.drinkaware.series import DaySeries
+from custom_components.drinkaware.sensor import (
+    POLLING_INTERVAL_DESCRIPTION,
+    DrinkAwarePollingIntervalSensor,
+    DrinkAwareSensor,
+)
 
 
 async def test_sensors_setup(hass, setup_integration, load_fixture):
@@ -38,8 +44,10 @@ async def test_sensors_setup(hass, setup_integration, load_fixture):
         if entity_id.startswith("sensor.drinkaware")
     ]
     
-    # There should be 10 sensors (risk_level, total_score, etc.)
-    assert len(entities) == 10
+    # There should be 10 sensors (risk_level, total_score, etc.) plus
+    # 9 unit breakdown sensors (8 drink types and by measure) for each of the 2 windows,
+    # 3 request metric sensors and the polling interval sensor, which are registered disabled
+    assert len(entities) == 32
 
 
 @pytest.mark.parametrize(
@@ -167,12 +175,7 @@ def test_sensor_entity_creation():
     coordinator.entry_id = "test_entry_id"
     coordinator.email = "test@example.com"
     coordinator.last_update_success = True
-    coordinator.data = {
-        "assessment": {
-            "riskLevel": RISK_LEVEL_LOW,
-            "totalScore": 5
-        }
-    }
+    coordinator.data = {"assessment": Assessment(risk_level=RISK_LEVEL_LOW, total_score=5)}
     
     # Create a sensor description
     description = SensorEntityDescription(
@@ -189,4 +192,132 @@ def test_sensor_entity_creation():
     assert sensor.unique_id == f"drinkaware_test_entry_id_{RISK_LEVEL}"
     assert sensor.device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
     assert sensor.native_value == "Low Risk"
-    assert sensor.available is True
\ No newline at end of file
+    assert sensor.available is True
+
+def test_unchanged_state_is_not_written():
+    """Test that coordinator updates which change nothing skip the state write."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.email = "test@example.com"
+    coordinator.last_update_success = True
+    coordinator.suppressed_writes = 0
+    coordinator.data = {"assessment": Assessment(risk_level=RISK_LEVEL_LOW, total_score=5)}
+
+    description = SensorEntityDescription(
+        key=TOTAL_SCORE,
+        name="Total Score",
+        icon="mdi:counter",
+    )
+    sensor = DrinkAwareSensor(coordinator, description)
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+        assert coordinator.suppressed_writes == 1
+
+        # A changed value is written again
+        coordinator.data["assessment"] = Assessment(risk_level=RISK_LEVEL_LOW, total_score=6)
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+        assert coordinator.suppressed_writes == 1
+
+
+def test_last_drink_date_falls_back_to_history():
+    """Test that the last drink date comes from the newest drinking day in the local history."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.data = {"summary": parse_days([{"date": "2025-04-23", "drinks": 0, "units": 0, "drinkFreeDay": True}])}
+    coordinator.history.days = {
+        "2025-01-04": {"units": 2.3, "drinks": 1, "drinkFreeDay": False},
+        "2025-03-02": {"units": 4.5, "drinks": 2, "drinkFreeDay": False},
+        "2025-03-03": {"units": 0, "drinks": 0, "drinkFreeDay": True},
+    }
+    # A day with only a sleep quality has no summary
+    coordinator.history.dates = DaySeries([*coordinator.history.days, "2025-03-04"])
+
+    description = SensorEntityDescription(key=LAST_DRINK_DATE, name="Last Drink Date", icon="mdi:glass-wine")
+    sensor = DrinkAwareSensor(coordinator, description)
+
+    assert sensor.native_value == datetime(2025, 3, 2).date()
+
+
+def test_polling_interval_changes_do_not_write_state():
+    """Test that the adaptive polling interval changing alone does not write the Drinks Today state."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.last_update_success = True
+    coordinator.suppressed_writes = 0
+    coordinator.catalog = None
+    coordinator._activity_cache = {}
+    coordinator.data = {"summary": ()}
+    coordinator.polling.interval = timedelta(minutes=15)
+
+    description = SensorEntityDescription(key="drinks_today", name="Drinks Today", icon="mdi:glass-cocktail")
+    sensor = DrinkAwareSensor(coordinator, description)
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        coordinator.polling.interval = timedelta(hours=1)
+        sensor._handle_coordinator_update()
+
+    assert mock_write.call_count == 1
+    assert coordinator.suppressed_writes == 1
+
+
+def test_fingerprint_follows_inputs_not_attributes():
+    """Test that attributes are only rebuilt when the data they read changes."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.last_update_success = True
+    coordinator.suppressed_writes = 0
+    coordinator.catalog = None
+    coordinator._activity_cache = {}
+    coordinator.data = {"summary": ()}
+
+    description = SensorEntityDescription(key="drinks_today", name="Drinks Today", icon="mdi:glass-cocktail")
+    sensor = DrinkAwareSensor(coordinator, description)
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write, patch.object(
+        sensor, "_update_attributes", wraps=sensor._update_attributes
+    ) as mock_update:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert mock_update.call_count == 1
+
+        # New activity for today changes the attributes without changing the summary
+        today = datetime.now().strftime("%Y-%m-%d")
+        coordinator._activity_cache[today] = {"activity": []}
+        sensor._handle_coordinator_update()
+
+    assert mock_write.call_count == 2
+    assert mock_update.call_count == 2
+    assert coordinator.suppressed_writes == 1
+
+
+def test_polling_interval_sensor():
+    """Test that the polling interval has its own disabled diagnostic sensor, written only when it changes."""
+    coordinator = MagicMock()
+    coordinator.account_name = "Test Account"
+    coordinator.entry_id = "test_entry_id"
+    coordinator.suppressed_writes = 0
+    coordinator.polling.interval = timedelta(minutes=15)
+
+    sensor = DrinkAwarePollingIntervalSensor(coordinator, POLLING_INTERVAL_DESCRIPTION)
+    assert sensor.unique_id == "drinkaware_test_entry_id_polling_interval"
+    assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+    assert sensor.entity_registry_enabled_default is False
+    assert sensor.native_value == 15
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        coordinator.polling.interval = timedelta(hours=1)
+        sensor._handle_coordinator_update()
+
+    assert mock_write.call_count == 2
+    assert sensor.native_value == 60
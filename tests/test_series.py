@@ -0,0 +1,28 @@
+"""Test the Drinkaware date-indexed day series."""
+from custom_components.drinkaware.series import DaySeries
+
+
+def test_range_is_inclusive_and_sorted():
+    """Test that range queries return the dates between two dates, oldest first."""
+    series = DaySeries(["2025-04-20", "2025-04-18", "2025-04-19", "2025-04-18"])
+
+    assert list(series) == ["2025-04-18", "2025-04-19", "2025-04-20"]
+    assert series.range("2025-04-19", "2025-04-20") == ["2025-04-19", "2025-04-20"]
+    assert series.range("2025-04-19", "2025-04-19") == ["2025-04-19"]
+    assert series.range(end="2025-04-18") == ["2025-04-18"]
+    assert series.range("2025-04-21") == []
+    assert series.range("2025-04-01", "2025-04-17") == []
+
+
+def test_add_keeps_dates_sorted_and_unique():
+    """Test that added dates are placed in order, once."""
+    series = DaySeries()
+    for date_str in ("2025-04-20", "2025-04-21", "2025-03-01", "2025-04-20"):
+        series.add(date_str)
+
+    assert list(series) == ["2025-03-01", "2025-04-20", "2025-04-21"]
+    assert list(reversed(series)) == ["2025-04-21", "2025-04-20", "2025-03-01"]
+    assert series[0] == "2025-03-01"
+    assert len(series) == 3
+    assert "2025-04-20" in series
+    assert "2025-04-19" not in series
@@ -22,11 +22,14 @@ from custom_components.drinkaware.services import (
     set_drink_quantity,
     remove_drink_free_day,
     log_sleep_quality,
+    _remove_all_drinks_for_day,
 )
 from custom_components.drinkaware.drink_constants import (
     DRINK_ID_LAGER,
     MEASURE_ID_PINT,
 )
+from custom_components.drinkaware.models import DaySummary
+from custom_components.drinkaware.orchestrator import RequestOrchestrator
 
 
 @pytest.fixture
@@ -38,6 +41,7 @@ def mock_coordinator():
     coordinator.entry_id = "test_entry_id"
     coordinator.access_token = "test_access_token"
     coordinator.session = AsyncMock()
+    coordinator.orchestrator = RequestOrchestrator()
     
     # Mock response for session methods
     mock_response = AsyncMock()
@@ -52,14 +56,9 @@ def mock_coordinator():
     
     # Set up data structure
     coordinator.data = {
-        "summary": [
-            {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "drinks": 2,
-                "units": 4.0,
-                "drinkFreeDay": False
-            }
-        ]
+        "summary": (
+            DaySummary(datetime.now().strftime("%Y-%m-%d"), drinks=2, units=4.0, drink_free_day=False),
+        )
     }
     
     return coordinator
@@ -82,6 +81,16 @@ async def test_async_setup_services(hass, mock_coordinator):
     assert hass.services.has_service(DOMAIN, SERVICE_REFRESH)
 
 
+async def test_async_setup_services_skips_unchanged(hass, mock_coordinator):
+    """Test that setting up services again with the same options does not re-register them."""
+    hass.data[DOMAIN] = {"test_entry_id": mock_coordinator}
+    await async_setup_services(hass)
+
+    with patch("homeassistant.core.ServiceRegistry.async_register") as mock_register:
+        await async_setup_services(hass)
+        assert mock_register.call_count == 0
+
+
 async def test_async_unload_services(hass):
     """Test unloading services."""
     # First register services
@@ -301,6 +310,26 @@ async def test_refresh_service(hass, mock_coordinator):
         assert mock_coordinator.async_refresh.call_count == 1
 
 
+async def test_service_requests_take_their_own_slots(mock_coordinator):
+    """Test that each service request takes an interactive slot, and waits between them hold none."""
+    activity = {"activity": [{"drinkId": DRINK_ID_LAGER, "measureId": MEASURE_ID_PINT, "name": "Lager"}]}
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.json = AsyncMock(side_effect=[activity, {"activity": []}])
+    mock_coordinator.session = MagicMock()
+    mock_coordinator.session.get.return_value.__aenter__.return_value = mock_response
+    mock_coordinator.session.delete.return_value.__aenter__.return_value = mock_response
+    orchestrator = mock_coordinator.orchestrator
+    in_flight = []
+
+    with patch("asyncio.sleep", side_effect=lambda seconds: in_flight.append(orchestrator.in_flight)):
+        await _remove_all_drinks_for_day(mock_coordinator, "2025-04-18")
+
+    assert in_flight == [0, 0]
+    metrics = orchestrator.as_dict()["accounts"]["test_entry_id"]
+    assert metrics["requests"] == metrics["interactive_requests"] == 3
+
+
 async def test_add_drink_function(mock_coordinator):
     """Test the add_drink function."""
     # Call the function
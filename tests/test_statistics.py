@@ -0,0 +1,88 @@
+"""Test the Drinkaware long-term statistics import."""
+from dataclasses import replace
+from unittest.mock import patch
+import pytest
+
+from custom_components.drinkaware.const import (
+    STATISTIC_DAILY_UNITS,
+    STATISTIC_DAILY_DRINKS,
+    STATISTIC_DRINK_FREE_DAY,
+)
+from custom_components.drinkaware.models import DaySummary
+from custom_components.drinkaware.statistics import DrinkAwareStatistics, get_statistic_id
+
+
+SUMMARY_DAYS = [
+    DaySummary("2025-04-20", drinks=2, units=4.5, drink_free_day=False),
+    DaySummary("2025-04-19", drinks=1, units=2.3, drink_free_day=False),
+    DaySummary("2025-04-18"),
+]
+
+
+@pytest.fixture
+def statistics(hass):
+    """Create a statistics importer with the recorder marked as loaded."""
+    hass.config.components.add("recorder")
+    return DrinkAwareStatistics(hass, "test_entry_id", "Test Account")
+
+
+def test_statistic_id():
+    """Test statistic IDs are derived from the config entry ID."""
+    assert get_statistic_id("01JABCDEF", STATISTIC_DAILY_UNITS) == "drinkaware:01jabcdef_daily_units"
+
+
+async def test_accounts_with_the_same_name_are_kept_apart(hass):
+    """Test that two entries with the same account name write to different statistics."""
+    hass.config.components.add("recorder")
+    first = DrinkAwareStatistics(hass, "first_entry_id", "Default")
+    second = DrinkAwareStatistics(hass, "second_entry_id", "Default")
+
+    with patch("custom_components.drinkaware.statistics.async_add_external_statistics") as mock_add:
+        first.async_import_days(SUMMARY_DAYS)
+        second.async_import_days(SUMMARY_DAYS)
+
+    statistic_ids = [call.args[1]["statistic_id"] for call in mock_add.call_args_list]
+    assert len(statistic_ids) == len(set(statistic_ids)) == 6
+    assert get_statistic_id("first_entry_id", STATISTIC_DAILY_UNITS) in statistic_ids
+    assert get_statistic_id("second_entry_id", STATISTIC_DAILY_UNITS) in statistic_ids
+
+
+async def test_import_days_batches_per_statistic(statistics):
+    """Test that each statistic is written once with every changed day."""
+    with patch("custom_components.drinkaware.statistics.async_add_external_statistics") as mock_add:
+        assert statistics.async_import_days(SUMMARY_DAYS) == 3
+
+    assert mock_add.call_count == 3
+    written = {call.args[1]["statistic_id"]: call.args[2] for call in mock_add.call_args_list}
+    units = written[get_statistic_id("test_entry_id", STATISTIC_DAILY_UNITS)]
+    drinks = written[get_statistic_id("test_entry_id", STATISTIC_DAILY_DRINKS)]
+    drink_free = written[get_statistic_id("test_entry_id", STATISTIC_DRINK_FREE_DAY)]
+
+    # Days are written oldest first
+    assert [stat["mean"] for stat in units] == [0.0, 2.3, 4.5]
+    assert [stat["mean"] for stat in drinks] == [0.0, 1.0, 2.0]
+    assert [stat["mean"] for stat in drink_free] == [1.0, 0.0, 0.0]
+
+
+async def test_import_days_only_writes_changed_days(statistics):
+    """Test that unchanged days are not written again."""
+    with patch("custom_components.drinkaware.statistics.async_add_external_statistics") as mock_add:
+        statistics.async_import_days(SUMMARY_DAYS)
+        mock_add.reset_mock()
+
+        # Nothing changed
+        assert statistics.async_import_days(SUMMARY_DAYS) == 0
+        assert mock_add.call_count == 0
+
+        # One day changed
+        updated = [replace(SUMMARY_DAYS[0], drinks=3, units=6.0)] + SUMMARY_DAYS[1:]
+        assert statistics.async_import_days(updated) == 1
+        assert all(len(call.args[2]) == 1 for call in mock_add.call_args_list)
+
+
+async def test_import_days_without_recorder(hass):
+    """Test that nothing is written when the recorder is not loaded."""
+    statistics = DrinkAwareStatistics(hass, "test_entry_id", "Test Account")
+    with patch("custom_components.drinkaware.statistics.async_add_external_statistics") as mock_add:
+        assert statistics.async_import_days(SUMMARY_DAYS) == 0
+    assert mock_add.call_count == 0
@@ -0,0 +1,74 @@
+"""Test the Drinkaware request tracing."""
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from custom_components.drinkaware.tracing import RequestTracer
+from tests.mock_api import MockDrinkawareApi
+
+
+async def test_requests_are_traced(hass, socket_enabled):
+    """Test that traces record connection reuse and response timings."""
+    api = MockDrinkawareApi()
+    await api.start()
+    tracer = RequestTracer(size=2)
+    session = async_create_clientsession(hass, trace_configs=[tracer.trace_config()])
+    headers = {"Authorization": "Bearer token"}
+
+    try:
+        for date in ("2025-04-21", "2025-04-22", "2025-04-23"):
+            async with session.get(f"{api.base_url}/tracking/v1/activity/{date}", headers=headers) as resp:
+                await resp.json()
+    finally:
+        await api.stop()
+
+    # Only the most recent traces are kept, and the pooled connection is reused
+    traces = tracer.as_dict()["traces"]
+    assert len(traces) == 2
+    for trace in traces:
+        assert trace["method"] == "GET"
+        assert trace["endpoint"] == "/tracking/v1/activity/{date}"
+        assert trace["status"] == 200
+        assert trace["connection"] == "reused"
+        assert trace["connect_ms"] is None
+        assert trace["ttfb_ms"] <= trace["total_ms"]
+
+    assert tracer.as_dict(limit=1)["traces"] == traces[-1:]
+
+
+async def test_failed_requests_are_traced(hass, socket_enabled):
+    """Test that a request that never gets a response is still traced."""
+    api = MockDrinkawareApi()
+    await api.start()
+    url = f"{api.base_url}/tracking/v1/stats"
+    await api.stop()
+
+    tracer = RequestTracer()
+    session = async_create_clientsession(hass, trace_configs=[tracer.trace_config()])
+    try:
+        await session.get(url)
+    except Exception:
+        pass
+
+    trace = tracer.as_dict()["traces"][0]
+    assert trace["status"] is None
+    assert trace["error"] == "ClientConnectorError"
+    assert trace["total_ms"] is not None
+
+
+async def test_websocket_traces(hass, hass_ws_client, setup_integration):
+    """Test reading traces over the websocket API."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json({"id": 1, "type": "drinkaware/traces", "entry_id": "test_entry_id"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"enabled": False, "traces": []}
+
+    setup_integration.tracer = RequestTracer()
+    await client.send_json({"id": 2, "type": "drinkaware/traces", "entry_id": "test_entry_id", "limit": 5})
+    response = await client.receive_json()
+    assert response["result"] == {"enabled": True, "buffer_size": 100, "traces": []}
+
+    await client.send_json({"id": 3, "type": "drinkaware/traces", "entry_id": "unknown"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
@@ -0,0 +1,90 @@
+"""Test the Drinkaware websocket summary subscription."""
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.drinkaware.websocket import summary_delta, summary_payload
+
+
+def _days(today, *values):
+    """Return history rows for the days up to today, oldest first."""
+    return [
+        {"date": (today - timedelta(days=len(values) - 1 - index)).isoformat(), **value}
+        for index, value in enumerate(values)
+    ]
+
+
+def test_summary_payload():
+    """Test that the payload holds the daily series and today's drinks."""
+    today = dt_util.now().date()
+    coordinator = MagicMock()
+    coordinator.history.async_get_days.return_value = _days(
+        today, {"units": 0, "drinks": 0, "drinkFreeDay": True}, {"units": 2.3, "drinks": 1, "drinkFreeDay": False}
+    )
+    coordinator._activity_cache = {
+        today.isoformat(): {"activity": [{"drinkId": "drink-1", "measureId": "measure-1", "name": "Lager", "quantity": 1}]}
+    }
+
+    payload = summary_payload(coordinator, days=7)
+
+    coordinator.history.async_get_days.assert_called_once_with(
+        (today - timedelta(days=6)).isoformat(), today.isoformat()
+    )
+    assert payload["date"] == today.isoformat()
+    assert payload["days"][today.isoformat()] == {"units": 2.3, "drinks": 1, "drink_free": False}
+    assert payload["today"] == [
+        {"drink_id": "drink-1", "measure_id": "measure-1", "name": "Lager", "quantity": 1, "units": None}
+    ]
+
+
+def test_summary_delta():
+    """Test that only changed days, dropped days and changed drinks are sent."""
+    previous = {
+        "date": "2025-04-20",
+        "days": {"2025-04-19": {"units": 0}, "2025-04-20": {"units": 2.3}},
+        "today": [],
+    }
+    assert summary_delta(previous, previous) is None
+
+    current = {
+        "date": "2025-04-21",
+        "days": {"2025-04-20": {"units": 2.3}, "2025-04-21": {"units": 4.5}},
+        "today": [{"drink_id": "drink-1"}],
+    }
+    assert summary_delta(previous, current) == {
+        "date": "2025-04-21",
+        "days": {"2025-04-21": {"units": 4.5}},
+        "removed": ["2025-04-19"],
+        "today": [{"drink_id": "drink-1"}],
+    }
+
+
+async def test_subscribe_summary(hass, hass_ws_client, setup_integration):
+    """Test that subscribers get the full summary, then only what changes."""
+    today = dt_util.now().date().isoformat()
+    coordinator = setup_integration
+    coordinator.history.async_get_days = MagicMock(
+        return_value=[{"date": today, "units": 0, "drinks": 0, "drinkFreeDay": True}]
+    )
+    client = await hass_ws_client(hass)
+
+    await client.send_json({"id": 1, "type": "drinkaware/subscribe_summary", "entry_id": "test_entry_id"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"]["days"] == {today: {"units": 0, "drinks": 0, "drink_free": True}}
+
+    # A coordinator update with a new drink sends just today's changes
+    coordinator.history.async_get_days.return_value = [
+        {"date": today, "units": 2.3, "drinks": 1, "drinkFreeDay": False}
+    ]
+    listener = coordinator.async_add_listener.call_args.args[0]
+    listener()
+    response = await client.receive_json()
+    assert response["event"] == {"days": {today: {"units": 2.3, "drinks": 1, "drink_free": False}}}
+
+    await client.send_json({"id": 2, "type": "drinkaware/subscribe_summary", "entry_id": "unknown"})
+    response = await client.receive_json()
+    assert response["error"]["code"] == "not_found"